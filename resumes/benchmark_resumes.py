@@ -0,0 +1,349 @@
+"""
+Benchmark suite for the resume generation pipeline.
+
+For every variant this times the pipeline's phases separately — fit solve,
+story construction, doc.build and the desktop-style file copy — and records
+peak traced memory and output size. The workload can be scaled synthetically
+(10x, 100x, ...) by cloning the variants with unique filenames and summaries,
+so the shared blocks stay shared but each clone still parses its own text.
+
+Timings are the median over --repeat runs; memory comes from a separate
+tracemalloc pass (over at most MEMORY_SAMPLE evenly spaced variants, since
+tracing is slow) because tracing skews timings. Results can be written as
+JSON and compared against an earlier run: totals for every scale and
+per-variant metrics for the real (1x) variants that grew by more than
+--threshold are flagged as regressions and the exit code is 1.
+
+--cache-report instead compares the style/markup caches cleared before every
+variant ("cold", the pre-cache behaviour) with caches kept per batch.
+
+Usage:
+  python resumes/benchmark_resumes.py
+  python resumes/benchmark_resumes.py --scales 1 10 100 --output bench.json
+  python resumes/benchmark_resumes.py --compare bench.json --threshold 0.15
+  python resumes/benchmark_resumes.py --cache-report
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import generate_resumes
+
+PHASES = ("fit_ms", "story_ms", "build_ms", "copy_ms")
+MEMORY_SAMPLE = 50
+# Per-variant timing changes smaller than this are treated as noise; totals
+# scale the floor by the number of variants.
+MIN_DELTA_MS = 0.5
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+def scaled_variants(variants, factor):
+    """``factor`` copies of ``variants``; clones get unique filenames and summaries."""
+    if factor == 1:
+        return list(variants)
+    clones = []
+    for copy in range(factor):
+        for variant in variants:
+            clone = dict(variant)
+            stem = Path(variant["filename"]).stem
+            clone["filename"] = f"{stem}_x{copy:03d}.pdf"
+            clone["summary"] = f"{variant['summary']} (variant {copy})"
+            clones.append(clone)
+    return clones
+
+
+def render_timed(variant, output_dir, copy_dir):
+    """Render one variant phase by phase; returns (timings in ms, output bytes)."""
+    started = time.perf_counter()
+    layout = generate_resumes.solve_fit(variant)
+    solved = time.perf_counter()
+    story = generate_resumes.build_story(variant, generate_resumes.build_styles(layout["scale"]))
+    built_story = time.perf_counter()
+    output_path = os.path.join(output_dir, variant["filename"])
+    generate_resumes.render_story(generate_resumes.make_doc(variant, output_path, layout), story)
+    built = time.perf_counter()
+    shutil.copy2(output_path, os.path.join(copy_dir, variant["filename"]))
+    copied = time.perf_counter()
+    timings = {
+        "fit_ms": (solved - started) * 1000,
+        "story_ms": (built_story - solved) * 1000,
+        "build_ms": (built - built_story) * 1000,
+        "copy_ms": (copied - built) * 1000,
+    }
+    return timings, os.path.getsize(output_path)
+
+
+def run_scale(variants, repeat):
+    """
+    Benchmark one workload. Returns {"variants": [...], "totals": {...}} where
+    each variant record holds median phase timings, peak KiB (None when the
+    variant was outside the memory sample) and bytes.
+    """
+    samples = {variant["filename"]: {phase: [] for phase in PHASES} for variant in variants}
+    sizes = {}
+    peaks = {}
+    with tempfile.TemporaryDirectory() as output_dir, tempfile.TemporaryDirectory() as copy_dir:
+        for _ in range(repeat):
+            generate_resumes.clear_render_caches()
+            for variant in variants:
+                timings, size = render_timed(variant, output_dir, copy_dir)
+                for phase, value in timings.items():
+                    samples[variant["filename"]][phase].append(value)
+                sizes[variant["filename"]] = size
+
+        step = max(1, len(variants) // MEMORY_SAMPLE)
+        generate_resumes.clear_render_caches()
+        tracemalloc.start()
+        try:
+            for variant in variants[::step]:
+                tracemalloc.reset_peak()
+                render_timed(variant, output_dir, copy_dir)
+                peaks[variant["filename"]] = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    records = []
+    for variant in variants:
+        name = variant["filename"]
+        record = {"filename": name}
+        for phase in PHASES:
+            record[phase] = round(statistics.median(samples[name][phase]), 3)
+        record["total_ms"] = round(sum(record[phase] for phase in PHASES), 3)
+        record["peak_kib"] = round(peaks[name], 1) if name in peaks else None
+        record["bytes"] = sizes[name]
+        records.append(record)
+
+    totals = {"count": len(records)}
+    for key in PHASES + ("total_ms",):
+        totals[key] = round(sum(r[key] for r in records), 3)
+    totals["mean_ms"] = round(totals["total_ms"] / len(records), 3)
+    totals["peak_kib"] = max(r["peak_kib"] for r in records if r["peak_kib"] is not None)
+    totals["bytes"] = sum(r["bytes"] for r in records)
+    return {"variants": records, "totals": totals}
+
+
+# ---------------------------------------------------------------------------
+# Compare
+# ---------------------------------------------------------------------------
+
+def find_regressions(baseline, current, threshold):
+    """Metrics in ``current`` more than ``threshold`` (fraction) above ``baseline``."""
+    regressions = []
+
+    def check(label, old, new, count=1):
+        for key, new_value in new.items():
+            old_value = old.get(key)
+            if key in ("filename", "count") or not isinstance(old_value, (int, float)) or new_value is None:
+                continue
+            if key.endswith("_ms") and new_value - old_value < MIN_DELTA_MS * count:
+                continue
+            if new_value > old_value * (1 + threshold):
+                change = (new_value / old_value - 1) if old_value else float("inf")
+                regressions.append(f"{label} {key}: {old_value} -> {new_value} (+{change:.0%})")
+
+    for scale, run in current["runs"].items():
+        old_run = baseline.get("runs", {}).get(scale)
+        if not old_run:
+            continue
+        check(f"{scale} totals", old_run["totals"], run["totals"], count=run["totals"]["count"])
+        if scale != "1x":
+            continue  # synthetic clones are only meaningful in aggregate
+        old_variants = {r["filename"]: r for r in old_run["variants"]}
+        for record in run["variants"]:
+            if record["filename"] in old_variants:
+                check(f"{scale} {record['filename']}", old_variants[record["filename"]], record)
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# Cache report
+# ---------------------------------------------------------------------------
+
+class ParseCounter:
+    """
+    Wraps ParaParser.parse to count calls and accumulate their time and, when
+    tracemalloc is tracing, the peak bytes each call allocated.
+    """
+
+    def __init__(self):
+        from reportlab.platypus.paraparser import ParaParser
+
+        self.calls = 0
+        self.seconds = 0.0
+        self.allocated = 0
+        self._cls = ParaParser
+        self._original = ParaParser.parse
+
+    def __enter__(self):
+        counter = self
+        original = self._original
+
+        def parse(parser, text, style):
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+            started = time.perf_counter()
+            try:
+                return original(parser, text, style)
+            finally:
+                counter.calls += 1
+                counter.seconds += time.perf_counter() - started
+                if tracing:
+                    counter.allocated += tracemalloc.get_traced_memory()[1] - before
+
+        self._cls.parse = parse
+        return self
+
+    def __exit__(self, *exc):
+        self._cls.parse = self._original
+
+
+def render_batch(variants, output_dir, cold):
+    generate_resumes.clear_render_caches()
+    for variant in variants:
+        if cold:
+            generate_resumes.clear_render_caches()
+        generate_resumes.build_resume(variant, output_dir)
+
+
+def run_batches(variants, output_dir, repeat, cold):
+    """Render ``repeat`` full batches; returns (seconds, parse calls, parse seconds) per batch."""
+    with ParseCounter() as counter:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            render_batch(variants, output_dir, cold)
+        elapsed = time.perf_counter() - started
+    return elapsed / repeat, counter.calls // repeat, counter.seconds / repeat
+
+
+def measure_allocations(variants, output_dir, cold):
+    """Traced batches: (KiB allocated inside the parser, peak KiB for a batch)."""
+    tracemalloc.start()
+    try:
+        with ParseCounter() as counter:
+            render_batch(variants, output_dir, cold)
+        # The counter resets the peak around each parse, so the batch peak
+        # comes from a second, uninstrumented traced run.
+        tracemalloc.reset_peak()
+        render_batch(variants, output_dir, cold)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return counter.allocated / 1024, peak / 1024
+
+
+def cache_report(variants, repeat):
+    print(f"=== {len(variants)} variants x {repeat} batch(es) ===")
+    with tempfile.TemporaryDirectory() as output_dir:
+        # Warm imports and font metrics so neither mode pays first-use costs.
+        run_batches(variants, output_dir, 1, cold=True)
+
+        rows = {}
+        for mode in ("cold", "cached"):
+            cold = mode == "cold"
+            seconds, calls, parse_seconds = run_batches(variants, output_dir, repeat, cold)
+            parser_kib, peak_kib = measure_allocations(variants, output_dir, cold)
+            rows[mode] = (seconds, calls, parse_seconds, parser_kib, peak_kib)
+
+    print(f"{'mode':<8} {'batch ms':>10} {'parses':>8} {'parse ms':>10} {'parser KiB':>11} {'peak KiB':>10}")
+    for mode, (seconds, calls, parse_seconds, parser_kib, peak_kib) in rows.items():
+        print(f"{mode:<8} {seconds * 1000:>10.1f} {calls:>8} {parse_seconds * 1000:>10.1f} "
+              f"{parser_kib:>11.1f} {peak_kib:>10.1f}")
+
+    cold, cached = rows["cold"], rows["cached"]
+    print("")
+    print(f"Parser calls:  {cold[1]} -> {cached[1]} ({1 - cached[1] / cold[1]:.0%} fewer)")
+    print(f"Parse time:    {cold[2] * 1000:.1f} ms -> {cached[2] * 1000:.1f} ms per batch")
+    print(f"Parser allocs: {cold[3]:.0f} KiB -> {cached[3]:.0f} KiB per batch")
+    print(f"Batch time:    {cold[0] * 1000:.1f} ms -> {cached[0] * 1000:.1f} ms")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def print_run(scale, run, per_variant):
+    totals = run["totals"]
+    print(f"=== {scale}: {totals['count']} variant(s) ===")
+    header = f"{'variant':<58} {'fit':>7} {'story':>7} {'build':>7} {'copy':>7} {'total':>8} {'peak KiB':>9} {'bytes':>8}"
+    if per_variant:
+        print(header)
+        for r in run["variants"]:
+            peak = "-" if r["peak_kib"] is None else f"{r['peak_kib']:.1f}"
+            print(f"{r['filename']:<58} {r['fit_ms']:>7.2f} {r['story_ms']:>7.2f} {r['build_ms']:>7.2f} "
+                  f"{r['copy_ms']:>7.2f} {r['total_ms']:>8.2f} {peak:>9} {r['bytes']:>8}")
+    print(f"  total {totals['total_ms']:.1f} ms (fit {totals['fit_ms']:.1f}, story {totals['story_ms']:.1f}, "
+          f"build {totals['build_ms']:.1f}, copy {totals['copy_ms']:.1f}); "
+          f"{totals['mean_ms']:.2f} ms/variant; peak {totals['peak_kib']:.0f} KiB; {totals['bytes']} bytes\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume generation pipeline.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="Workload multipliers (default: 1 10).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per workload; timings are medians (default: 3).")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON from an earlier --output run.")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Allowed growth as a fraction before a metric is a regression (default: 0.20).")
+    parser.add_argument("--cache-report", action="store_true", help="Compare cold vs cached render caches instead.")
+    args = parser.parse_args(argv)
+
+    variants = generate_resumes.RESUME_VARIANTS
+    if args.cache_report:
+        return cache_report(variants, args.repeat)
+
+    import reportlab
+
+    with tempfile.TemporaryDirectory() as warm_dir:
+        # Warm imports and font metrics so the first variant is not penalised.
+        generate_resumes.build_resume(variants[0], warm_dir)
+
+    results = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "reportlab": reportlab.Version,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "runs": {},
+    }
+    for factor in args.scales:
+        scale = f"{factor}x"
+        run = run_scale(scaled_variants(variants, factor), args.repeat)
+        results["runs"][scale] = run
+        print_run(scale, run, per_variant=factor == 1)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = find_regressions(baseline, results, args.threshold)
+        if regressions:
+            print(f"REGRESSIONS vs {args.compare} (threshold {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"OK: no metric regressed more than {args.threshold:.0%} vs {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
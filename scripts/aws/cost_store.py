@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Incremental AWS cost store for the cost-guardrails pipeline.
+
+Daily Cost Explorer results (UnblendedCost, Credit/Refund excluded, grouped
+by SERVICE and the Project tag) are kept in a small SQLite file keyed by
+(day, service, project), so re-ingesting a day replaces it instead of
+double-counting it. A ``days`` table records which days are stored and
+whether Cost Explorer still marked them as estimated:
+
+  - --fetch only queries the days that are missing or still estimated, one
+    request per contiguous gap, instead of re-querying from the first of the
+    month on every run.
+  - --ingest loads recorded ``aws ce get-cost-and-usage`` JSON (one response,
+    or a list of pages; for fixtures or offline backfills) through the same
+    code path.
+
+Queries (month-to-date total, top-N services/projects, day-over-day deltas)
+are range lookups on the day-ordered primary key, so they read only the days
+asked about, never the whole history.
+
+Usage:
+  python3 scripts/aws/cost_store.py --fetch --region us-east-1 --summary
+  python3 scripts/aws/cost_store.py --ingest recorded-ce.json --summary --as-of 2026-02-25
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+REPORT_DIR = ROOT / "reports" / "aws-cost"
+DB_PATH = REPORT_DIR / "cost-store.sqlite"
+
+COST_FILTER = {"Not": {"Dimensions": {"Key": "RECORD_TYPE", "Values": ["Credit", "Refund"]}}}
+UNTAGGED = "untagged"
+MICROS = 1_000_000  # amounts are stored as integer micro-dollars
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS costs (
+    day TEXT NOT NULL,
+    service TEXT NOT NULL,
+    project TEXT NOT NULL,
+    amount_micros INTEGER NOT NULL,
+    PRIMARY KEY (day, service, project)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS days (
+    day TEXT PRIMARY KEY,
+    estimated INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+def connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def to_micros(amount: str) -> int:
+    return int((Decimal(amount) * MICROS).to_integral_value())
+
+
+def usd(micros: int) -> float:
+    return round(micros / MICROS, 2)
+
+
+def parse_project(key: str) -> str:
+    """``Project$portfolio`` -> ``portfolio``; an empty tag value is ``untagged``."""
+    value = key.split("$", 1)[1] if "$" in key else key
+    return value or UNTAGGED
+
+
+def ingest_response(conn: sqlite3.Connection, response: dict) -> list[str]:
+    """
+    Store one ``get-cost-and-usage`` response (DAILY, grouped by SERVICE and
+    TAG Project). Each day in it replaces whatever was stored for that day.
+    Returns the days ingested.
+    """
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    ingested = []
+    with conn:
+        for period in response.get("ResultsByTime", []):
+            day = period["TimePeriod"]["Start"]
+            rows: dict[tuple[str, str], int] = {}
+            for group in period.get("Groups", []):
+                keys = group.get("Keys", [])
+                service = keys[0] if keys else "Unknown"
+                project = parse_project(keys[1]) if len(keys) > 1 else UNTAGGED
+                amount = to_micros(group["Metrics"]["UnblendedCost"]["Amount"])
+                rows[(service, project)] = rows.get((service, project), 0) + amount
+            conn.execute("DELETE FROM costs WHERE day = ?", (day,))
+            conn.executemany(
+                "INSERT INTO costs (day, service, project, amount_micros) VALUES (?, ?, ?, ?)",
+                [(day, service, project, amount) for (service, project), amount in rows.items() if amount],
+            )
+            conn.execute(
+                "INSERT INTO days (day, estimated, ingested_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (day) DO UPDATE SET estimated = excluded.estimated, ingested_at = excluded.ingested_at",
+                (day, int(bool(period.get("Estimated"))), now),
+            )
+            ingested.append(day)
+    return ingested
+
+
+def missing_ranges(conn: sqlite3.Connection, start: date, end: date) -> list[tuple[date, date]]:
+    """Contiguous [start, end] ranges of days that are not stored or still estimated."""
+    final = {row[0] for row in conn.execute(
+        "SELECT day FROM days WHERE day BETWEEN ? AND ? AND estimated = 0", (start.isoformat(), end.isoformat()))}
+    ranges: list[tuple[date, date]] = []
+    day = start
+    while day <= end:
+        if day.isoformat() not in final:
+            if ranges and ranges[-1][1] == day - timedelta(days=1):
+                ranges[-1] = (ranges[-1][0], day)
+            else:
+                ranges.append((day, day))
+        day += timedelta(days=1)
+    return ranges
+
+
+# ---------------------------------------------------------------------------
+# Cost Explorer
+# ---------------------------------------------------------------------------
+
+def fetch_range(start: date, end: date, region: str) -> list[dict]:
+    """All pages of a DAILY SERVICE x Project query for [start, end] via the aws CLI."""
+    if shutil.which("aws") is None:
+        raise RuntimeError("Required command not found: aws")
+    args = [
+        "aws", "ce", "get-cost-and-usage",
+        "--region", region,
+        "--time-period", f"Start={start.isoformat()},End={(end + timedelta(days=1)).isoformat()}",
+        "--granularity", "DAILY",
+        "--metrics", "UnblendedCost",
+        "--filter", json.dumps(COST_FILTER),
+        "--group-by", "Type=DIMENSION,Key=SERVICE", "Type=TAG,Key=Project",
+        "--output", "json",
+    ]
+    pages = []
+    token = None
+    while True:
+        result = subprocess.run(args + (["--next-page-token", token] if token else []),
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"aws ce get-cost-and-usage failed: {result.stderr.strip()}")
+        page = json.loads(result.stdout)
+        pages.append(page)
+        token = page.get("NextPageToken")
+        if not token:
+            return pages
+
+
+def merge_pages(pages: list[dict]) -> dict:
+    """One response with each day's groups gathered from every page (a day can span pages)."""
+    periods: dict[str, dict] = {}
+    for page in pages:
+        for period in page.get("ResultsByTime", []):
+            day = period["TimePeriod"]["Start"]
+            merged = periods.setdefault(day, {"TimePeriod": period["TimePeriod"], "Groups": [], "Estimated": False})
+            merged["Groups"] += period.get("Groups", [])
+            merged["Estimated"] = merged["Estimated"] or bool(period.get("Estimated"))
+    return {"ResultsByTime": list(periods.values())}
+
+
+def fetch_missing(conn: sqlite3.Connection, start: date, end: date, region: str) -> list[str]:
+    ingested = []
+    for range_start, range_end in missing_ranges(conn, start, end):
+        print(f"  Fetching {range_start} .. {range_end}")
+        ingested += ingest_response(conn, merge_pages(fetch_range(range_start, range_end, region)))
+    return ingested
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def total(conn: sqlite3.Connection, start: date, end: date) -> int:
+    row = conn.execute("SELECT COALESCE(SUM(amount_micros), 0) FROM costs WHERE day BETWEEN ? AND ?",
+                       (start.isoformat(), end.isoformat())).fetchone()
+    return row[0]
+
+
+def top(conn: sqlite3.Connection, column: str, start: date, end: date, limit: int | None = 10) -> list[tuple[str, int]]:
+    """Top ``column`` ("service" or "project") values by cost over [start, end]."""
+    if column not in ("service", "project"):
+        raise ValueError(column)
+    sql = (f"SELECT {column}, SUM(amount_micros) AS amount FROM costs WHERE day BETWEEN ? AND ? "
+           f"GROUP BY {column} ORDER BY amount DESC, {column}")
+    params: list = [start.isoformat(), end.isoformat()]
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
+@dataclass
+class Delta:
+    service: str
+    previous: int
+    current: int
+
+    @property
+    def change(self) -> int:
+        return self.current - self.previous
+
+
+def day_over_day(conn: sqlite3.Connection, day: date) -> list[Delta]:
+    """Per-service change from the day before ``day``, largest absolute change first."""
+    rows = conn.execute(
+        "SELECT service, "
+        "SUM(CASE WHEN day = ? THEN amount_micros ELSE 0 END), "
+        "SUM(CASE WHEN day = ? THEN amount_micros ELSE 0 END) "
+        "FROM costs WHERE day BETWEEN ? AND ? GROUP BY service",
+        ((day - timedelta(days=1)).isoformat(), day.isoformat(),
+         (day - timedelta(days=1)).isoformat(), day.isoformat()),
+    ).fetchall()
+    deltas = [Delta(service, previous, current) for service, previous, current in rows]
+    return sorted(deltas, key=lambda d: (-abs(d.change), d.service))
+
+
+def latest_day(conn: sqlite3.Connection, as_of: date) -> date | None:
+    row = conn.execute("SELECT MAX(day) FROM days WHERE day <= ?", (as_of.isoformat(),)).fetchone()
+    return date.fromisoformat(row[0]) if row[0] else None
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+def export_latest(conn: sqlite3.Connection, as_of: date, out_dir: Path) -> None:
+    """Month-to-date latest-cost-by-{service,project-tag}.{csv,json}, as cost_export.ps1 writes them."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for column, stem in (("service", "latest-cost-by-service"), ("project", "latest-cost-by-project-tag")):
+        rows = [{column: name, "total_amount_usd": usd(amount)}
+                for name, amount in top(conn, column, month_start(as_of), as_of, limit=None)]
+        with open(out_dir / f"{stem}.csv", "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=[column, "total_amount_usd"], quoting=csv.QUOTE_ALL)
+            writer.writeheader()
+            writer.writerows(rows)
+        (out_dir / f"{stem}.json").write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+
+
+def summary_lines(conn: sqlite3.Connection, as_of: date, limit: int) -> list[str]:
+    """Markdown summary: month-to-date total, top services and the latest day-over-day change."""
+    start = month_start(as_of)
+    lines = [
+        "## Estimated Cost Impact",
+        "",
+        f"Month-to-date unblended cost ({start} .. {as_of}): **${usd(total(conn, start, as_of)):.2f} USD**.",
+        "",
+        "| Service | Amount (USD) |",
+        "| --- | ---: |",
+    ]
+    lines += [f"| {service} | {usd(amount):.2f} |" for service, amount in top(conn, "service", start, as_of, limit)]
+
+    projects = top(conn, "project", start, as_of, limit)
+    if projects:
+        lines += ["", "| Project tag | Amount (USD) |", "| --- | ---: |"]
+        lines += [f"| {project} | {usd(amount):.2f} |" for project, amount in projects]
+
+    day = latest_day(conn, as_of)
+    if day is not None:
+        deltas = day_over_day(conn, day)
+        previous = sum(d.previous for d in deltas)
+        current = sum(d.current for d in deltas)
+        lines += ["", f"Day over day ({day - timedelta(days=1)} -> {day}): "
+                      f"${usd(previous):.2f} -> ${usd(current):.2f} ({usd(current - previous):+.2f})."]
+        changed = [d for d in deltas if d.change]
+        if changed:
+            lines += ["", "| Service | Previous (USD) | Latest (USD) | Change (USD) |", "| --- | ---: | ---: | ---: |"]
+            lines += [f"| {d.service} | {usd(d.previous):.2f} | {usd(d.current):.2f} | {usd(d.change):+.2f} |"
+                      for d in changed[:limit]]
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    today = datetime.now(timezone.utc).date()
+    parser = argparse.ArgumentParser(description="Incrementally store and summarize daily AWS costs.")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="SQLite store (default: reports/aws-cost/cost-store.sqlite).")
+    parser.add_argument("--fetch", action="store_true", help="Fetch the days missing between --start and --end from Cost Explorer.")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First day to fetch (default: first of the month).")
+    parser.add_argument("--end", type=date.fromisoformat, default=today, help="Last day to fetch, inclusive (default: today).")
+    parser.add_argument("--region", default="us-east-1", help="Region for the Cost Explorer call (default: us-east-1).")
+    parser.add_argument("--ingest", type=Path, action="append", default=[], metavar="FILE",
+                        help="Ingest a recorded get-cost-and-usage JSON response; may be repeated.")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="Report date (default: --end).")
+    parser.add_argument("--top", type=int, default=10, help="Rows in the top-N tables (default: 10).")
+    parser.add_argument("--summary", action="store_true", help="Print a markdown summary (and append it to $GITHUB_STEP_SUMMARY).")
+    parser.add_argument("--export-dir", type=Path, default=None,
+                        help="Also write month-to-date latest-cost-by-*.csv/json into this directory.")
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    try:
+        for path in args.ingest:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            days = ingest_response(conn, merge_pages(data if isinstance(data, list) else [data]))
+            print(f"  Ingested {len(days)} day(s) from {path}")
+        if args.fetch:
+            start = args.start or month_start(args.end)
+            try:
+                days = fetch_missing(conn, start, args.end, args.region)
+            except RuntimeError as exc:
+                print(f"ERROR: {exc}", file=sys.stderr)
+                return 1
+            print(f"  Fetched {len(days)} day(s); {start} .. {args.end} is up to date")
+
+        as_of = args.as_of or args.end
+        if args.export_dir:
+            export_latest(conn, as_of, args.export_dir)
+        if args.summary:
+            lines = summary_lines(conn, as_of, args.top)
+            print("\n".join(lines))
+            summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
+            if summary_path:
+                with open(summary_path, "a", encoding="utf-8") as fh:
+                    fh.write("\n".join(lines) + "\n\n")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
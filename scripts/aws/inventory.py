@@ -0,0 +1,766 @@
+#!/usr/bin/env python3
+"""
+Concurrent AWS resource inventory with keep/delete/investigate dispositions.
+
+Python counterpart of inventory_export.ps1. The same resources are listed
+(ECS services, ALBs, EC2 instances, NAT gateways, RDS instances, ElastiCache
+replication groups, ECR repositories and project log groups), classified with
+the same owner/project/disposition rules, and written to the same
+inventory-<timestamp>.{json,csv} and latest-inventory.{json,csv} files.
+
+Unlike the PowerShell script, which spawns the aws CLI for every call in
+nested serial loops, this uses one boto3 client per service:
+
+  - every resource type is collected at once, and per-item follow-ups
+    (ECS list-services per cluster, describe-services in batches of 10, tag
+    lookups) are fanned out over a thread pool in rounds, so wall time does
+    not grow with the number of clusters;
+  - each AWS service gets at most --max-concurrency calls in flight;
+  - list calls go through boto3 paginators;
+  - throttling is retried with botocore's adaptive backoff.
+
+Each run is diffed against inventory-snapshot.json, which stores every
+resource's classified row keyed by type + ARN/ID along with a digest of its
+tags, state and other listed fields. Only added and changed resources are
+classified; unchanged ones reuse their stored row. Month-to-date cost
+estimates move daily, so they are kept out of the snapshot and the diff and
+queried once per run for every row. The diff is written as
+latest-inventory-diff.{json,md} (--summary prints the markdown and appends it
+to $GITHUB_STEP_SUMMARY). The snapshot is ignored when the classification
+rules change, or with --full.
+
+A failed call is reported as a warning and skipped, as in the PowerShell
+script. Resources whose listing or tag lookup failed are carried over from
+the snapshot rather than reported as removed or changed. --endpoint-url (or AWS_ENDPOINT_URL) points
+every client at a local stand-in such as moto_server.
+
+boto3 is an optional dependency of this repo: ``pip install boto3``.
+
+Usage:
+  python3 scripts/aws/inventory.py --region us-east-1 --summary --fail-on-unowned --fail-on-active-non-retail
+  python3 scripts/aws/inventory.py --endpoint-url http://127.0.0.1:5000
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+REPORT_DIR = ROOT / "reports" / "aws-cost"
+SNAPSHOT_NAME = "inventory-snapshot.json"
+SNAPSHOT_VERSION = 2
+CLASSIFIER_VERSION = 2  # bump when resolve_*() change, so snapshots are reclassified
+
+KEEP_PROJECTS = ("retail-forecast-dashboard",)
+PROJECT_PATTERNS = (
+    (re.compile("retail-forecast", re.IGNORECASE), "retail-forecast-dashboard"),
+    (re.compile("feature-flag", re.IGNORECASE), "feature-flag-platform"),
+    (re.compile("workflow|wf-orch|workflow-orc", re.IGNORECASE), "workflow-orchestrator"),
+    (re.compile("streaming-etl", re.IGNORECASE), "streaming-etl-pipeline"),
+)
+# PowerShell's -match is case-insensitive, so these are too.
+ACTIVE_STATE_RE = re.compile("running|ACTIVE|available|in-use|present|stopped|pending", re.IGNORECASE)
+PROJECT_LOG_GROUP_RE = re.compile("retail|feature-flag|workflow|wf-orch|streaming-etl", re.IGNORECASE)
+
+BILLING_SERVICES = {
+    "ecs": "Amazon Elastic Container Service",
+    "alb": "Amazon Elastic Load Balancing",
+    "ec2": "Amazon Elastic Compute Cloud - Compute",
+    "nat": "Amazon Virtual Private Cloud",
+    "rds": "Amazon Relational Database Service",
+    "elasticache": "Amazon ElastiCache",
+    "ecr": "Amazon Elastic Container Registry (ECR)",
+    "logs": "AmazonCloudWatch",
+}
+COST_FILTER = {"Not": {"Dimensions": {"Key": "RECORD_TYPE", "Values": ["Credit", "Refund"]}}}
+
+DEFAULT_MAX_CONCURRENCY = 4  # calls in flight per AWS service
+MAX_ATTEMPTS = 10  # botocore adaptive retry attempts (throttling backoff)
+ECS_DESCRIBE_BATCH = 10
+ELB_TAG_BATCH = 20
+DIFF_TABLE_LIMIT = 50  # rows per change table in the markdown summary
+
+# resource_type -> the AWS API it is listed through (see Collector.failed)
+RESOURCE_APIS = {"ecs": "ecs", "alb": "elbv2", "ec2": "ec2", "nat": "ec2", "rds": "rds",
+                 "elasticache": "elasticache", "ecr": "ecr", "logs": "logs"}
+
+
+# ---------------------------------------------------------------------------
+# Classification (mirrors inventory_export.ps1)
+# ---------------------------------------------------------------------------
+
+def tags_to_map(tags: list[dict] | None) -> dict[str, str]:
+    """[{Key, Value}] or [{key, value}] -> {key: value}."""
+    result = {}
+    for tag in tags or []:
+        key = tag.get("Key", tag.get("key"))
+        value = tag.get("Value", tag.get("value"))
+        if key is not None and value is not None:
+            result[key] = value
+    return result
+
+
+def tag_value(tags: dict[str, str], key: str) -> str:
+    """
+    Case-insensitive tag lookup. The PowerShell tag map is a hashtable, whose
+    keys ignore case, so "Owner", "owner" and "oWnEr" are one key there and
+    the last one listed wins.
+    """
+    value = ""
+    for name, tag in tags.items():
+        if name.lower() == key.lower():
+            value = tag
+    return value
+
+
+def resolve_owner(tags: dict[str, str]) -> str:
+    owner = tag_value(tags, "Owner")
+    return owner if owner.strip() else "unknown"
+
+
+def resolve_project(name: str | None, tags: dict[str, str]) -> str:
+    tagged = tag_value(tags, "Project")
+    if tagged.strip():
+        for pattern, project in PROJECT_PATTERNS:
+            if pattern.search(tagged.lower()):
+                return project
+        return tagged
+
+    for pattern, project in PROJECT_PATTERNS:
+        if pattern.search((name or "").lower()):
+            return project
+    return "unknown"
+
+
+def resolve_disposition(project: str, state: str) -> str:
+    if project in KEEP_PROJECTS:
+        return "keep"
+    if project == "unknown":
+        return "investigate"
+    return "delete"
+
+
+@dataclass
+class InventoryRow:
+    resource_id: str
+    resource_type: str
+    service: str
+    project: str
+    owner: str
+    disposition: str
+    state: str
+    region: str
+    arn: str
+    monthly_cost_estimate: float
+    notes: str
+
+
+def make_row(region: str, estimates: dict[str, float], resource_id: str, resource_type: str, state: str,
+             name: str = "", tags: dict[str, str] | None = None, arn: str = "", notes: str = "") -> InventoryRow:
+    tags = tags or {}  # None: the tag lookup failed
+    project = resolve_project(name, tags)
+    owner = resolve_owner(tags)
+    if owner == "unknown" and project != "unknown":
+        owner = "portfolio-default"
+    service = BILLING_SERVICES.get(resource_type, "Unknown")
+    return InventoryRow(
+        resource_id=resource_id,
+        resource_type=resource_type,
+        service=service,
+        project=project,
+        owner=owner,
+        disposition=resolve_disposition(project, state),
+        state=state,
+        region=region,
+        arn=arn,
+        monthly_cost_estimate=estimates.get(service, 0.0),
+        notes=notes,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Collection
+# ---------------------------------------------------------------------------
+
+def chunks(items: list, size: int) -> list[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class Collector:
+    """
+    boto3 clients shared across worker threads (clients are thread-safe;
+    they are created up front because sessions are not), with a semaphore
+    per AWS service bounding the calls in flight.
+    """
+
+    SERVICES = ("ecs", "elbv2", "ec2", "rds", "elasticache", "ecr", "logs", "ce")
+
+    def __init__(self, region: str, endpoint_url: str | None = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        import boto3
+        from botocore.config import Config
+
+        config = Config(
+            retries={"max_attempts": MAX_ATTEMPTS, "mode": "adaptive"},
+            max_pool_connections=max(10, max_concurrency * 2),
+        )
+        session = boto3.session.Session()
+        self.region = region
+        self.clients = {name: session.client(name, region_name=region, endpoint_url=endpoint_url, config=config)
+                        for name in self.SERVICES}
+        self.limits = defaultdict(lambda: threading.BoundedSemaphore(max_concurrency))
+        self._limits_lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=max_concurrency * len(self.SERVICES),
+                                       thread_name_prefix="inventory")
+        self.warnings: list[str] = []
+        self.failed: set[str] = set()  # AWS services with at least one failed call
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+
+    def _count(self) -> None:
+        with self._calls_lock:
+            self.calls += 1
+
+    def _limit(self, service: str) -> threading.BoundedSemaphore:
+        with self._limits_lock:
+            return self.limits[service]
+
+    def call(self, service: str, operation: str, context: str, **kwargs) -> dict | None:
+        """One API call; on failure a warning is recorded and None returned."""
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        with self._limit(service):
+            try:
+                self._count()
+                return getattr(self.clients[service], operation)(**kwargs)
+            except (BotoCoreError, ClientError) as exc:
+                self.failed.add(service)
+                self.warn(f"{context} failed: {exc}")
+                return None
+
+    def paginate(self, service: str, operation: str, key: str, context: str, **kwargs) -> list | None:
+        """Every ``key`` item across all pages of ``operation``; None on failure."""
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        items = []
+        with self._limit(service):
+            try:
+                for page in self.clients[service].get_paginator(operation).paginate(**kwargs):
+                    self._count()
+                    items.extend(page.get(key, []))
+            except (BotoCoreError, ClientError) as exc:
+                self.failed.add(service)
+                self.warn(f"{context} failed: {exc}")
+                return None
+        return items
+
+    def fan_out(self, func, items: list) -> list:
+        """Run ``func`` over ``items`` on the shared pool; the tasks themselves never wait on the pool."""
+        return list(self.pool.map(func, items))
+
+    def warn(self, message: str) -> None:
+        self.warnings.append(message)
+        print(f"WARNING: {message}", file=sys.stderr)
+
+    def close(self) -> None:
+        self.pool.shutdown()
+
+
+def service_estimates(c: Collector) -> dict[str, float]:
+    """Month-to-date unblended cost per billing service."""
+    today = datetime.now(timezone.utc).date()
+    resp = c.call(
+        "ce", "get_cost_and_usage", "Cost Explorer service estimate query",
+        TimePeriod={"Start": today.replace(day=1).isoformat(), "End": (today + timedelta(days=1)).isoformat()},
+        Granularity="MONTHLY",
+        Metrics=["UnblendedCost"],
+        Filter=COST_FILTER,
+        GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+    )
+    estimates = {}
+    for period in (resp or {}).get("ResultsByTime", []):
+        for group in period.get("Groups", []):
+            amount = Decimal(group["Metrics"]["UnblendedCost"]["Amount"])
+            estimates[group["Keys"][0]] = float(round(amount, 2))
+    return estimates
+
+
+# Each collector returns raw rows: dicts of make_row() keyword arguments.
+# ``tags`` is always present and is None when the resource's tag lookup
+# failed, so classify_changes can tell "no tags" from "tags unknown".
+
+def collect_ecs(c: Collector) -> list[dict]:
+    clusters = c.paginate("ecs", "list_clusters", "clusterArns", "ECS cluster listing") or []
+
+    def list_services(cluster: str) -> list[tuple[str, list[str]]]:
+        arns = c.paginate("ecs", "list_services", "serviceArns", f"ECS service listing for {cluster}", cluster=cluster)
+        return [(cluster, batch) for batch in chunks(arns or [], ECS_DESCRIBE_BATCH)]
+
+    def describe(job: tuple[str, list[str]]) -> list[dict]:
+        cluster, batch = job
+        resp = c.call("ecs", "describe_services", "ECS describe-services", cluster=cluster, services=batch,
+                      include=["TAGS"])
+        rows = []
+        for svc in (resp or {}).get("services", []):
+            state = f"{svc.get('status', 'UNKNOWN')} running={svc.get('runningCount', 0)} desired={svc.get('desiredCount', 0)}"
+            rows.append(dict(resource_id=svc["serviceArn"], resource_type="ecs", state=state, name=svc.get("serviceName", ""),
+                             tags=tags_to_map(svc.get("tags")), arn=svc["serviceArn"], notes=f"cluster={cluster}"))
+        return rows
+
+    # Two rounds (list-services for every cluster, then every describe batch),
+    # each fully parallel, instead of one serial walk per cluster.
+    jobs = [job for jobs in c.fan_out(list_services, clusters) for job in jobs]
+    return [row for rows in c.fan_out(describe, jobs) for row in rows]
+
+
+def collect_albs(c: Collector) -> list[dict]:
+    lbs = c.paginate("elbv2", "describe_load_balancers", "LoadBalancers", "ELBv2 listing") or []
+
+    def tags_for(batch: list[str]) -> dict[str, dict[str, str] | None]:
+        resp = c.call("elbv2", "describe_tags", f"ELB tags for {', '.join(batch)}", ResourceArns=batch)
+        if resp is None:
+            return dict.fromkeys(batch)
+        return {d["ResourceArn"]: tags_to_map(d.get("Tags")) for d in resp.get("TagDescriptions", [])}
+
+    tags: dict[str, dict[str, str] | None] = {}
+    for found in c.fan_out(tags_for, chunks([lb["LoadBalancerArn"] for lb in lbs], ELB_TAG_BATCH)):
+        tags.update(found)
+    return [dict(resource_id=lb["LoadBalancerArn"], resource_type="alb", state=lb.get("State", {}).get("Code", ""),
+                 name=lb.get("LoadBalancerName", ""), tags=tags.get(lb["LoadBalancerArn"], {}),
+                 arn=lb["LoadBalancerArn"], notes=f"scheme={lb.get('Scheme', '')}")
+            for lb in lbs]
+
+
+def collect_ec2(c: Collector) -> list[dict]:
+    reservations = c.paginate(
+        "ec2", "describe_instances", "Reservations", "EC2 instance listing",
+        Filters=[{"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]}],
+    ) or []
+    rows = []
+    for reservation in reservations:
+        for instance in reservation.get("Instances", []):
+            tags = tags_to_map(instance.get("Tags"))
+            rows.append(dict(resource_id=instance["InstanceId"], resource_type="ec2",
+                             state=instance.get("State", {}).get("Name", ""), name=tag_value(tags, "Name") or instance["InstanceId"],
+                             tags=tags, arn=instance["InstanceId"], notes=f"type={instance.get('InstanceType', '')}"))
+    return rows
+
+
+def collect_nat_gateways(c: Collector) -> list[dict]:
+    gateways = c.paginate(
+        "ec2", "describe_nat_gateways", "NatGateways", "NAT gateway listing",
+        Filter=[{"Name": "state", "Values": ["available", "pending", "deleting"]}],
+    ) or []
+    return [dict(resource_id=nat["NatGatewayId"], resource_type="nat", state=nat.get("State", ""),
+                 name=nat["NatGatewayId"], tags=tags_to_map(nat.get("Tags")), arn=nat["NatGatewayId"],
+                 notes=f"vpc={nat.get('VpcId', '')}")
+            for nat in gateways]
+
+
+def collect_rds(c: Collector) -> list[dict]:
+    dbs = c.paginate("rds", "describe_db_instances", "DBInstances", "RDS listing") or []
+
+    def row(db: dict) -> dict:
+        tag_list = db.get("TagList")
+        if tag_list is None:  # older responses omit tags; ask for them
+            resp = c.call("rds", "list_tags_for_resource", f"RDS tags for {db['DBInstanceIdentifier']}",
+                          ResourceName=db["DBInstanceArn"])
+            tag_list = resp.get("TagList", []) if resp is not None else None
+        return dict(resource_id=db["DBInstanceIdentifier"], resource_type="rds", state=db.get("DBInstanceStatus", ""),
+                    name=db["DBInstanceIdentifier"], tags=tags_to_map(tag_list) if tag_list is not None else None,
+                    arn=db.get("DBInstanceArn", ""),
+                    notes=f"engine={db.get('Engine', '')}")
+
+    return c.fan_out(row, dbs)
+
+
+def collect_elasticache(c: Collector) -> list[dict]:
+    groups = c.paginate("elasticache", "describe_replication_groups", "ReplicationGroups", "ElastiCache listing") or []
+
+    def row(group: dict) -> dict:
+        arn = group.get("ARN", "")
+        tags: dict[str, str] | None = {}
+        if arn:
+            resp = c.call("elasticache", "list_tags_for_resource", f"ElastiCache tags for {group['ReplicationGroupId']}",
+                          ResourceName=arn)
+            tags = tags_to_map(resp.get("TagList")) if resp is not None else None
+        return dict(resource_id=group["ReplicationGroupId"], resource_type="elasticache", state=group.get("Status", ""),
+                    name=group["ReplicationGroupId"], tags=tags, arn=arn,
+                    notes="engine=redis")
+
+    return c.fan_out(row, groups)
+
+
+def collect_ecr(c: Collector) -> list[dict]:
+    repos = c.paginate("ecr", "describe_repositories", "repositories", "ECR listing") or []
+
+    def row(repo: dict) -> dict:
+        resp = c.call("ecr", "list_tags_for_resource", f"ECR tags for {repo['repositoryName']}",
+                      resourceArn=repo["repositoryArn"])
+        return dict(resource_id=repo["repositoryName"], resource_type="ecr", state="present",
+                    name=repo["repositoryName"], tags=tags_to_map(resp.get("tags")) if resp is not None else None,
+                    arn=repo["repositoryArn"], notes=f"uri={repo.get('repositoryUri', '')}")
+
+    return c.fan_out(row, repos)
+
+
+def collect_log_groups(c: Collector) -> list[dict]:
+    groups = c.paginate("logs", "describe_log_groups", "logGroups", "CloudWatch logs listing") or []
+    return [dict(resource_id=g["logGroupName"], resource_type="logs", state="present", name=g["logGroupName"],
+                 tags={}, arn=g["logGroupName"], notes=f"retention_days={g.get('retentionInDays', 'never-expire')}")
+            for g in groups if PROJECT_LOG_GROUP_RE.search(g["logGroupName"])]
+
+
+COLLECTORS = {
+    "ECS services": collect_ecs,
+    "ALBs": collect_albs,
+    "EC2 instances": collect_ec2,
+    "NAT gateways": collect_nat_gateways,
+    "RDS instances": collect_rds,
+    "ElastiCache replication groups": collect_elasticache,
+    "ECR repositories": collect_ecr,
+    "CloudWatch log groups": collect_log_groups,
+}
+
+
+def collect_raw(c: Collector) -> list[dict]:
+    """Run every collector concurrently; unclassified make_row() keyword arguments."""
+    # Collectors wait on fan-out tasks, so they get their own threads rather
+    # than pool workers that the fan-out tasks need.
+    with ThreadPoolExecutor(max_workers=len(COLLECTORS), thread_name_prefix="collector") as outer:
+        futures = {label: outer.submit(func, c) for label, func in COLLECTORS.items()}
+        raw = {label: future.result() for label, future in futures.items()}
+
+    found = []
+    for label, items in raw.items():
+        print(f"  {label}: {len(items)}")
+        found += items
+    return found
+
+
+def row_order(row: InventoryRow) -> tuple:
+    return row.project.lower(), row.service.lower(), row.resource_type.lower(), row.resource_id.lower()
+
+
+def sort_rows(rows: list[InventoryRow]) -> list[InventoryRow]:
+    return sorted(rows, key=row_order)
+
+
+# ---------------------------------------------------------------------------
+# Snapshot diffing
+# ---------------------------------------------------------------------------
+
+def digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def resource_key(raw: dict) -> str:
+    return f"{raw['resource_type']}:{raw.get('arn') or raw['resource_id']}"
+
+
+def rules_digest(region: str) -> str:
+    """Fingerprint of everything classification depends on besides the resource itself."""
+    return digest({
+        "region": region,
+        "classifier": CLASSIFIER_VERSION,
+        "keep": KEEP_PROJECTS,
+        "patterns": [(pattern.pattern, project) for pattern, project in PROJECT_PATTERNS],
+        "services": BILLING_SERVICES,
+        "row": [f.name for f in fields(InventoryRow)],
+    })
+
+
+def load_snapshot(path: Path, rules: str) -> dict[str, dict] | None:
+    """
+    {"version": 2, "rules": sha256, "resources": {key: {"digest", "tags", "row"}}}
+
+    None when there is no usable snapshot (missing, unreadable, or written
+    under different classification rules), so everything is reclassified.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != SNAPSHOT_VERSION or data.get("rules") != rules:
+        return None
+    return data.get("resources", {})
+
+
+def save_snapshot(path: Path, rules: str, resources: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": SNAPSHOT_VERSION, "rules": rules, "resources": dict(sorted(resources.items()))}
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+# Refreshed on every row each run, so never stored in the snapshot or diffed
+VOLATILE_FIELDS = ("monthly_cost_estimate",)
+
+
+def snapshot_row(row: InventoryRow) -> dict:
+    return {name: value for name, value in asdict(row).items() if name not in VOLATILE_FIELDS}
+
+
+def stored_row(known: dict, estimates: dict[str, float]) -> InventoryRow:
+    """A snapshot entry's row with this run's cost estimate."""
+    return InventoryRow(**known["row"], monthly_cost_estimate=estimates.get(known["row"]["service"], 0.0))
+
+
+@dataclass
+class Change:
+    before: InventoryRow
+    after: InventoryRow
+    tags_changed: bool
+
+    def details(self) -> list[str]:
+        details = [f"{f.name}: {getattr(self.before, f.name)} -> {getattr(self.after, f.name)}"
+                   for f in fields(InventoryRow)
+                   if f.name not in VOLATILE_FIELDS and getattr(self.before, f.name) != getattr(self.after, f.name)]
+        return details + (["tags"] if self.tags_changed else [])
+
+
+@dataclass
+class InventoryDiff:
+    added: list[InventoryRow]
+    removed: list[InventoryRow]
+    changed: list[Change]
+    unchanged: int
+    carried: int  # previous resources kept because their listing or tag lookup failed this run
+    baseline: bool  # False on the first run (no usable snapshot)
+
+    def to_json(self) -> dict:
+        return {
+            "added": [asdict(row) for row in self.added],
+            "removed": [asdict(row) for row in self.removed],
+            "changed": [{"before": asdict(c.before), "after": asdict(c.after), "details": c.details()}
+                        for c in self.changed],
+            "unchanged": self.unchanged,
+            "carried": self.carried,
+            "baseline": self.baseline,
+        }
+
+
+def classify_changes(c: Collector, raw: list[dict], previous: dict[str, dict] | None,
+                     ) -> tuple[list[InventoryRow], InventoryDiff, dict[str, dict]]:
+    """
+    Diff the collected resources against the previous snapshot.
+
+    Unchanged resources (same key and tags/state digest) reuse their stored
+    row; only added and changed ones are classified. When a known resource's
+    tag lookup failed its stored tags are assumed, so it is not reclassified
+    as untagged. Every row gets this run's cost estimate. Returns (all rows,
+    diff, new snapshot).
+    """
+    baseline = previous is not None
+    previous = previous or {}
+    estimates = service_estimates(c)
+    current: dict[str, dict] = {}
+    rows: list[InventoryRow] = []
+    pending: list[tuple[str, dict, str]] = []
+    unchanged = carried = 0
+    for item in raw:
+        key = resource_key(item)
+        known = previous.get(key)
+        tags_unknown = item["tags"] is None
+        if tags_unknown and known:
+            item = {**item, "tags": known.get("tags", {})}
+        item_digest = digest(item)
+        if known and known["digest"] == item_digest:
+            current[key] = known
+            rows.append(stored_row(known, estimates))
+            if tags_unknown:
+                carried += 1
+            else:
+                unchanged += 1
+        else:
+            pending.append((key, item, item_digest))
+
+    added: list[InventoryRow] = []
+    changed: list[Change] = []
+    for key, item, item_digest in pending:
+        row = make_row(c.region, estimates, **item)
+        tags = item["tags"] or {}
+        current[key] = {"digest": item_digest, "tags": tags, "row": snapshot_row(row)}
+        rows.append(row)
+        known = previous.get(key)
+        if known is None:
+            added.append(row)
+        else:
+            changed.append(Change(stored_row(known, estimates), row, known.get("tags", {}) != tags))
+
+    # A listing that failed this run says nothing about what was removed, so
+    # resources of that type are carried over rather than reported gone.
+    removed: list[InventoryRow] = []
+    for key, known in previous.items():
+        if key in current:
+            continue
+        row = stored_row(known, estimates)
+        if RESOURCE_APIS.get(row.resource_type) in c.failed:
+            current[key] = known
+            rows.append(row)
+            carried += 1
+        else:
+            removed.append(row)
+
+    diff = InventoryDiff(sort_rows(added), sort_rows(removed), sorted(changed, key=lambda ch: row_order(ch.after)),
+                         unchanged, carried, baseline)
+    return sort_rows(rows), diff, current
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def write_inventory(rows: list[InventoryRow], out_dir: Path, timestamp: str) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    records = [asdict(row) for row in rows]
+    for stem in (f"inventory-{timestamp}", "latest-inventory"):
+        (out_dir / f"{stem}.json").write_text(json.dumps(records, indent=2) + "\n", encoding="utf-8")
+        with open(out_dir / f"{stem}.csv", "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=[f.name for f in fields(InventoryRow)], quoting=csv.QUOTE_ALL)
+            writer.writeheader()
+            writer.writerows(records)
+
+
+def diff_lines(diff: InventoryDiff, limit: int = DIFF_TABLE_LIMIT) -> list[str]:
+    """Markdown summary of what changed since the previous snapshot."""
+    lines = ["## Inventory Changes", ""]
+    if not diff.baseline:
+        lines.append(f"No previous snapshot: all {len(diff.added)} resource(s) were classified.")
+        return lines
+    lines.append(f"Since the previous snapshot: **{len(diff.added)} added, {len(diff.removed)} removed, "
+                 f"{len(diff.changed)} changed**, {diff.unchanged} unchanged.")
+    if diff.carried:
+        lines.append(f"{diff.carried} resource(s) were carried over from the snapshot because their listing "
+                     "or tag lookup failed.")
+
+    entries = ([("added", row, f"state: {row.state}") for row in diff.added]
+               + [("removed", row, f"last state: {row.state}") for row in diff.removed]
+               + [("changed", ch.after, "; ".join(ch.details())) for ch in diff.changed])
+    if entries:
+        lines += ["", "| Change | Type | Resource | Project | Disposition | Details |",
+                  "| --- | --- | --- | --- | --- | --- |"]
+        lines += [f"| {kind} | {row.resource_type} | `{row.resource_id}` | {row.project} | {row.disposition} | {details} |"
+                  for kind, row, details in entries[:limit]]
+        if len(entries) > limit:
+            lines += ["", f"...and {len(entries) - limit} more (see latest-inventory-diff.json)."]
+    return lines
+
+
+def write_diff(diff: InventoryDiff, out_dir: Path, timestamp: str) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(diff.to_json(), indent=2) + "\n"
+    for stem in (f"inventory-diff-{timestamp}", "latest-inventory-diff"):
+        (out_dir / f"{stem}.json").write_text(text, encoding="utf-8")
+    (out_dir / "latest-inventory-diff.md").write_text("\n".join(diff_lines(diff)) + "\n", encoding="utf-8")
+
+
+def print_counts(title: str, rows: list[InventoryRow], attr: str) -> None:
+    counts: dict[str, int] = defaultdict(int)
+    for row in rows:
+        counts[getattr(row, attr)] += 1
+    print(f"\n{title}")
+    for name in sorted(counts, key=str.lower):
+        print(f"  {name:<32} {counts[name]}")
+
+
+def unowned(rows: list[InventoryRow]) -> list[InventoryRow]:
+    return [r for r in rows if r.project == "unknown" or r.owner == "unknown"]
+
+
+def active_non_retail(rows: list[InventoryRow]) -> list[InventoryRow]:
+    return [r for r in rows if r.project != "retail-forecast-dashboard" and ACTIVE_STATE_RE.search(r.state)]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Collect an AWS resource inventory with keep/delete recommendations.")
+    parser.add_argument("--region", default="us-east-1", help="AWS region (default: us-east-1).")
+    parser.add_argument("--out-dir", type=Path, default=REPORT_DIR, help="Output directory (default: reports/aws-cost/).")
+    parser.add_argument("--endpoint-url", default=None, help="Send every call to this endpoint (e.g. a local moto_server).")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f"Calls in flight per AWS service (default: {DEFAULT_MAX_CONCURRENCY}).")
+    parser.add_argument("--snapshot", type=Path, default=None,
+                        help=f"Snapshot to diff against and update (default: {SNAPSHOT_NAME} in --out-dir).")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the snapshot and reclassify every resource.")
+    parser.add_argument("--summary", action="store_true",
+                        help="Print the change summary as markdown (and append it to $GITHUB_STEP_SUMMARY).")
+    parser.add_argument("--fail-on-unowned", action="store_true", help="Exit 2 if any resource is unowned/unknown.")
+    parser.add_argument("--fail-on-active-non-retail", action="store_true",
+                        help="Exit 3 if any non-retail resource is still active.")
+    args = parser.parse_args(argv)
+
+    try:
+        collector = Collector(args.region, args.endpoint_url, max(1, args.max_concurrency))
+    except ImportError:
+        print("ERROR: boto3 is required: pip install boto3", file=sys.stderr)
+        return 1
+
+    snapshot_path = args.snapshot or args.out_dir / SNAPSHOT_NAME
+    rules = rules_digest(args.region)
+    previous = None if args.full else load_snapshot(snapshot_path, rules)
+
+    started = time.perf_counter()
+    print("Collecting inventory...")
+    try:
+        raw = collect_raw(collector)
+        rows, diff, snapshot = classify_changes(collector, raw, previous)
+    finally:
+        collector.close()
+    elapsed = time.perf_counter() - started
+
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    write_inventory(rows, args.out_dir, timestamp)
+    write_diff(diff, args.out_dir, timestamp)
+    save_snapshot(snapshot_path, rules, snapshot)
+
+    print_counts("Resource inventory summary by disposition:", rows, "disposition")
+    print_counts("Resource inventory summary by project:", rows, "project")
+    print(f"\nCollected {len(rows)} resource(s) with {collector.calls} API call(s) in {elapsed:.2f}s "
+          f"({len(collector.warnings)} warning(s)).")
+    print(f"Classified {len(diff.added) + len(diff.changed)} new or changed resource(s); "
+          f"{diff.unchanged} unchanged, {len(diff.removed)} removed.")
+    if args.summary:
+        lines = diff_lines(diff)
+        print("\n" + "\n".join(lines))
+        summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
+        if summary_path:
+            with open(summary_path, "a", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n\n")
+
+    missing_owner = unowned(rows)
+    active = active_non_retail(rows)
+    if missing_owner:
+        print(f"WARNING: Found {len(missing_owner)} unowned/unknown resources.", file=sys.stderr)
+    if active:
+        print(f"WARNING: Found {len(active)} active non-retail resources.", file=sys.stderr)
+    print(f"\nWrote inventory artifacts to: {args.out_dir}")
+
+    if args.fail_on_unowned and missing_owner:
+        print("ERROR: Failing due to unowned/unknown resources.", file=sys.stderr)
+        return 2
+    if args.fail_on_active_non_retail and active:
+        print("ERROR: Failing due to active non-retail resources.", file=sys.stderr)
+        return 3
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Static-site build: minify, fingerprint and precompress the published pages.
+
+The pages stay hand-written at the repo root; this emits a deployable copy in
+dist/:
+
+  - HTML pages are minified: comments dropped, whitespace collapsed, and
+    whitespace next to block-level tags removed. Inline <style> and <script>
+    bodies go through small CSS/JS minifiers that keep strings intact and
+    keep JS line breaks (so automatic semicolon insertion is unaffected).
+  - Local assets the pages reference (the resume PDFs) are copied under
+    content-fingerprinted names, resumes/<stem>.<hash>.pdf, and the
+    references are rewritten, so they can be served with immutable cache
+    headers. The ?v= cache-buster query is dropped. Every resume PDF is
+    also copied under its original name, so links published before the
+    fingerprinting keep working once dist/ is what Pages serves.
+  - Text outputs get .gz siblings, and .br siblings when the optional
+    ``brotli`` package is installed.
+
+A size report lists source, minified, gzip and brotli bytes per file.
+
+Usage:
+  python3 scripts/build_site.py                 # build into dist/
+  python3 scripts/build_site.py --out /tmp/site --no-compress
+"""
+
+import argparse
+import gzip
+import os
+import re
+import shutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import cache_bust  # noqa: E402
+
+ROOT = Path(__file__).parent.parent
+DIST_DIR = ROOT / "dist"
+PAGES = ("index.html", "jmahotiedu.html", "jmahotiedu/index.html")
+# Published under their source names as well (stable URLs for external links)
+STABLE_ASSETS = ("resumes/*.pdf",)
+TEXT_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt", ".xml"}
+BUILD_MARKER = ".site-build"
+
+
+# ---------------------------------------------------------------------------
+# CSS / JS minifiers
+# ---------------------------------------------------------------------------
+
+def _string_end(text: str, start: int) -> int:
+    """Index just past the quoted string (or template literal) opening at ``start``."""
+    quote = text[start]
+    i = start + 1
+    while i < len(text):
+        if text[i] == "\\":
+            i += 2
+            continue
+        if text[i] == quote:
+            return i + 1
+        i += 1
+    return len(text)
+
+
+CSS_TIGHT = set("{};,>")
+
+
+def minify_css(css: str) -> str:
+    out: list[str] = []
+    space = False
+    i = 0
+    while i < len(css):
+        ch = css[i]
+        if ch in "\"'":
+            end = _string_end(css, i)
+            if space and out and out[-1][-1] not in CSS_TIGHT | {":"}:
+                out.append(" ")
+            out.append(css[i:end])
+            space = False
+            i = end
+        elif css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = len(css) if end == -1 else end + 2
+            space = True
+        elif ch.isspace():
+            space = True
+            i += 1
+        else:
+            if ch == "}" and out and out[-1] == ";":
+                out.pop()
+            if space and out and ch not in CSS_TIGHT and out[-1][-1] not in CSS_TIGHT | {":"}:
+                out.append(" ")
+            out.append(ch)
+            space = False
+            i += 1
+    return "".join(out)
+
+
+JS_WORD = re.compile(r"[A-Za-z0-9_$]")
+# A "/" after these starts a regex literal rather than a division.
+JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^\n")
+JS_REGEX_KEYWORDS = ("return", "typeof", "case", "do", "else", "in", "of", "void", "yield", "await")
+
+
+def _regex_end(js: str, start: int) -> int:
+    i = start + 1
+    in_class = False
+    while i < len(js):
+        ch = js[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            in_class = True
+        elif ch == "]":
+            in_class = False
+        elif ch == "/" and not in_class:
+            i += 1
+            while i < len(js) and JS_WORD.match(js[i]):
+                i += 1
+            return i
+        elif ch == "\n":
+            break
+        i += 1
+    return i
+
+
+def minify_js(js: str) -> str:
+    """Strip comments and redundant whitespace; line breaks are kept."""
+    out: list[str] = []
+    newline = space = False
+
+    def emit(token: str) -> None:
+        nonlocal newline, space
+        if out:
+            prev = out[-1][-1]
+            if newline:
+                out.append("\n")
+            elif space and (JS_WORD.match(prev) and JS_WORD.match(token[0]) or prev == token[0] and prev in "+-"):
+                out.append(" ")
+        out.append(token)
+        newline = space = False
+
+    def regex_allowed() -> bool:
+        text = "".join(out[-8:]).rstrip()  # long enough for the longest keyword
+        if not text:
+            return True
+        if newline or text[-1] in JS_REGEX_AFTER:
+            return True
+        return any(text.endswith(word) and not JS_WORD.match(text[-len(word) - 1:-len(word)] or " ")
+                   for word in JS_REGEX_KEYWORDS)
+
+    i = 0
+    while i < len(js):
+        ch = js[i]
+        if ch in "\"'`":
+            end = _string_end(js, i)
+            emit(js[i:end])
+            i = end
+        elif js.startswith("//", i):
+            end = js.find("\n", i)
+            i = len(js) if end == -1 else end
+        elif js.startswith("/*", i):
+            end = js.find("*/", i + 2)
+            end = len(js) if end == -1 else end + 2
+            if "\n" in js[i:end]:
+                newline = True
+            else:
+                space = True
+            i = end
+        elif ch == "/" and regex_allowed():
+            end = _regex_end(js, i)
+            emit(js[i:end])
+            i = end
+        elif ch == "\n":
+            newline = True
+            i += 1
+        elif ch.isspace():
+            space = True
+            i += 1
+        else:
+            emit(ch)
+            i += 1
+    return "".join(out)
+
+
+# ---------------------------------------------------------------------------
+# HTML minifier
+# ---------------------------------------------------------------------------
+
+HTML_TOKEN_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<(?P<raw>script|style|pre|textarea)\b[^>]*>.*?</(?P=raw)\s*>"
+    r"|<[^>]+>",
+    re.DOTALL | re.IGNORECASE,
+)
+TAG_NAME_RE = re.compile(r"<[/!]?([A-Za-z][A-Za-z0-9]*)")
+RAW_BODY_RE = re.compile(r"(<(?P<tag>script|style)\b[^>]*>)(?P<body>.*?)(</(?P=tag)\s*>)", re.DOTALL | re.IGNORECASE)
+# Whitespace next to these never renders, so it can be dropped. <script>,
+# <style> and <textarea> may sit inside running text, so they are not listed.
+BLOCK_TAGS = {
+    "!doctype", "html", "head", "body", "title", "meta", "link", "base",
+    "main", "nav", "header", "footer", "section", "article", "aside", "div", "p", "ul", "ol", "li",
+    "dl", "dt", "dd", "h1", "h2", "h3", "h4", "h5", "h6", "table", "thead", "tbody", "tr", "th", "td",
+    "form", "fieldset", "hr", "br", "blockquote", "figure", "figcaption", "pre",
+}
+
+
+def _tag_name(tag: str) -> str:
+    if tag.lower().startswith("<!doctype"):
+        return "!doctype"
+    m = TAG_NAME_RE.match(tag)
+    return m.group(1).lower() if m else ""
+
+
+def minify_raw(tag: str) -> str:
+    """Minify the body of an inline <style> or <script>; <pre>/<textarea> are kept."""
+    m = RAW_BODY_RE.fullmatch(tag)
+    if not m:
+        return tag
+    if m.group("tag").lower() == "style":
+        body = minify_css(m.group("body"))
+    elif re.search(r"\btype=\"(?!text/javascript|module)", m.group(1)):
+        body = m.group("body")  # JSON-LD, templates, ...: leave alone
+    else:
+        body = minify_js(m.group("body")).strip()
+    return m.group(1) + body + m.group(4)
+
+
+def minify_html(page: str) -> str:
+    tokens: list[tuple[str, str]] = []  # ("tag" | "text", text)
+
+    def add_text(text: str) -> None:
+        # Merge the text on both sides of a dropped comment, so tags and text
+        # strictly alternate and a text token's neighbours are its tags.
+        if tokens and tokens[-1][0] == "text":
+            tokens[-1] = ("text", tokens[-1][1] + text)
+        else:
+            tokens.append(("text", text))
+
+    pos = 0
+    for m in HTML_TOKEN_RE.finditer(page):
+        if m.start() > pos:
+            add_text(page[pos:m.start()])
+        token = m.group(0)
+        if token.startswith("<!--"):
+            if not token.startswith("<!--["):  # keep conditional comments
+                pos = m.end()
+                continue
+        tokens.append(("tag", minify_raw(token) if m.group("raw") else token))
+        pos = m.end()
+    if pos < len(page):
+        add_text(page[pos:])
+
+    out: list[str] = []
+    prev_block = True  # start of page
+    for i, (kind, text) in enumerate(tokens):
+        if kind == "tag":
+            out.append(text)
+            prev_block = _tag_name(text) in BLOCK_TAGS
+            continue
+        text = re.sub(r"\s+", " ", text)
+        if prev_block:
+            text = text.lstrip()
+        if i + 1 == len(tokens) or _tag_name(tokens[i + 1][1]) in BLOCK_TAGS:
+            text = text.rstrip()
+        out.append(text)
+    return "".join(out)
+
+
+# ---------------------------------------------------------------------------
+# Fingerprinting and compression
+# ---------------------------------------------------------------------------
+
+ASSET_ATTR_RE = re.compile(r"\b(href|src)=\"([^\"]+)\"")
+EXTERNAL_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*:|#|//)")
+
+
+def fingerprinted_name(path: Path) -> str:
+    return f"{path.stem}.{cache_bust.short_hash(path)}{path.suffix}"
+
+
+def rewrite_asset_refs(page: str, page_rel: str, root: Path, assets: dict[str, str]) -> str:
+    """
+    Point local non-HTML references at fingerprinted names, recording
+    {source path: fingerprinted path} (both relative to root) in ``assets``.
+    """
+    page_dir = Path(page_rel).parent
+
+    def replace(m: re.Match) -> str:
+        value = m.group(2)
+        if EXTERNAL_RE.match(value):
+            return m.group(0)
+        target, _, fragment = value.partition("#")
+        target = target.split("?", 1)[0]
+        source_rel = os.path.normpath(page_dir / target).replace(os.sep, "/")
+        source = root / source_rel
+        if not target or source.suffix == ".html" or not source.is_file():
+            return m.group(0)
+        if source_rel not in assets:
+            assets[source_rel] = str(Path(source_rel).with_name(fingerprinted_name(source))).replace(os.sep, "/")
+        new_target = str(Path(target).with_name(Path(assets[source_rel]).name)).replace(os.sep, "/")
+        return f'{m.group(1)}="{new_target}{"#" + fragment if fragment else ""}"'
+
+    return ASSET_ATTR_RE.sub(replace, page)
+
+
+def load_brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+@dataclass
+class SizeRow:
+    path: str
+    source: int
+    output: int
+    gzip: int | None = None
+    brotli: int | None = None
+
+
+def write_compressed(path: Path, data: bytes, row: SizeRow, brotli) -> None:
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    path.with_name(path.name + ".gz").write_bytes(gz)
+    row.gzip = len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        path.with_name(path.name + ".br").write_bytes(br)
+        row.brotli = len(br)
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def prepare_out_dir(out_dir: Path) -> None:
+    """Empty ``out_dir``, refusing to wipe a non-empty directory this script did not create."""
+    if out_dir.exists():
+        if any(out_dir.iterdir()) and not (out_dir / BUILD_MARKER).exists():
+            raise RuntimeError(f"{out_dir} is not empty and was not created by build_site.py")
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+    (out_dir / BUILD_MARKER).write_text("", encoding="utf-8")
+
+
+def build(root: Path, out_dir: Path, compress: bool = True) -> list[SizeRow]:
+    prepare_out_dir(out_dir)
+    brotli = load_brotli() if compress else None
+    rows: list[SizeRow] = []
+    assets: dict[str, str] = {}
+
+    for rel in PAGES:
+        source = root / rel
+        if not source.exists():
+            continue
+        text = source.read_text(encoding="utf-8")
+        data = minify_html(rewrite_asset_refs(text, rel, root, assets)).encode("utf-8")
+        dest = out_dir / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(data)
+        row = SizeRow(rel, len(text.encode("utf-8")), len(data))
+        if compress:
+            write_compressed(dest, data, row, brotli)
+        rows.append(row)
+
+    for source_rel, dest_rel in sorted(assets.items()):
+        source = root / source_rel
+        dest = out_dir / dest_rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, dest)
+        row = SizeRow(dest_rel, source.stat().st_size, dest.stat().st_size)
+        if compress and dest.suffix in TEXT_SUFFIXES:
+            write_compressed(dest, dest.read_bytes(), row, brotli)
+        rows.append(row)
+
+    for pattern in STABLE_ASSETS:
+        for source in sorted(root.glob(pattern)):
+            rel = source.relative_to(root).as_posix()
+            dest = out_dir / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, dest)
+            rows.append(SizeRow(rel, source.stat().st_size, dest.stat().st_size))
+    return rows
+
+
+def format_report(rows: list[SizeRow]) -> list[str]:
+    def cell(value: int | None) -> str:
+        return "-" if value is None else f"{value:,}"
+
+    def saved(row: SizeRow) -> str:
+        smallest = min(v for v in (row.output, row.gzip, row.brotli) if v is not None)
+        return f"{100 * (1 - smallest / row.source):.0f}%" if row.source else "-"
+
+    header = ("File", "Source", "Minified", "Gzip", "Brotli", "Saved")
+    table = [header] + [(r.path, cell(r.source), cell(r.output), cell(r.gzip), cell(r.brotli), saved(r)) for r in rows]
+    def column_total(attr: str) -> int | None:
+        """Sum of a compressed column; files without that variant count at their output size."""
+        if all(getattr(r, attr) is None for r in rows):
+            return None
+        return sum(getattr(r, attr) if getattr(r, attr) is not None else r.output for r in rows)
+
+    total = SizeRow("total", sum(r.source for r in rows), sum(r.output for r in rows),
+                    column_total("gzip"), column_total("brotli"))
+    table.append((total.path, cell(total.source), cell(total.output), cell(total.gzip), cell(total.brotli), saved(total)))
+    widths = [max(len(row[i]) for row in table) for i in range(len(header))]
+    return ["  " + "  ".join(value.ljust(w) if i == 0 else value.rjust(w) for i, (value, w) in enumerate(zip(row, widths)))
+            for row in table]
+
+
+def write_step_summary(rows: list[SizeRow]) -> None:
+    summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
+    if not summary_path:
+        return
+    with open(summary_path, "a", encoding="utf-8") as fh:
+        fh.write("## Site Build\n\n")
+        fh.write("| File | Source B | Minified B | Gzip B | Brotli B |\n")
+        fh.write("| --- | ---: | ---: | ---: | ---: |\n")
+        for r in rows:
+            fh.write(f"| {r.path} | {r.source} | {r.output} | {r.gzip if r.gzip is not None else '-'} | "
+                     f"{r.brotli if r.brotli is not None else '-'} |\n")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build a minified, fingerprinted, precompressed copy of the site.")
+    parser.add_argument("--out", type=Path, default=DIST_DIR, help="Output directory (default: dist/).")
+    parser.add_argument("--no-compress", action="store_true", help="Skip the .gz/.br siblings.")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = build(ROOT, args.out, compress=not args.no_compress)
+    except RuntimeError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    print(f"Built {len(rows)} file(s) into {args.out}")
+    for line in format_report(rows):
+        print(line)
+    if not args.no_compress and load_brotli() is None:
+        print("  (install the optional 'brotli' package for .br output)")
+    write_step_summary(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
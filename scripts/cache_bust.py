@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Content-hashed cache busting for published PDFs.
+
+Hashes every PDF under resumes/ and rewrites each link to one of them in
+index.html, jmahotiedu.html and README.md so it carries
+``?v=<short-content-hash>``. Links are only touched when the hash differs,
+so re-running on unchanged PDFs leaves every file byte-identical.
+
+Usage:
+  python3 scripts/cache_bust.py            # rewrite links in place
+  python3 scripts/cache_bust.py --check    # exit 1 if any link is stale
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+RESUMES_DIR = ROOT / "resumes"
+TARGETS = [ROOT / "index.html", ROOT / "jmahotiedu.html", ROOT / "README.md"]
+
+HASH_LENGTH = 10
+
+# resumes/<file>.pdf with an optional existing ?v=<token>; the prefix (relative
+# path, github.com/.../raw/main/, etc.) is left untouched.
+PDF_LINK_RE = re.compile(r"(?<![A-Za-z0-9_.-])resumes/(?P<name>[A-Za-z0-9_.-]+\.pdf)(?P<query>\?v=[A-Za-z0-9]*)?")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def short_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def pdf_hashes(resumes_dir: Path = RESUMES_DIR) -> dict[str, str]:
+    """Return {pdf_filename: short_content_hash} for every PDF in resumes/."""
+    return {path.name: short_hash(path) for path in sorted(resumes_dir.glob("*.pdf"))}
+
+
+def rewrite_cache_busters(text: str, hashes: dict[str, str]) -> tuple[str, list[str]]:
+    """
+    Rewrite every resumes/<pdf> link in ``text`` to ``?v=<hash>`` in one pass.
+    Returns the new text and the filenames whose links changed.
+    """
+    changed: list[str] = []
+
+    def replace(m: re.Match) -> str:
+        name = m.group("name")
+        digest = hashes.get(name)
+        if digest is None:
+            return m.group(0)
+        updated = f"resumes/{name}?v={digest}"
+        if updated != m.group(0):
+            changed.append(name)
+        return updated
+
+    return PDF_LINK_RE.sub(replace, text), changed
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rewrite resume PDF links to content-hashed ?v= query strings.")
+    parser.add_argument("--check", action="store_true", help="Report stale links without writing; exit 1 if any.")
+    args = parser.parse_args(argv)
+
+    hashes = pdf_hashes()
+    if not hashes:
+        print(f"ERROR: no PDFs found under {RESUMES_DIR}", file=sys.stderr)
+        return 1
+
+    stale = 0
+    for path in TARGETS:
+        if not path.exists():
+            continue
+        original = path.read_bytes().decode("utf-8")
+        updated, changed = rewrite_cache_busters(original, hashes)
+        if not changed:
+            print(f"  OK: {path.name} cache-busters are current")
+            continue
+        stale += len(changed)
+        for name in sorted(set(changed)):
+            print(f"  {'STALE' if args.check else 'UPDATED'}: {path.name} -> {name}?v={hashes[name]}")
+        if not args.check:
+            path.write_bytes(updated.encode("utf-8"))
+
+    if args.check and stale:
+        print(f"\nFAILED: {stale} stale PDF link(s).")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,62 +5,439 @@ Portfolio consistency checker.
 Validates that README.md and index.html agree on:
   1. PR contribution list (same set of GitHub pull request URLs)
   2. Cloud deployment statuses (Live vs Deprovisioned for each project)
+and that the resume PDFs in resumes/ only link PRs and project repos that
+index.html shows, and still carry the links their generator variant defines
+(3). PDF links are read by scripts/pdf_links.py and cached by content hash,
+so unchanged PDFs are not re-parsed. Finally, the project repos, resume
+download links and redirect targets of every published document must agree
+(4).
+
+Checks are registered with @check and declare the documents they read.
+Each document is loaded once into a shared DocumentStore (index.html is
+tokenized into an IndexModel of sections, cards, headings, links and status
+lines), then the checks run concurrently and return Finding objects. The
+report can be printed as text, JSON or GitHub annotations.
+
+Every URL in the published documents (PUBLISHED_DOCUMENTS) is collected in
+one pass into a UrlIndex of URL -> (file, line, context), so cross-document
+comparisons are set queries on that index and each mismatch is reported at
+its file:line.
 
 Exits with a non-zero code and prints a report if any conflicts are found.
+--profile writes a JSON timing report of the read/parse/check phases (see
+scripts/instrumentation.py).
+
+As a library: run_checks(root) returns the findings with no global state.
 """
 
+import argparse
+import html
+import json
 import re
+import runpy
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from html.parser import HTMLParser
 from pathlib import Path
+from typing import Any, Callable
 
-ROOT = Path(__file__).parent.parent
-README = ROOT / "README.md"
-INDEX = ROOT / "index.html"
-
-ERRORS: list[str] = []
-WARNINGS: list[str] = []
-
-
-def err(msg: str) -> None:
-    ERRORS.append(f"  ERROR: {msg}")
-
+import instrumentation
+import pdf_links
+from instrumentation import phase
 
-def warn(msg: str) -> None:
-    WARNINGS.append(f"  WARN:  {msg}")
+ROOT = Path(__file__).parent.parent
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+PR_URL_RE = re.compile(r"https://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+/pull/\d+")
+PROJECT_URL_RE = re.compile(r"https://github\.com/jmahotiedu/[A-Za-z0-9_.-]+")
+RESUME_DOWNLOAD_RE = re.compile(r"https://github\.com/jmahotiedu/([A-Za-z0-9_.-]+)/raw/main/resumes/([A-Za-z0-9_.-]+\.pdf)")
+TEXT_URL_RE = re.compile(r"https?://[^\s\"'<>()\[\]`|]+")
+STATUS_RE = re.compile(r"Status:\s*(Live|Deprovisioned)")
+
+
 def extract_pr_urls(text: str) -> set[str]:
     """Return all unique github.com/.../pull/N URLs found in text."""
-    return set(re.findall(r"https://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+/pull/\d+", text))
+    return set(PR_URL_RE.findall(text))
 
 
 def normalize_project(name: str) -> str:
     return re.sub(r"[^a-z0-9]", "", name.lower())
 
 
+def line_of(text: str, offset: int) -> int:
+    """1-based line number of a character offset."""
+    return text.count("\n", 0, offset) + 1
+
+
 # ---------------------------------------------------------------------------
-# 1. PR list consistency
+# index.html document model
+# ---------------------------------------------------------------------------
+
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+
+@dataclass
+class Card:
+    """A ``project-card`` anchor and the text it contains."""
+    section: str | None
+    href: str | None
+    line: int
+    heading: str = ""
+    stack_lines: list[str] = field(default_factory=list)
+
+    @property
+    def status(self) -> str | None:
+        for text in self.stack_lines:
+            m = STATUS_RE.search(text)
+            if m:
+                return m.group(1).lower()
+        return None
+
+
+@dataclass
+class Section:
+    id: str
+    line: int
+    headings: list[str] = field(default_factory=list)
+    cards: list[Card] = field(default_factory=list)
+
+
+@dataclass
+class Link:
+    href: str
+    section: str | None
+    line: int
+
+
+class IndexModel(HTMLParser):
+    """
+    Streaming, single-pass model of index.html.
+
+    Tracks the enclosing <section id=...>, project-card anchors, headings,
+    every <a href> and <p class="stack"> status lines as tags are fed in, so
+    building the model is linear in page size and queries are dict/list
+    lookups.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.sections: dict[str, Section] = {}
+        self.cards: list[Card] = []
+        self.headings: list[tuple[str, str, str | None]] = []
+        self.links: list[Link] = []
+        self._section: Section | None = None
+        self._section_depth = 0
+        self._card: Card | None = None
+        self._capture: str | None = None  # "heading" or "stack"
+        self._heading_tag = ""
+        self._buffer: list[str] = []
+
+    @classmethod
+    def parse(cls, text: str) -> "IndexModel":
+        model = cls()
+        model.feed(text)
+        model.close()
+        return model
+
+    # -- queries -----------------------------------------------------------
+
+    def section_cards(self, section_id: str) -> list[Card]:
+        section = self.sections.get(section_id)
+        return section.cards if section else []
+
+    # -- tokenizer callbacks ---------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attr = dict(attrs)
+        line = self.getpos()[0]
+        classes = (attr.get("class") or "").split()
+
+        if tag == "section":
+            if self._section is None and attr.get("id"):
+                self._section = Section(id=attr["id"], line=line)
+                self.sections[self._section.id] = self._section
+                self._section_depth = 1
+            elif self._section is not None:
+                self._section_depth += 1
+        elif tag == "a":
+            href = attr.get("href")
+            section_id = self._section.id if self._section else None
+            if href:
+                self.links.append(Link(href=href, section=section_id, line=line))
+            if "project-card" in classes:
+                self._card = Card(section=section_id, href=href, line=line)
+                self.cards.append(self._card)
+                if self._section:
+                    self._section.cards.append(self._card)
+        elif tag in HEADING_TAGS:
+            self._start_capture("heading", tag)
+        elif tag == "p" and "stack" in classes:
+            self._start_capture("stack", tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._capture and tag == self._heading_tag:
+            self._finish_capture()
+        if tag == "a":
+            self._card = None
+        elif tag == "section" and self._section is not None:
+            self._section_depth -= 1
+            if self._section_depth == 0:
+                self._section = None
+
+    def handle_data(self, data: str) -> None:
+        if self._capture:
+            self._buffer.append(data)
+
+    def _start_capture(self, kind: str, tag: str) -> None:
+        self._capture = kind
+        self._heading_tag = tag
+        self._buffer = []
+
+    def _finish_capture(self) -> None:
+        text = " ".join("".join(self._buffer).split())
+        section_id = self._section.id if self._section else None
+        if self._capture == "heading":
+            self.headings.append((self._heading_tag, text, section_id))
+            if self._section:
+                self._section.headings.append(text)
+            if self._card and not self._card.heading:
+                self._card.heading = text
+        elif self._card is not None:
+            self._card.stack_lines.append(text)
+        self._capture = None
+        self._heading_tag = ""
+        self._buffer = []
+
+
 # ---------------------------------------------------------------------------
+# Cross-document URL index
+# ---------------------------------------------------------------------------
+
+# Every document published with the site, relative to the repo root
+PUBLISHED_DOCUMENTS = ("README.md", "index.html", "jmahotiedu.html", "jmahotiedu/index.html", "resumes/README.md")
+CONTEXT_CHARS = 100
+
+
+def canonical_url(url: str) -> str:
+    """Index key for a URL: PR links lose /files etc., other URLs a trailing slash."""
+    m = PR_URL_RE.match(url)
+    if m:
+        return m.group(0)
+    return url.rstrip("/")
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    file: str
+    line: int
+    context: str  # the stripped source line, truncated to CONTEXT_CHARS
+
+
+class UrlIndex:
+    """
+    Inverted index of absolute URLs -> where they occur. Documents are scanned
+    once each, so building it is linear in total bytes; queries are set
+    operations on the per-file key sets.
+    """
+
+    def __init__(self) -> None:
+        self.occurrences: dict[str, list[Occurrence]] = {}
+        self.files: dict[str, set[str]] = {}
+
+    def add_document(self, rel: str, text: str) -> None:
+        keys = self.files.setdefault(rel, set())
+        line, pos = 1, 0
+        for m in TEXT_URL_RE.finditer(text):
+            line += text.count("\n", pos, m.start())
+            pos = m.start()
+            url = canonical_url(html.unescape(m.group(0)).rstrip(".,;:"))
+            start = text.rfind("\n", 0, m.start()) + 1
+            end = text.find("\n", m.end())
+            context = text[start:end if end != -1 else len(text)].strip()[:CONTEXT_CHARS]
+            self.occurrences.setdefault(url, []).append(Occurrence(rel, line, context))
+            keys.add(url)
+
+    def urls(self, rel: str, pattern: re.Pattern | None = None) -> set[str]:
+        """URLs in ``rel``, optionally only those ``pattern`` fully matches."""
+        keys = self.files.get(rel, set())
+        if pattern is None:
+            return set(keys)
+        return {url for url in keys if pattern.fullmatch(url)}
+
+    def where(self, url: str, rel: str | None = None) -> list[Occurrence]:
+        return [o for o in self.occurrences.get(canonical_url(url), []) if rel is None or o.file == rel]
+
+    def first(self, url: str, rel: str) -> Occurrence | None:
+        found = self.where(url, rel)
+        return found[0] if found else None
+
+    def contains(self, url: str, rel: str) -> bool:
+        return canonical_url(url) in self.files.get(rel, ())
+
+    def missing(self, pattern: re.Pattern, present_in: str, absent_from: str) -> list[tuple[str, Occurrence]]:
+        """(url, first occurrence in ``present_in``) for each ``pattern`` URL that ``absent_from`` lacks."""
+        only = self.urls(present_in, pattern) - self.urls(absent_from, pattern)
+        return [(url, self.first(url, present_in)) for url in sorted(only)]
+
+
+# ---------------------------------------------------------------------------
+# Check registry, shared documents and findings
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Finding:
+    check: str
+    severity: str  # "ok", "warning" or "error"
+    message: str
+    file: str | None = None
+    line: int | None = None
+
 
-def check_prs(readme: str, index: str) -> None:
-    readme_prs = extract_pr_urls(readme)
-    index_prs = extract_pr_urls(index)
+def ok(check_name: str, message: str) -> Finding:
+    return Finding(check_name, "ok", message)
 
-    only_readme = readme_prs - index_prs
-    only_index = index_prs - readme_prs
 
-    for url in sorted(only_readme):
-        err(f"PR in README.md but missing from index.html: {url}")
+def warning(check_name: str, message: str, file: str | None = None, line: int | None = None) -> Finding:
+    return Finding(check_name, "warning", message, file, line)
 
-    for url in sorted(only_index):
-        err(f"PR in index.html but missing from README.md: {url}")
+
+def error(check_name: str, message: str, file: str | None = None, line: int | None = None) -> Finding:
+    return Finding(check_name, "error", message, file, line)
+
+
+def text_document(parse: Callable[[str], Any]) -> Callable[["DocumentStore", Path], Any]:
+    """Loader that parses a UTF-8 file's text (read once per store)."""
+    def load(store: "DocumentStore", path: Path) -> Any:
+        text = store.read_text(path)
+        with phase("parse", document=path.name):
+            return parse(text)
+    return load
+
+
+def load_url_index(store: "DocumentStore", root: Path) -> UrlIndex:
+    index = UrlIndex()
+    for rel in PUBLISHED_DOCUMENTS:
+        path = root / rel
+        if path.exists():
+            text = store.read_text(path)
+            with phase("index", document=rel):
+                index.add_document(rel, text)
+    return index
+
+
+def load_resume_links(store: "DocumentStore", path: Path) -> pdf_links.PdfLinkScan:
+    with phase("scan", document=path.name):
+        return pdf_links.scan_dir(path, path.parent / pdf_links.CACHE_PATH.name)
+
+
+def load_resume_variants(store: "DocumentStore", path: Path) -> dict[str, list[str]]:
+    """{pdf filename: links its generator variant defines}."""
+    with phase("read", document=path.name):
+        namespace = runpy.run_path(str(path))
+    return {v["filename"]: namespace["variant_links"](v) for v in namespace["ALL_VARIANTS"]}
+
+
+# Document name -> (path relative to the repo root, loader(store, path))
+DOCUMENTS: dict[str, tuple[str, Callable[["DocumentStore", Path], Any]]] = {
+    "readme": ("README.md", text_document(lambda text: text)),
+    "index": ("index.html", text_document(IndexModel.parse)),
+    "urls": (".", load_url_index),
+    "resume_links": ("resumes", load_resume_links),
+    "resume_variants": ("resumes/generate_resumes.py", load_resume_variants),
+}
+
+
+class DocumentStore:
+    """Loads each requested document once; checks share the loaded objects read-only."""
+
+    def __init__(self, root: Path = ROOT) -> None:
+        self.root = root
+        self._docs: dict[str, Any] = {}
+        self._texts: dict[Path, str] = {}
+
+    def read_text(self, path: Path) -> str:
+        """File text, read from disk at most once per store."""
+        if path not in self._texts:
+            with phase("read", document=str(path.relative_to(self.root))):
+                self._texts[path] = path.read_text(encoding="utf-8")
+        return self._texts[path]
+
+    def load(self, names: list[str]) -> None:
+        for name in names:
+            if name in self._docs:
+                continue
+            rel, loader = DOCUMENTS[name]
+            path = self.root / rel
+            if not path.exists():
+                raise FileNotFoundError(f"{path} not found")
+            self._docs[name] = loader(self, path)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._docs[name]
+
+
+@dataclass(frozen=True)
+class Check:
+    name: str
+    title: str
+    documents: tuple[str, ...]
+    run: Callable[[DocumentStore], list[Finding]]
+
+
+CHECKS: dict[str, Check] = {}
+
+
+def check(name: str, title: str, documents: tuple[str, ...]):
+    """Register ``func(docs) -> list[Finding]`` as check ``name`` reading ``documents``."""
+    def register(func: Callable[[DocumentStore], list[Finding]]):
+        CHECKS[name] = Check(name, title, documents, func)
+        return func
+    return register
+
+
+def run_checks(root: Path = ROOT, names: list[str] | None = None) -> list[Finding]:
+    """
+    Load the documents the selected checks need, run the checks concurrently
+    and return their findings in registration order.
+    """
+    selected = [c for c in CHECKS.values() if names is None or c.name in names]
+    store = DocumentStore(root)
+    store.load(list(dict.fromkeys(doc for c in selected for doc in c.documents)))
+
+    def run_one(c: Check) -> list[Finding]:
+        with phase(c.run.__name__, cprofile=True, check=c.name):
+            return c.run(store)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(selected))) as pool:
+        results = list(pool.map(run_one, selected))
+    return [finding for findings in results for finding in findings]
+
+
+# ---------------------------------------------------------------------------
+# 1. PR list consistency
+# ---------------------------------------------------------------------------
+
+@check("prs", "PR List", documents=("urls",))
+def check_prs(docs: DocumentStore) -> list[Finding]:
+    urls: UrlIndex = docs["urls"]
+    only_readme = urls.missing(PR_URL_RE, "README.md", "index.html")
+    only_index = urls.missing(PR_URL_RE, "index.html", "README.md")
+
+    findings = []
+    for url, o in only_readme:
+        findings.append(error("prs", f"PR in README.md but missing from index.html: {url}", o.file, o.line))
+    for url, o in only_index:
+        findings.append(error("prs", f"PR in index.html but missing from README.md: {url}", o.file, o.line))
 
     if not only_readme and not only_index:
-        print(f"  OK: PR lists match ({len(readme_prs)} PRs in both files)")
+        count = len(urls.urls("README.md", PR_URL_RE))
+        findings.append(ok("prs", f"PR lists match ({count} PRs in both files)"))
+    return findings
 
 
 # ---------------------------------------------------------------------------
@@ -76,109 +453,280 @@ CLOUD_PROJECTS = {
 }
 
 
-def parse_readme_statuses(readme: str) -> dict[str, str] | None:
+def parse_readme_statuses(readme: str) -> dict[str, tuple[str, int]] | None:
     """
     Extract deployment statuses from the cloud table in README.md.
-    Returns {normalized_name: 'live'|'deprovisioned'}, or None if no
+    Returns {normalized_name: ('live'|'deprovisioned', line)}, or None if no
     cloud status table is present (e.g. after README cleanup).
     """
-    statuses: dict[str, str] = {}
+    statuses: dict[str, tuple[str, int]] = {}
     # Match table rows: | Project Name | Live ... | or | Deprovisioned ... |
     for m in re.finditer(r"\|\s*([^|]+?)\s*\|\s*(Live|Deprovisioned)[^|]*\|", readme, re.IGNORECASE):
         name = normalize_project(m.group(1))
         status = m.group(2).lower()
         if name in CLOUD_PROJECTS:
-            statuses[name] = status
+            statuses[name] = (status, line_of(readme, m.start()))
     return statuses if statuses else None
 
 
-def parse_index_statuses(index: str) -> dict[str, str]:
+def parse_index_statuses(index: IndexModel) -> dict[str, tuple[str, int]] | None:
     """
-    Extract deployment statuses from the cloud section in index.html.
-    Looks for <h3>Project Name</h3> followed by Status: Live or Status: Deprovisioned.
-    Returns {normalized_name: 'live'|'deprovisioned'}.
+    Extract deployment statuses from the cloud section of the index model.
+    Each card's heading is the project name and its stack line carries
+    Status: Live or Status: Deprovisioned.
+    Returns {normalized_name: ('live'|'deprovisioned', line)}, or None if
+    there is no cloud section.
     """
-    statuses: dict[str, str] = {}
-    # Find cloud section block
-    cloud_match = re.search(r'id="cloud"(.*?)(?=<section|</main)', index, re.DOTALL)
-    if not cloud_match:
-        warn("Could not locate id=\"cloud\" section in index.html — skipping status check")
-        return statuses
-
-    cloud_block = cloud_match.group(1)
-
-    # Find each project card: <h3>Name</h3> ... Status: Live|Deprovisioned
-    for card in re.finditer(r"<h3>([^<]+)</h3>.*?Status:\s*(Live|Deprovisioned)", cloud_block, re.DOTALL):
-        name = normalize_project(card.group(1))
-        status = card.group(2).lower()
-        if name in CLOUD_PROJECTS:
-            statuses[name] = status
+    if "cloud" not in index.sections:
+        return None
+
+    statuses: dict[str, tuple[str, int]] = {}
+    for card in index.section_cards("cloud"):
+        name = normalize_project(card.heading)
+        status = card.status
+        if status and name in CLOUD_PROJECTS:
+            statuses[name] = (status, card.line)
 
     return statuses
 
 
-def check_deployment_statuses(readme: str, index: str) -> None:
-    readme_statuses = parse_readme_statuses(readme)
-    index_statuses = parse_index_statuses(index)
+@check("deployment-statuses", "Cloud Deployment Statuses", documents=("readme", "index"))
+def check_deployment_statuses(docs: DocumentStore) -> list[Finding]:
+    readme_statuses = parse_readme_statuses(docs["readme"])
+    index_statuses = parse_index_statuses(docs["index"])
+
+    findings = []
+    if index_statuses is None:
+        findings.append(warning("deployment-statuses",
+                                "Could not locate id=\"cloud\" section in index.html — skipping status check",
+                                "index.html"))
+        index_statuses = {}
 
     if readme_statuses is None:
-        print("  OK: README.md has no cloud status table (statuses managed in index.html only)")
-        return
+        findings.append(ok("deployment-statuses",
+                           "README.md has no cloud status table (statuses managed in index.html only)"))
+        return findings
 
     all_projects = set(CLOUD_PROJECTS.keys())
 
     for key in all_projects:
         label = CLOUD_PROJECTS[key]
-        r_status = readme_statuses.get(key)
-        i_status = index_statuses.get(key)
+        r_status, r_line = readme_statuses.get(key, (None, None))
+        i_status, i_line = index_statuses.get(key, (None, None))
 
         if r_status is None and i_status is None:
-            warn(f"{label}: not found in either file's cloud section")
+            findings.append(warning("deployment-statuses", f"{label}: not found in either file's cloud section"))
         elif r_status is None:
-            warn(f"{label}: found in index.html ({i_status}) but not in README.md cloud table")
+            findings.append(warning("deployment-statuses",
+                                    f"{label}: found in index.html ({i_status}) but not in README.md cloud table",
+                                    "index.html", i_line))
         elif i_status is None:
-            warn(f"{label}: found in README.md ({r_status}) but not in index.html cloud section")
+            findings.append(warning("deployment-statuses",
+                                    f"{label}: found in README.md ({r_status}) but not in index.html cloud section",
+                                    "README.md", r_line))
         elif r_status != i_status:
-            err(f"{label}: README.md says '{r_status}' but index.html says '{i_status}'")
+            findings.append(error("deployment-statuses",
+                                  f"{label}: README.md says '{r_status}' but index.html says '{i_status}'",
+                                  "README.md", r_line))
         else:
-            print(f"  OK: {label} -> {r_status}")
+            findings.append(ok("deployment-statuses", f"{label} -> {r_status}"))
+    return findings
 
 
 # ---------------------------------------------------------------------------
-# Main
+# 3. Resume PDF links
 # ---------------------------------------------------------------------------
 
-def main() -> int:
-    if not README.exists():
-        print(f"ERROR: {README} not found", file=sys.stderr)
-        return 1
-    if not INDEX.exists():
-        print(f"ERROR: {INDEX} not found", file=sys.stderr)
-        return 1
+@check("resume-links", "Resume PDF Links", documents=("urls", "resume_links", "resume_variants"))
+def check_resume_links(docs: DocumentStore) -> list[Finding]:
+    urls: UrlIndex = docs["urls"]
+    scan: pdf_links.PdfLinkScan = docs["resume_links"]
+    variants: dict[str, list[str]] = docs["resume_variants"]
+
+    def seen_at(url: str) -> str:
+        """Where else the published documents link ``url``, for the message."""
+        found = urls.where(url)
+        return f" (linked from {found[0].file}:{found[0].line})" if found else ""
+
+    findings = []
+    for name, links in scan.links.items():
+        rel = f"resumes/{name}"
+        for url in links:
+            if PR_URL_RE.fullmatch(url):
+                if not urls.contains(url, "index.html"):
+                    findings.append(error("resume-links",
+                                          f"{name} links a PR missing from index.html: {url}{seen_at(url)}", rel))
+            elif PROJECT_URL_RE.fullmatch(canonical_url(url)) and not urls.contains(url, "index.html"):
+                findings.append(warning("resume-links",
+                                        f"{name} links a project repo not linked from index.html: "
+                                        f"{url}{seen_at(url)}", rel))
+        expected = variants.get(name)
+        if expected is not None and sorted(expected) != sorted(links):
+            findings.append(warning("resume-links",
+                                    f"{name} is stale: its links differ from generate_resumes.py "
+                                    f"(regenerate the PDF)", rel))
+
+    missing = sorted(set(variants) - set(scan.links))
+    for name in missing:
+        findings.append(warning("resume-links", f"{name} is defined in generate_resumes.py but not built",
+                                "resumes/generate_resumes.py"))
+
+    total = sum(len(links) for links in scan.links.values())
+    cached = len(scan.links) - scan.parsed
+    findings.append(ok("resume-links", f"{len(scan.links)} resume PDFs, {total} links "
+                                       f"({scan.parsed} parsed, {cached} from cache)"))
+    return findings
 
-    readme = README.read_text(encoding="utf-8")
-    index = INDEX.read_text(encoding="utf-8")
 
-    print("=== PR List ===")
-    check_prs(readme, index)
+# ---------------------------------------------------------------------------
+# 4. Links shared by the published documents
+# ---------------------------------------------------------------------------
 
-    print("\n=== Cloud Deployment Statuses ===")
-    check_deployment_statuses(readme, index)
+SITE_URL = "https://jmahotiedu.github.io/"
+SITE_REPO = "jmahotiedu.github.io"
+REDIRECT_PAGES = ("jmahotiedu.html", "jmahotiedu/index.html")
+
+
+@check("published-links", "Published Links", documents=("urls", "resume_links"))
+def check_published_links(docs: DocumentStore) -> list[Finding]:
+    urls: UrlIndex = docs["urls"]
+    pdfs = set(docs["resume_links"].links)
+
+    findings = []
+    # Project repos: README.md and index.html should link the same ones.
+    drift = [("README.md", "index.html"), ("index.html", "README.md")]
+    for present_in, absent_from in drift:
+        for url, o in urls.missing(PROJECT_URL_RE, present_in, absent_from):
+            findings.append(warning("published-links",
+                                    f"Project repo linked from {present_in} but not {absent_from}: {url}",
+                                    o.file, o.line))
+    shared = urls.urls("README.md", PROJECT_URL_RE) & urls.urls("index.html", PROJECT_URL_RE)
+    findings.append(ok("published-links", f"{len(shared)} project repos linked from both README.md and index.html"))
+
+    # Resume downloads: this repo's raw/main/resumes/<pdf>, and the PDF must exist.
+    downloads = 0
+    for rel in PUBLISHED_DOCUMENTS:
+        for url in sorted(urls.urls(rel, RESUME_DOWNLOAD_RE)):
+            repo, pdf = RESUME_DOWNLOAD_RE.fullmatch(url).groups()
+            for o in urls.where(url, rel):
+                downloads += 1
+                if pdf not in pdfs:
+                    findings.append(error("published-links", f"Linked resume is not in resumes/: {pdf}",
+                                          o.file, o.line))
+                elif repo != SITE_REPO:
+                    findings.append(warning("published-links",
+                                            f"{pdf} is linked from jmahotiedu/{repo} instead of "
+                                            f"jmahotiedu/{SITE_REPO}", o.file, o.line))
+    findings.append(ok("published-links", f"{downloads} resume download links checked"))
+
+    # Redirect pages must all point at the site itself.
+    site = canonical_url(SITE_URL)
+    for rel in REDIRECT_PAGES:
+        if rel not in urls.files:
+            continue
+        targets = urls.urls(rel)
+        for url in sorted(targets - {site}):
+            o = urls.first(url, rel)
+            findings.append(error("published-links", f"Redirect target is not {SITE_URL}: {url}",
+                                  o.file, o.line))
+        if site not in targets:
+            findings.append(error("published-links", f"{rel} does not redirect to {SITE_URL}", rel))
+        elif targets == {site}:
+            findings.append(ok("published-links", f"{rel} redirects to {SITE_URL}"))
+    if not urls.contains(SITE_URL, "README.md"):
+        findings.append(warning("published-links", f"README.md does not link the portfolio site {SITE_URL}",
+                                "README.md"))
+    return findings
 
-    if WARNINGS:
-        print("\n=== Warnings ===")
-        for w in WARNINGS:
-            print(w)
 
-    if ERRORS:
-        print("\n=== Failures ===")
-        for e in ERRORS:
-            print(e)
-        print(f"\nFAILED: {len(ERRORS)} error(s). README.md and index.html are out of sync.")
-        return 1
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
 
-    print("\nPASSED: README.md and index.html are consistent.")
-    return 0
+def github_escape(value: str) -> str:
+    return value.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def location(f: Finding) -> str:
+    """``file:line: `` (or ``file: ``) prefix for a finding that points at a document."""
+    if not f.file:
+        return ""
+    return f"{f.file}:{f.line}: " if f.line else f"{f.file}: "
+
+
+def format_text(findings: list[Finding]) -> str:
+    """The classic report: OK lines per check, then warnings, failures and a verdict."""
+    lines: list[str] = []
+    for c in CHECKS.values():
+        ran = [f for f in findings if f.check == c.name]
+        if not ran:
+            continue
+        if lines:
+            lines.append("")
+        lines.append(f"=== {c.title} ===")
+        lines.extend(f"  OK: {f.message}" for f in ran if f.severity == "ok")
+
+    warnings = [f for f in findings if f.severity == "warning"]
+    errors = [f for f in findings if f.severity == "error"]
+    if warnings:
+        lines.append("\n=== Warnings ===")
+        lines.extend(f"  WARN:  {location(f)}{f.message}" for f in warnings)
+    if errors:
+        lines.append("\n=== Failures ===")
+        lines.extend(f"  ERROR: {location(f)}{f.message}" for f in errors)
+        lines.append(f"\nFAILED: {len(errors)} error(s). The published documents are out of sync.")
+    else:
+        lines.append("\nPASSED: The published documents are consistent.")
+    return "\n".join(lines)
+
+
+def format_json(findings: list[Finding]) -> str:
+    counts = {severity: sum(f.severity == severity for f in findings) for severity in ("ok", "warning", "error")}
+    return json.dumps({
+        "passed": counts["error"] == 0,
+        "counts": counts,
+        "findings": [asdict(f) for f in findings],
+    }, indent=2)
+
+
+def format_github(findings: list[Finding]) -> str:
+    """GitHub Actions workflow commands, so problems annotate the offending lines."""
+    lines = []
+    for f in findings:
+        if f.severity == "ok":
+            continue
+        props = [f"title={CHECKS[f.check].title}"]
+        if f.file:
+            props.insert(0, f"file={f.file}")
+            if f.line:
+                props.insert(1, f"line={f.line}")
+        lines.append(f"::{f.severity} {','.join(props)}::{github_escape(f.message)}")
+    errors = sum(f.severity == "error" for f in findings)
+    lines.append(f"FAILED: {errors} error(s)." if errors else "PASSED: The published documents are consistent.")
+    return "\n".join(lines)
+
+
+FORMATTERS = {"text": format_text, "json": format_json, "github": format_github}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check that the published documents and resume PDFs agree.")
+    parser.add_argument("--format", choices=sorted(FORMATTERS), default="text", help="Report format (default: text).")
+    parser.add_argument("--check", action="append", choices=list(CHECKS), dest="checks",
+                        help="Run only this check; may be repeated.")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args(argv)
+    profiler = instrumentation.configure("check-consistency", args.profile, args.cprofile_dir)
+    try:
+        try:
+            findings = run_checks(ROOT, args.checks)
+        except FileNotFoundError as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 1
+        print(FORMATTERS[args.format](findings))
+        return 1 if any(f.severity == "error" for f in findings) else 0
+    finally:
+        profiler.finish()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Latency-aware health prober for the portfolio's live endpoints.
+
+For every endpoint in health/endpoints.json this takes N samples over fresh
+connections, recording DNS, connect (incl. TLS), time-to-first-byte and
+total time for each. An endpoint is healthy only if enough samples return
+the expected status *and* the p95 total latency is within its SLO, so a slow
+but technically-up service no longer counts as verified.
+
+One compact JSON line per endpoint per run is appended to
+health/history.jsonl; the p95 is also compared with the median p95 of recent
+history to flag latency regressions.
+
+In GitHub Actions the overall verdict is written to $GITHUB_OUTPUT
+(healthy, status, down, plus healthy_projects: a JSON list of the projects
+whose endpoints passed, which the workflow hands to rewrite_docs.py so only
+those get a new verified date) and a table to $GITHUB_STEP_SUMMARY.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import ssl
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).parent.parent
+CONFIG_PATH = ROOT / "health" / "endpoints.json"
+HISTORY_PATH = ROOT / "health" / "history.jsonl"
+
+USER_AGENT = "jmahotiedu-endpoint-health"
+TIMEOUT = 15.0
+DEFAULT_SAMPLES = 5
+DEFAULT_SLO_P95_MS = 1500.0
+DEFAULT_MIN_SUCCESS_RATIO = 0.8
+HISTORY_LIMIT_PER_ENDPOINT = 400
+BASELINE_WINDOW = 14
+REGRESSION_FACTOR = 1.5
+
+
+# ---------------------------------------------------------------------------
+# Sampling
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Sample:
+    status: int  # 0 when the request failed before a status line arrived
+    dns_ms: float = 0.0
+    connect_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    total_ms: float = 0.0
+    error: str = ""
+
+
+def _ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 1)
+
+
+def take_sample(url: str, timeout: float = TIMEOUT) -> Sample:
+    """One request over a fresh connection with per-phase timings."""
+    parts = urlsplit(url)
+    https = parts.scheme == "https"
+    host = parts.hostname or ""
+    port = parts.port or (443 if https else 80)
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    t0 = time.perf_counter()
+    sample = Sample(status=0)
+    sock = conn = None
+    try:
+        family, socktype, proto, _, address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0]
+        t_dns = time.perf_counter()
+        sample.dns_ms = _ms(t0, t_dns)
+
+        sock = socket.socket(family, socktype, proto)
+        sock.settimeout(timeout)
+        sock.connect(address)
+        if https:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+        t_connect = time.perf_counter()
+        sample.connect_ms = _ms(t_dns, t_connect)
+
+        conn_cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+        conn = conn_cls(host, port, timeout=timeout)
+        conn.sock = sock  # already connected; http.client will not reconnect
+        conn.request("GET", target, headers={"User-Agent": USER_AGENT, "Connection": "close"})
+        resp = conn.getresponse()
+        t_first = time.perf_counter()
+        sample.status = resp.status
+        sample.ttfb_ms = _ms(t_connect, t_first)
+        resp.read()
+        sample.total_ms = _ms(t0, time.perf_counter())
+    except (OSError, http.client.HTTPException) as exc:
+        sample.total_ms = _ms(t0, time.perf_counter())
+        sample.error = f"{type(exc).__name__}: {exc}"
+    finally:
+        # Until conn owns the socket (connect or TLS failed), close it here
+        if conn is not None:
+            conn.close()
+        elif sock is not None:
+            sock.close()
+    return sample
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile (same convention as numpy's default)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return round(ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower), 1)
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Endpoint:
+    name: str
+    url: str
+    project: str = ""
+    samples: int = DEFAULT_SAMPLES
+    expect_status: int = 200
+    slo_p95_ms: float = DEFAULT_SLO_P95_MS
+    min_success_ratio: float = DEFAULT_MIN_SUCCESS_RATIO
+
+
+@dataclass
+class Report:
+    endpoint: Endpoint
+    samples: list[Sample]
+    baseline_p95_ms: float | None = None
+    checked_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds"))
+
+    @property
+    def successes(self) -> list[Sample]:
+        return [s for s in self.samples if s.status == self.endpoint.expect_status]
+
+    @property
+    def success_ratio(self) -> float:
+        return len(self.successes) / len(self.samples) if self.samples else 0.0
+
+    def pct(self, attr: str, p: float) -> float:
+        return percentile([getattr(s, attr) for s in self.successes], p)
+
+    @property
+    def last_status(self) -> int:
+        return self.samples[-1].status if self.samples else 0
+
+    @property
+    def verdict(self) -> str:
+        """'healthy', 'slow' (up but over SLO) or 'down'."""
+        if self.success_ratio < self.endpoint.min_success_ratio:
+            return "down"
+        if self.pct("total_ms", 95) > self.endpoint.slo_p95_ms:
+            return "slow"
+        return "healthy"
+
+    @property
+    def regressed(self) -> bool:
+        return bool(self.baseline_p95_ms) and self.pct("total_ms", 95) > self.baseline_p95_ms * REGRESSION_FACTOR
+
+    def history_record(self) -> dict:
+        return {
+            "ts": self.checked_at,
+            "name": self.endpoint.name,
+            "verdict": self.verdict,
+            "status": self.last_status,
+            "ok": f"{len(self.successes)}/{len(self.samples)}",
+            "p50": self.pct("total_ms", 50),
+            "p95": self.pct("total_ms", 95),
+            "p99": self.pct("total_ms", 99),
+            "dns_p50": self.pct("dns_ms", 50),
+            "connect_p50": self.pct("connect_ms", 50),
+            "ttfb_p50": self.pct("ttfb_ms", 50),
+        }
+
+
+def load_endpoints(path: Path) -> list[Endpoint]:
+    return [Endpoint(**entry) for entry in json.loads(path.read_text(encoding="utf-8"))]
+
+
+def load_history(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def baseline_p95(history: list[dict], name: str) -> float | None:
+    recent = [h["p95"] for h in history if h.get("name") == name and h.get("verdict") != "down"][-BASELINE_WINDOW:]
+    return statistics.median(recent) if recent else None
+
+
+def save_history(path: Path, history: list[dict]) -> None:
+    """Rewrite history keeping only the newest HISTORY_LIMIT_PER_ENDPOINT lines per endpoint."""
+    kept: list[dict] = []
+    counts: dict[str, int] = {}
+    for record in reversed(history):
+        counts[record["name"]] = counts.get(record["name"], 0) + 1
+        if counts[record["name"]] <= HISTORY_LIMIT_PER_ENDPOINT:
+            kept.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps(record, separators=(",", ":")) for record in reversed(kept)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def probe(endpoint: Endpoint, timeout: float = TIMEOUT) -> list[Sample]:
+    return [take_sample(endpoint.url, timeout) for _ in range(max(1, endpoint.samples))]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def write_github_outputs(reports: list[Report]) -> None:
+    down = [r for r in reports if r.verdict != "healthy"]
+    output_path = os.environ.get("GITHUB_OUTPUT")
+    if output_path:
+        with open(output_path, "a", encoding="utf-8") as fh:
+            fh.write(f"healthy={'false' if down else 'true'}\n")
+            fh.write(f"status={down[0].last_status if down else reports[0].last_status}\n")
+            fh.write(f"down={','.join(r.endpoint.name for r in down)}\n")
+            fh.write(f"healthy_projects={json.dumps([r.endpoint.project for r in reports if r.verdict == 'healthy' and r.endpoint.project])}\n")
+
+    summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
+    if summary_path:
+        with open(summary_path, "a", encoding="utf-8") as fh:
+            fh.write("## Endpoint Health\n\n")
+            fh.write("| Endpoint | Verdict | OK | p50 ms | p95 ms | p99 ms | SLO p95 ms | TTFB p50 ms |\n")
+            fh.write("| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: |\n")
+            for r in reports:
+                rec = r.history_record()
+                flag = " (regressed)" if r.regressed else ""
+                fh.write(f"| {r.endpoint.name} | {r.verdict}{flag} | {rec['ok']} | {rec['p50']} | {rec['p95']} | "
+                         f"{rec['p99']} | {r.endpoint.slo_p95_ms:g} | {rec['ttfb_p50']} |\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Probe configured endpoints and record latency percentiles.")
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH, help="Endpoint list (default: health/endpoints.json).")
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH, help="History file (default: health/history.jsonl).")
+    parser.add_argument("--samples", type=int, default=None, help="Override the per-endpoint sample count.")
+    parser.add_argument("--no-history", action="store_true", help="Do not append to the history file.")
+    args = parser.parse_args(argv)
+
+    endpoints = load_endpoints(args.config)
+    history = load_history(args.history)
+
+    reports = []
+    for endpoint in endpoints:
+        if args.samples:
+            endpoint.samples = args.samples
+        report = Report(endpoint, probe(endpoint), baseline_p95(history, endpoint.name))
+        reports.append(report)
+
+        rec = report.history_record()
+        print(f"=== {endpoint.name} ({endpoint.url}) ===")
+        for i, s in enumerate(report.samples, 1):
+            detail = f" {s.error}" if s.error else ""
+            print(f"  sample {i}: status={s.status} dns={s.dns_ms}ms connect={s.connect_ms}ms "
+                  f"ttfb={s.ttfb_ms}ms total={s.total_ms}ms{detail}")
+        print(f"  ok={rec['ok']} p50={rec['p50']}ms p95={rec['p95']}ms p99={rec['p99']}ms "
+              f"(SLO p95 <= {endpoint.slo_p95_ms:g}ms)")
+        if report.baseline_p95_ms is not None:
+            marker = "REGRESSED" if report.regressed else "ok"
+            print(f"  baseline p95={report.baseline_p95_ms:.1f}ms -> {marker}")
+        print(f"  verdict: {report.verdict.upper()}\n")
+
+    if not args.no_history:
+        save_history(args.history, history + [r.history_record() for r in reports])
+
+    write_github_outputs(reports)
+    return 0 if all(r.verdict == "healthy" for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Opt-in phase timing and profiling shared by the portfolio scripts.
+
+Scripts wrap their work in named phases:
+
+    profiler = instrumentation.configure("check-consistency", args.profile, args.cprofile_dir)
+    with instrumentation.phase("read"):
+        ...
+    profiler.finish()
+
+When profiling is off (the default) ``phase()`` is a no-op and nothing is
+written, so normal output is unchanged. When it is on, every phase's wall time
+is recorded (nested phases keep their parent), and ``finish()`` writes a JSON
+report. Phases opened with ``cprofile=True`` can additionally be run under
+cProfile, one ``.prof`` dump per phase.
+
+Enable with the scripts' ``--profile [PATH]`` / ``--cprofile-dir DIR`` flags,
+or with the environment variables below (handy in CI, where the report can be
+uploaded as an artifact).
+"""
+
+import json
+import os
+import platform
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROFILE_ENV = "PORTFOLIO_PROFILE"  # report path, or "1" for the default path
+CPROFILE_ENV = "PORTFOLIO_CPROFILE_DIR"
+DEFAULT_REPORT = "profile-{script}.json"
+
+
+class Profiler:
+    def __init__(self, script: str, report_path: Path | None = None, cprofile_dir: Path | None = None) -> None:
+        self.script = script
+        self.report_path = report_path
+        self.cprofile_dir = cprofile_dir
+        self.phases: list[dict] = []
+        self._local = threading.local()  # per-thread stack of open phase indexes
+        self._lock = threading.Lock()
+        self._profiling = False
+        self._started = time.perf_counter()
+        self._started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    @property
+    def enabled(self) -> bool:
+        return self.report_path is not None
+
+    @property
+    def _stack(self) -> list[int]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def phase(self, name: str, cprofile: bool = False, **labels):
+        """
+        Time the enclosed block as phase ``name``; ``labels`` are recorded with
+        it. Phases may be opened from several threads; nesting is tracked per
+        thread, so a worker thread's phases are top-level and carry its name.
+        """
+        stack = self._stack
+        record = {
+            "name": name,
+            "labels": labels,
+            "thread": threading.current_thread().name,
+            "parent": stack[-1] if stack else None,
+            "depth": len(stack),
+            "start_ms": round((time.perf_counter() - self._started) * 1000, 3),
+        }
+        with self._lock:
+            self.phases.append(record)
+            stack.append(len(self.phases) - 1)
+
+        profile = None
+        # cProfile cannot nest, so only one requesting phase at a time is profiled.
+        if cprofile and self.cprofile_dir is not None:
+            with self._lock:
+                claimed = not self._profiling
+                self._profiling = True
+            if claimed:
+                import cProfile
+
+                profile = cProfile.Profile()
+                profile.enable()
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["ms"] = round((time.perf_counter() - started) * 1000, 3)
+            if profile is not None:
+                profile.disable()
+                record["cprofile"] = str(self._dump(profile, name, labels))
+                with self._lock:
+                    self._profiling = False
+            stack.pop()
+
+    def _dump(self, profile, name: str, labels: dict) -> Path:
+        self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+        parts = [self.script, name] + [str(value) for value in labels.values()]
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", "-".join(parts))
+        path = self.cprofile_dir / f"{slug}.prof"
+        profile.dump_stats(path)
+        return path
+
+    def report(self) -> dict:
+        summary: dict[str, dict] = {}
+        for record in self.phases:
+            entry = summary.setdefault(record["name"], {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] = round(entry["total_ms"] + record.get("ms", 0.0), 3)
+        return {
+            "script": self.script,
+            "started": self._started_at,
+            "argv": sys.argv[1:],
+            "python": platform.python_version(),
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "summary": summary,
+            "phases": self.phases,
+        }
+
+    def finish(self) -> None:
+        """Write the JSON report if profiling is enabled."""
+        if not self.enabled:
+            return
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+        print(f"Profile written to {self.report_path}", file=sys.stderr)
+
+
+_current = Profiler("disabled")
+
+
+def configure(script: str, profile: str | None = None, cprofile_dir: str | None = None) -> Profiler:
+    """
+    Install the process-wide profiler. ``profile`` is the --profile value
+    (a path, or "" for the default path); the environment variables apply
+    when the flags are not given.
+    """
+    global _current
+    if profile is None:
+        profile = os.environ.get(PROFILE_ENV) or None
+        if profile == "1":
+            profile = ""
+    cprofile_dir = cprofile_dir or os.environ.get(CPROFILE_ENV) or None
+
+    report_path = None
+    if profile is not None or cprofile_dir is not None:
+        report_path = Path(profile or DEFAULT_REPORT.format(script=script))
+    _current = Profiler(script, report_path, Path(cprofile_dir) if cprofile_dir else None)
+    return _current
+
+
+def current() -> Profiler:
+    return _current
+
+
+def phase(name: str, cprofile: bool = False, **labels):
+    """Phase on the installed profiler; a no-op context when profiling is off."""
+    if not _current.enabled:
+        return nullcontext()
+    return _current.phase(name, cprofile=cprofile, **labels)
+
+
+def add_arguments(parser) -> None:
+    """Add --profile and --cprofile-dir to an argparse parser."""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help=f"Write a JSON phase-timing report (default path: {DEFAULT_REPORT}; env: {PROFILE_ENV}).",
+    )
+    parser.add_argument(
+        "--cprofile-dir",
+        default=None,
+        metavar="DIR",
+        help=f"Also dump a cProfile .prof file per profiled phase into DIR (env: {CPROFILE_ENV}).",
+    )
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Concurrent link checker for README.md and index.html.
+
+Every external URL is checked with HEAD first (falling back to GET when the
+server rejects HEAD), redirects are followed, and 429/5xx responses are
+retried with exponential backoff. A timeout is final: there is no GET
+fallback and no retry after one, and each URL gets URL_BUDGET seconds in
+total across redirects, retries and backoff, so a dead host costs one
+timeout rather than several. Requests run on asyncio with a global
+concurrency cap plus a per-host cap, and keep-alive connections are pooled
+per host so TCP/TLS handshakes are reused across URLs.
+
+Results are cached per URL in .link-check-cache.json with the status,
+ETag/Last-Modified and check time. Within a URL's TTL (chosen by the first
+matching CACHE_TTLS pattern) the cached result is reused outright; after it
+the URL is revalidated with If-None-Match / If-Modified-Since, and a 304
+keeps the cached result. URLs that failed last time are always rechecked.
+
+Broken links are written to link-check-failures.json (consumed by the
+link-check workflow) and the script exits 1.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import re
+import ssl
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+ROOT = Path(__file__).parent.parent
+FILES = [ROOT / "README.md", ROOT / "index.html"]
+FAILURES_PATH = Path("link-check-failures.json")
+CACHE_PATH = ROOT / ".link-check-cache.json"
+CACHE_VERSION = 1
+
+# Skip these known-flaky or rate-limited domains
+SKIP_PATTERNS = [
+    "linkedin.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+]
+
+URL_PATTERN = re.compile(r"https?://[A-Za-z0-9._~:/?#\[\]@!$&'()*+,;%=-]+")
+
+USER_AGENT = "Mozilla/5.0 (link-check)"
+TIMEOUT = 15.0
+URL_BUDGET = 30.0
+GLOBAL_LIMIT = 16
+PER_HOST_LIMIT = 4
+MAX_REDIRECTS = 10
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 1.0
+MAX_RETRY_AFTER = 30.0
+
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+# HEAD responses that usually mean "this server does not do HEAD properly"
+HEAD_FALLBACK_CODES = {400, 403, 404, 405, 406, 500, 501}
+DAY = 24 * 60 * 60
+# (regex searched against the URL, TTL in seconds); first match wins
+CACHE_TTLS = [
+    (r"^https://github\.com/[^/]+/[^/]+/pull/\d+", 14 * DAY),
+    (r"^https://github\.com/", 7 * DAY),
+    (r"\.amazonaws\.com", 0),
+    (r"", 1 * DAY),
+]
+
+# Errors that mean a pooled keep-alive socket was closed by the server
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+# ---------------------------------------------------------------------------
+# URL discovery
+# ---------------------------------------------------------------------------
+
+def extract_urls(files: list[Path]) -> list[str]:
+    """Return unique, non-skipped URLs in first-seen order."""
+    seen: set[str] = set()
+    urls: list[str] = []
+    for f in files:
+        for m in URL_PATTERN.finditer(f.read_text(encoding="utf-8")):
+            url = m.group(0).rstrip(")")  # strip trailing ) from markdown
+            if url in seen:
+                continue
+            if any(p in url for p in SKIP_PATTERNS):
+                continue
+            seen.add(url)
+            urls.append(url)
+    return urls
+
+
+# ---------------------------------------------------------------------------
+# HTTP plumbing
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Response:
+    status: int
+    headers: dict[str, str]
+
+
+@dataclass
+class Result:
+    url: str
+    code: str
+    attempts: int = 1
+    error: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    source: str = "fetched"  # fetched | cached | revalidated
+
+    @property
+    def ok(self) -> bool:
+        return self.code.startswith("2") or self.code.startswith("3")
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def ttl_for(url: str, ttls: list[tuple[str, int]]) -> int:
+    for pattern, seconds in ttls:
+        if re.search(pattern, url):
+            return seconds
+    return 0
+
+
+class LinkCache:
+    """JSON store of the last result per URL."""
+
+    def __init__(self, path: Path, ttls: list[tuple[str, int]] | None = None) -> None:
+        self.path = path
+        self.ttls = ttls if ttls is not None else CACHE_TTLS
+        self.entries: dict[str, dict] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("urls", {})
+        except (OSError, ValueError):
+            pass
+
+    def lookup(self, url: str, now: datetime) -> tuple[dict | None, bool]:
+        """
+        Return (entry, fresh). Failed entries are never returned, so they are
+        always rechecked with an unconditional request.
+        """
+        entry = self.entries.get(url)
+        if not entry or not str(entry.get("status", "")).startswith(("2", "3")):
+            return None, False
+        try:
+            checked_at = datetime.fromisoformat(entry["checked_at"])
+        except (KeyError, ValueError):
+            return None, False
+        age = (now - checked_at).total_seconds()
+        return entry, age < ttl_for(url, self.ttls)
+
+    def store(self, result: Result, now: datetime) -> None:
+        self.entries[result.url] = {
+            "status": result.code,
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "checked_at": now.isoformat(timespec="seconds"),
+        }
+
+    def save(self, keep: set[str]) -> None:
+        """Write the cache, dropping URLs that no longer appear in the docs."""
+        urls = {url: entry for url, entry in sorted(self.entries.items()) if url in keep}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"version": CACHE_VERSION, "urls": urls}, indent=2) + "\n", encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+def conditional_headers(entry: dict) -> dict[str, str]:
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+HostKey = tuple[str, str, int]
+
+
+def host_key(url: str) -> HostKey:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    port = parts.port or (443 if scheme == "https" else 80)
+    return scheme, (parts.hostname or "").lower(), port
+
+
+class ConnectionPool:
+    """
+    Idle keep-alive connections per (scheme, host, port).
+
+    acquire/release are only called from the event-loop thread; the
+    connection itself is then used by exactly one worker thread at a time.
+    """
+
+    def __init__(self, timeout: float = TIMEOUT) -> None:
+        self.timeout = timeout
+        self._idle: dict[HostKey, list[http.client.HTTPConnection]] = defaultdict(list)
+        self._ssl = ssl.create_default_context()
+        self.opened = 0
+
+    def has_idle(self, key: HostKey) -> bool:
+        return bool(self._idle.get(key))
+
+    def acquire(self, key: HostKey) -> http.client.HTTPConnection:
+        idle = self._idle[key]
+        if idle:
+            return idle.pop()
+        scheme, host, port = key
+        self.opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, key: HostKey, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            self._idle[key].append(conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        for conns in self._idle.values():
+            for conn in conns:
+                conn.close()
+        self._idle.clear()
+
+
+def send_request(conn: http.client.HTTPConnection, method: str, url: str,
+                 headers: dict[str, str], timeout: float) -> tuple[Response, bool]:
+    """Blocking request on ``conn``; returns the response and whether conn can be reused."""
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)  # pooled connection: the socket already exists
+    parts = urlsplit(url)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    conn.request(method, target, headers={"User-Agent": USER_AGENT, "Accept": "*/*", **headers})
+    resp = conn.getresponse()
+    resp.read()  # drain so the socket can carry the next request
+    response = Response(resp.status, {k.lower(): v for k, v in resp.getheaders()})
+    return response, not resp.will_close
+
+
+# ---------------------------------------------------------------------------
+# Checker
+# ---------------------------------------------------------------------------
+
+class Budget:
+    """
+    Wall-clock allowance for one URL. The clock starts at the URL's first
+    request, so time spent queued behind the concurrency limits is free.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.deadline: float | None = None
+
+    def remaining(self) -> float:
+        now = time.monotonic()
+        if self.deadline is None:
+            self.deadline = now + self.seconds
+        return self.deadline - now
+
+
+class LinkChecker:
+    def __init__(self, global_limit: int = GLOBAL_LIMIT, per_host_limit: int = PER_HOST_LIMIT,
+                 timeout: float = TIMEOUT, max_retries: int = MAX_RETRIES,
+                 backoff: float = BACKOFF_SECONDS, url_budget: float = URL_BUDGET) -> None:
+        self.global_limit = global_limit
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.url_budget = url_budget
+        self.pool = ConnectionPool(timeout)
+        self.requests_sent = 0
+        self._global: asyncio.Semaphore | None = None
+        self._hosts: dict[HostKey, asyncio.Semaphore] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def request(self, method: str, url: str, headers: dict[str, str] | None = None,
+                      budget: Budget | None = None) -> Response:
+        """
+        One HTTP exchange, bounded by the global and per-host limits. The host
+        slot is taken first, so requests queued behind a busy host (usually
+        github.com) do not hold global slots that other hosts could use. With a
+        ``budget`` the socket timeout is capped at the time the URL has left.
+        """
+        key = host_key(url)
+        host_sem = self._hosts.setdefault(key, asyncio.Semaphore(self.per_host_limit))
+        loop = asyncio.get_running_loop()
+        async with host_sem:
+            async with self._global:
+                while True:
+                    timeout = self.pool.timeout
+                    if budget is not None:
+                        timeout = min(timeout, budget.remaining())
+                        if timeout <= 0:
+                            raise TimeoutError(f"URL budget of {budget.seconds:g}s exhausted")
+                    pooled = self.pool.has_idle(key)
+                    conn = self.pool.acquire(key)
+                    self.requests_sent += 1
+                    try:
+                        response, reusable = await loop.run_in_executor(
+                            self._executor, send_request, conn, method, url, headers or {}, timeout
+                        )
+                    except STALE_CONNECTION_ERRORS:
+                        self.pool.release(key, conn, reusable=False)
+                        if pooled:
+                            continue  # server dropped an idle keep-alive socket; retry on a fresh one
+                        raise
+                    except BaseException:
+                        self.pool.release(key, conn, reusable=False)
+                        raise
+                    self.pool.release(key, conn, reusable)
+                    return response
+
+    async def fetch(self, method: str, url: str, headers: dict[str, str] | None = None,
+                    budget: Budget | None = None) -> tuple[Response, str]:
+        """Follow redirects for ``method``; returns the final response and URL."""
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self.request(method, current, headers, budget)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response, current
+            current = urljoin(current, location)
+        return response, current
+
+    async def probe(self, url: str, headers: dict[str, str] | None = None,
+                    budget: Budget | None = None) -> Response:
+        """
+        HEAD first, then GET if the server does not answer HEAD usefully. A
+        timeout is raised as-is: a host too slow for HEAD will not answer GET.
+        """
+        try:
+            response, _ = await self.fetch("HEAD", url, headers, budget)
+            if response.status not in HEAD_FALLBACK_CODES:
+                return response
+        except TimeoutError:
+            raise
+        except (OSError, http.client.HTTPException):
+            pass
+        response, _ = await self.fetch("GET", url, headers, budget)
+        return response
+
+    def retry_delay(self, attempt: int, response: Response | None) -> float:
+        retry_after = response.headers.get("retry-after", "") if response else ""
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER)
+        return self.backoff * (2 ** attempt)
+
+    async def check(self, url: str, cached: dict | None = None) -> Result:
+        """
+        Check ``url``. With a ``cached`` entry the request is conditional and a
+        304 keeps the cached status and validators. Timeouts are not retried,
+        and no retry starts once its backoff would overrun the URL budget.
+        """
+        headers = conditional_headers(cached) if cached else {}
+        budget = Budget(self.url_budget)
+        attempts = 0
+        while True:
+            attempts += 1
+            response = None
+            error = ""
+            timed_out = False
+            try:
+                response = await self.probe(url, headers, budget)
+                code = str(response.status)
+            except (OSError, http.client.HTTPException) as exc:
+                code = "000"
+                error = f"{type(exc).__name__}: {exc}"
+                timed_out = isinstance(exc, TimeoutError)
+
+            retryable = not timed_out and (code == "000" or code == "429" or code.startswith("5"))
+            if not retryable or attempts > self.max_retries:
+                break
+            delay = self.retry_delay(attempts - 1, response)
+            if delay >= budget.remaining():
+                break
+            await asyncio.sleep(delay)
+
+        if cached and code == "304":
+            return Result(url, cached["status"], attempts, etag=cached.get("etag", ""),
+                          last_modified=cached.get("last_modified", ""), source="revalidated")
+        result = Result(url, code, attempts, error)
+        if response is not None:
+            result.etag = response.headers.get("etag", "")
+            result.last_modified = response.headers.get("last-modified", "")
+        return result
+
+    async def check_cached(self, url: str, cache: LinkCache | None, now: datetime) -> Result:
+        if cache is None:
+            return await self.check(url)
+        entry, fresh = cache.lookup(url, now)
+        if entry and fresh:
+            return Result(url, entry["status"], 0, etag=entry.get("etag", ""),
+                          last_modified=entry.get("last_modified", ""), source="cached")
+        result = await self.check(url, entry)
+        cache.store(result, now)
+        return result
+
+    async def check_all(self, urls: list[str], cache: LinkCache | None = None) -> list[Result]:
+        """Check every URL concurrently; results keep the input order."""
+        self._global = asyncio.Semaphore(self.global_limit)
+        self._executor = ThreadPoolExecutor(max_workers=self.global_limit)
+        now = utcnow()
+        try:
+            return list(await asyncio.gather(*(self.check_cached(url, cache, now) for url in urls)))
+        finally:
+            self.pool.close()
+            self._executor.shutdown(wait=False)
+
+
+def parse_ttl(value: str) -> tuple[str, int]:
+    pattern, sep, seconds = value.rpartition("=")
+    if not sep or not seconds.isdigit():
+        raise argparse.ArgumentTypeError(f"expected PATTERN=SECONDS, got {value!r}")
+    return pattern, int(seconds)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check external links in README.md and index.html.")
+    parser.add_argument("files", nargs="*", type=Path, default=FILES, help="Files to scan (default: README.md index.html).")
+    parser.add_argument("--concurrency", type=int, default=GLOBAL_LIMIT, help="Global in-flight request cap.")
+    parser.add_argument("--per-host", type=int, default=PER_HOST_LIMIT, help="In-flight request cap per host.")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT, help="Per-request timeout in seconds.")
+    parser.add_argument("--url-budget", type=float, default=URL_BUDGET,
+                        help="Total seconds per URL across redirects, retries and backoff.")
+    parser.add_argument("--output", type=Path, default=FAILURES_PATH, help="Where to write failures JSON.")
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH, help="Result cache file (default: .link-check-cache.json).")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache.")
+    parser.add_argument("--ttl", type=parse_ttl, action="append", default=[], metavar="PATTERN=SECONDS",
+                        help="Override the cache TTL for URLs matching PATTERN (regex); may be repeated.")
+    args = parser.parse_args(argv)
+
+    urls = extract_urls(args.files)
+    cache = None if args.no_cache else LinkCache(args.cache, args.ttl + CACHE_TTLS)
+    checker = LinkChecker(args.concurrency, args.per_host, args.timeout, url_budget=args.url_budget)
+    results = asyncio.run(checker.check_all(urls, cache))
+    if cache is not None:
+        cache.save(set(urls))
+
+    failed = []
+    for result in results:
+        if result.ok:
+            tag = "" if result.source == "fetched" else f" ({result.source})"
+            print(f"  OK   [{result.code}] {result.url}{tag}")
+        else:
+            failed.append({"url": result.url, "code": result.code})
+            detail = f" ({result.error})" if result.error else ""
+            print(f"  FAIL [{result.code}] {result.url}{detail}")
+
+    cached = sum(1 for r in results if r.source == "cached")
+    revalidated = sum(1 for r in results if r.source == "revalidated")
+    print(f"\nChecked {len(urls)} URL(s) with {checker.requests_sent} request(s) "
+          f"over {checker.pool.opened} connection(s); {cached} served from cache, "
+          f"{revalidated} revalidated with 304.")
+
+    if failed:
+        print(f"Failed: {len(failed)} URL(s)")
+        with open(args.output, "w") as fh:
+            json.dump(failed, fh, indent=2)
+        return 1
+
+    print("All links OK.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
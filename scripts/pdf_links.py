@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Stream link annotations out of PDFs.
+
+Walks a PDF's top-level ``N G obj ... endobj`` structure and collects the
+/URI of every link action. Stream bodies (page content, fonts, images) are
+skipped by their /Length rather than decoded, so no text is extracted. The
+exception is compressed object streams (/Type /ObjStm, FlateDecode), which are
+inflated and scanned so PDFs from other producers work too.
+
+Results are cached in .pdf-link-cache.json keyed by PDF content hash. A
+size+mtime match skips even the hash, so re-scanning unchanged PDFs reads no
+PDF bytes at all.
+
+Usage:
+  python3 scripts/pdf_links.py                  # every PDF in resumes/
+  python3 scripts/pdf_links.py resumes/X.pdf --no-cache
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+RESUMES_DIR = ROOT / "resumes"
+CACHE_PATH = ROOT / ".pdf-link-cache.json"
+CACHE_VERSION = 1
+
+OBJ_RE = re.compile(rb"(\d+)\s+(\d+)\s+obj\b")
+STREAM_RE = re.compile(rb"(?<!end)stream\r?\n")
+LENGTH_RE = re.compile(rb"/Length\s+(\d+)(?!\s+\d+\s+R)")
+URI_RE = re.compile(rb"/URI\s*(\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>)", re.DOTALL)
+ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+# ---------------------------------------------------------------------------
+# Extraction
+# ---------------------------------------------------------------------------
+
+def iter_objects(data):
+    """Yield (dictionary bytes, raw stream bytes or None) for each indirect object."""
+    pos = 0
+    while True:
+        m = OBJ_RE.search(data, pos)
+        if not m:
+            return
+        start = m.end()
+        end = data.find(b"endobj", start)
+        if end == -1:
+            return
+        stream = STREAM_RE.search(data, start, end)
+        if stream is None:
+            yield data[start:end], None
+            pos = end + len(b"endobj")
+            continue
+
+        head = data[start:stream.start()]
+        body_start = stream.end()
+        length = LENGTH_RE.search(head)
+        if length:
+            body_end = body_start + int(length.group(1))
+        else:  # indirect /Length: fall back to the terminator
+            body_end = data.find(b"endstream", body_start)
+        yield head, data[body_start:body_end]
+        end = data.find(b"endobj", body_end)
+        if end == -1:
+            return
+        pos = end + len(b"endobj")
+
+
+def decode_pdf_string(token: bytes) -> str:
+    """Decode a PDF literal ``(...)`` or hex ``<...>`` string."""
+    if token.startswith(b"<"):
+        digits = re.sub(rb"\s", b"", token[1:-1])
+        if len(digits) % 2:
+            digits += b"0"
+        return bytes.fromhex(digits.decode("ascii")).decode("latin-1")
+
+    out = bytearray()
+    body = token[1:-1]
+    i = 0
+    while i < len(body):
+        ch = body[i:i + 1]
+        if ch != b"\\":
+            out += ch
+            i += 1
+            continue
+        nxt = body[i + 1:i + 2]
+        octal = re.match(rb"[0-7]{1,3}", body[i + 1:i + 4])
+        if octal:
+            out.append(int(octal.group(0), 8) & 0xFF)
+            i += 1 + len(octal.group(0))
+        elif nxt in (b"\n", b"\r"):  # line continuation
+            i += 2
+        else:
+            out += ESCAPES.get(nxt, nxt)
+            i += 2
+    return out.decode("latin-1")
+
+
+def extract_links(path: Path) -> list[str]:
+    """Unique /URI targets in ``path``, in document order."""
+    if path.stat().st_size == 0:
+        return []
+    links: dict[str, None] = {}
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for head, body in iter_objects(data):
+            chunks = [head]
+            if body is not None and b"/ObjStm" in head and b"/FlateDecode" in head:
+                try:
+                    chunks.append(zlib.decompress(body))
+                except zlib.error:
+                    pass
+            for chunk in chunks:
+                for m in URI_RE.finditer(chunk):
+                    links[decode_pdf_string(m.group(1))] = None
+    return list(links)
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class PdfLinkScan:
+    links: dict[str, list[str]] = field(default_factory=dict)  # filename -> URIs
+    parsed: int = 0  # PDFs whose objects were actually walked this run
+
+
+class PdfLinkCache:
+    """
+    {"version": 1, "hashes": {sha256: [uri, ...]}, "files": {name: [size, mtime_ns, sha256]}}
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.hashes: dict[str, list[str]] = {}
+        self.files: dict[str, list] = {}
+        self.dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION:
+            self.hashes = data.get("hashes", {})
+            self.files = data.get("files", {})
+
+    def links(self, pdf: Path) -> tuple[list[str], bool]:
+        """Return (links, parsed) for ``pdf``; parsed is False on a cache hit."""
+        st = pdf.stat()
+        known = self.files.get(pdf.name)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns and known[2] in self.hashes:
+            return self.hashes[known[2]], False
+
+        sha = file_sha256(pdf)
+        self.files[pdf.name] = [st.st_size, st.st_mtime_ns, sha]
+        self.dirty = True
+        if sha in self.hashes:
+            return self.hashes[sha], False
+        links = extract_links(pdf)
+        self.hashes[sha] = links
+        return links, True
+
+    def save(self, keep: set[str]) -> None:
+        """Persist entries for the PDFs in ``keep``; hashes no file uses are dropped."""
+        if self.path is None:
+            return
+        files = {name: entry for name, entry in self.files.items() if name in keep}
+        hashes = {sha: self.hashes[sha] for _, _, sha in files.values() if sha in self.hashes}
+        if not self.dirty and files == self.files and hashes == self.hashes:
+            return
+        data = {"version": CACHE_VERSION, "hashes": dict(sorted(hashes.items())), "files": dict(sorted(files.items()))}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def scan(pdfs: list[Path], cache_path: Path | None = CACHE_PATH) -> PdfLinkScan:
+    """Links for each PDF, served from the cache where the content is unchanged."""
+    cache = PdfLinkCache(cache_path)
+    result = PdfLinkScan()
+    for pdf in pdfs:
+        links, parsed = cache.links(pdf)
+        result.links[pdf.name] = links
+        result.parsed += parsed
+    cache.save({pdf.name for pdf in pdfs})
+    return result
+
+
+def scan_dir(pdf_dir: Path = RESUMES_DIR, cache_path: Path | None = CACHE_PATH) -> PdfLinkScan:
+    return scan(sorted(pdf_dir.glob("*.pdf")), cache_path)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="List link annotations in PDFs.")
+    parser.add_argument("pdfs", nargs="*", type=Path, help="PDFs to scan (default: every PDF in resumes/).")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and do not update {CACHE_PATH.name}.")
+    args = parser.parse_args(argv)
+
+    pdfs = args.pdfs or sorted(RESUMES_DIR.glob("*.pdf"))
+    result = scan(pdfs, None if args.no_cache else CACHE_PATH)
+    for name, links in result.links.items():
+        print(f"{name} ({len(links)} link(s))")
+        for link in links:
+            print(f"  {link}")
+    print(f"\nScanned {len(pdfs)} PDF(s); parsed {result.parsed}, {len(pdfs) - result.parsed} from cache.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
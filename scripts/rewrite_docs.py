@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+One-pass rewriter for automated edits to README.md, index.html and friends.
+
+Each automated edit is a registered rule that maps a document's text to new
+text. The engine loads every document the selected rules touch exactly once,
+runs the rules over it in registration order, and writes the file atomically
+only when the bytes changed. It reports exactly which rules fired on which
+file, so one workflow run can apply several rules and make one commit.
+
+Rules:
+  verified-date  "Live (verified <date>)" / "Status: Live | Verified: <date>"
+  cache-buster   resumes/<pdf>?v=<content hash> links (scripts/cache_bust.py)
+  graduation     post-graduation availability wording (no-op before GRADUATION_DATE)
+  pr-stats       PR statuses, diff stats and Merged/Open tables (scripts/sync_pr_status.py)
+
+Usage:
+  python3 scripts/rewrite_docs.py --rule cache-buster --rule pr-stats
+  python3 scripts/rewrite_docs.py --rule verified-date --verified-date today
+  python3 scripts/rewrite_docs.py --rule verified-date --verified-date today \
+      --verified-projects '["Retail Forecast Dashboard"]'
+  python3 scripts/rewrite_docs.py --all --dry-run
+
+The Rewrite Docs workflow runs --all on a schedule and after resume PDF
+pushes, so every automated edit lands in one commit.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import cached_property
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import cache_bust  # noqa: E402
+import sync_pr_status  # noqa: E402
+
+ROOT = Path(__file__).parent.parent
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class Context:
+    """Inputs shared by rules; expensive ones are computed once, on first use."""
+
+    def __init__(self, root: Path = ROOT, verified_date: str | None = None,
+                 verified_projects: list[str] | None = None, today: date | None = None) -> None:
+        self.root = root
+        self.today = today or datetime.now(timezone.utc).date()
+        self.verified_date = verified_date
+        # None verifies every live project; a list limits the verified-date rule to those
+        self.verified_projects = verified_projects
+
+    @cached_property
+    def pdf_hashes(self) -> dict[str, str]:
+        return cache_bust.pdf_hashes(self.root / "resumes")
+
+    @cached_property
+    def pr_info(self) -> dict:
+        token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+        if not token:
+            raise RuntimeError("pr-stats needs GITHUB_TOKEN or GH_TOKEN")
+        texts = [(self.root / name).read_bytes().decode("utf-8") for name in ("README.md", "index.html")]
+        keys = sync_pr_status.discover_prs(*texts)
+        client = sync_pr_status.GraphQLClient(token)
+        info = sync_pr_status.fetch_pr_info(client, keys)
+        return info
+
+
+RuleFunc = Callable[[str, str, Context], str]
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    files: tuple[str, ...]
+    apply: RuleFunc
+
+
+RULES: dict[str, Rule] = {}
+
+
+def rule(name: str, files: tuple[str, ...]) -> Callable[[RuleFunc], RuleFunc]:
+    """Register ``func(path, text, ctx) -> text`` as rule ``name`` for ``files``."""
+    def register(func: RuleFunc) -> RuleFunc:
+        RULES[name] = Rule(name, files, func)
+        return func
+    return register
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def apply_rules(names: list[str], ctx: Context, write: bool = True) -> dict[str, list[str]]:
+    """
+    Run the named rules and return {relative_path: [rules that changed it]}.
+    Each document is read once and written at most once.
+    """
+    selected = [RULES[name] for name in RULES if name in names]
+    files = list(dict.fromkeys(f for r in selected for f in r.files))
+
+    fired: dict[str, list[str]] = {}
+    for rel in files:
+        path = ctx.root / rel
+        if not path.exists():
+            continue
+        original = path.read_bytes()
+        text = original.decode("utf-8")
+        for r in selected:
+            if rel not in r.files:
+                continue
+            updated = r.apply(rel, text, ctx)
+            if updated != text:
+                fired.setdefault(rel, []).append(r.name)
+                text = updated
+        data = text.encode("utf-8")
+        if write and data != original:
+            write_atomic(path, data)
+    return fired
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+def format_verified_date(d: date) -> str:
+    return f"{d:%b} {d.day}, {d.year}"
+
+
+VERIFIED_DATE_PATTERNS = {
+    "README.md": (r"Live \(verified [A-Za-z]* [0-9]*, [0-9]*\)", "Live (verified {date})"),
+    "index.html": (r"Status: Live \| Verified: [A-Za-z]* [0-9]*, [0-9]*", "Status: Live | Verified: {date}"),
+}
+CARD_TITLE_RE = re.compile(r"<h3>(.*?)</h3>")
+
+
+@rule("verified-date", ("README.md", "index.html"))
+def verified_date_rule(path: str, text: str, ctx: Context) -> str:
+    """
+    Stamp the verified date on live projects. With ``ctx.verified_projects``
+    only those projects are stamped: in index.html the card whose <h3> names
+    the project, in README.md lines that mention it.
+    """
+    if not ctx.verified_date:
+        return text
+    pattern, template = VERIFIED_DATE_PATTERNS[path]
+    replacement = template.format(date=ctx.verified_date)
+    if ctx.verified_projects is None:
+        return re.sub(pattern, replacement, text)
+
+    lines = text.splitlines(keepends=True)
+    card_title = ""
+    for i, line in enumerate(lines):
+        m = CARD_TITLE_RE.search(line)
+        if m:
+            card_title = m.group(1).strip()
+        if path == "index.html":
+            verified = card_title in ctx.verified_projects
+        else:
+            verified = any(project in line for project in ctx.verified_projects)
+        if verified:
+            lines[i] = re.sub(pattern, replacement, line)
+    return "".join(lines)
+
+
+@rule("cache-buster", ("index.html", "jmahotiedu.html", "README.md"))
+def cache_buster_rule(path: str, text: str, ctx: Context) -> str:
+    updated, _ = cache_bust.rewrite_cache_busters(text, ctx.pdf_hashes)
+    return updated
+
+
+GRADUATION_DATE = date(2026, 5, 10)
+GRADUATION_EDITS = {
+    "index.html": [
+        # Hero subtitle: remove "Available May 2026." trailing sentence
+        (r" Available May 2026\.", ""),
+        (r"graduating May 2026", "graduated May 2026"),
+        (r"Available for full-time roles starting May 2026\.", "Available for full-time roles."),
+        (r"Expected May 2026", "May 2026"),
+    ],
+    "README.md": [
+        (r"graduating May 2026", "graduated May 2026"),
+        (r"Available for full-time roles starting May 2026", "Available for full-time roles"),
+        (r"roles starting May 2026", "roles"),
+        (r"Expected May 2026", "May 2026"),
+        (r"Purdue EET '26(?! \(graduated\))", "Purdue EET '26 (graduated)"),
+    ],
+}
+
+
+@rule("graduation", ("index.html", "README.md"))
+def graduation_rule(path: str, text: str, ctx: Context) -> str:
+    if ctx.today < GRADUATION_DATE:
+        return text
+    for pattern, replacement in GRADUATION_EDITS[path]:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+@rule("pr-stats", ("README.md", "index.html"))
+def pr_stats_rule(path: str, text: str, ctx: Context) -> str:
+    if path == "README.md":
+        return sync_pr_status.rewrite_readme(text, ctx.pr_info)
+    return sync_pr_status.rewrite_index(text, ctx.pr_info)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def parse_verified_date(value: str) -> str:
+    if value == "today":
+        return format_verified_date(datetime.now(timezone.utc).date())
+    return format_verified_date(date.fromisoformat(value))
+
+
+def parse_project_list(value: str) -> list[str]:
+    try:
+        projects = json.loads(value)
+    except ValueError:
+        projects = None
+    if not isinstance(projects, list) or not all(isinstance(p, str) for p in projects):
+        raise argparse.ArgumentTypeError(f"expected a JSON list of project names, got {value!r}")
+    return projects
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Apply registered automated edits to the portfolio documents.")
+    parser.add_argument("--rule", action="append", default=[], choices=sorted(RULES), help="Rule to apply; may be repeated.")
+    parser.add_argument("--all", action="store_true", help="Apply every registered rule.")
+    parser.add_argument("--verified-date", type=parse_verified_date, default=None, metavar="YYYY-MM-DD|today",
+                        help="Date for the verified-date rule (the rule is a no-op without it).")
+    parser.add_argument("--verified-projects", type=parse_project_list, default=None, metavar="JSON",
+                        help="JSON list of project names the verified-date rule may stamp "
+                             "(endpoint_health.py's healthy_projects output); default: every live project.")
+    parser.add_argument("--dry-run", action="store_true", help="Report which rules would fire without writing.")
+    args = parser.parse_args(argv)
+
+    names = list(RULES) if args.all else args.rule
+    if not names:
+        parser.error("select at least one --rule or --all")
+
+    ctx = Context(verified_date=args.verified_date, verified_projects=args.verified_projects)
+    try:
+        fired = apply_rules(names, ctx, write=not args.dry_run)
+    except RuntimeError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    verb = "Would update" if args.dry_run else "Updated"
+    for rel, rule_names in fired.items():
+        print(f"  {verb}: {rel} ({', '.join(rule_names)})")
+    if not fired:
+        print("No changes needed.")
+
+    output_path = os.environ.get("GITHUB_OUTPUT")
+    if output_path:
+        with open(output_path, "a", encoding="utf-8") as fh:
+            fh.write(f"changed={'true' if fired else 'false'}\n")
+            fh.write(f"rules={','.join(sorted({n for ns in fired.values() for n in ns}))}\n")
+            fh.write(f"files={' '.join(fired)}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
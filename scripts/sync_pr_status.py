@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Sync pull request statuses and diff stats into README.md and index.html.
+
+Discovers every PR link with check-consistency.py's extract_pr_urls, fetches
+state/additions/deletions for all of them in batched GitHub GraphQL queries
+(one round trip per PR_BATCH_SIZE PRs instead of one REST call per PR), then
+rewrites:
+  1. README.md "- **...** - [PR #N](url) _(Status: X)_: ..." bullets
+  2. index.html "| State: X" and "+N/-N" on each PR card's stack line
+  3. README.md ### Merged / ### Open tables (closed-unmerged rows are dropped)
+
+Nothing is cached between runs: GraphQL is POST-only and GitHub never
+answers it with 304, and the batched query is already one or two round
+trips. Set GITHUB_GRAPHQL_URL to point at a stand-in API server.
+
+Usage:
+  python3 scripts/sync_pr_status.py              # rewrite files in place
+  python3 scripts/sync_pr_status.py --no-write   # dry run, print summary only
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import sys
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+GRAPHQL_URL = os.environ.get("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+USER_AGENT = "jmahotiedu-pr-sync"
+PR_BATCH_SIZE = 50
+
+
+def _load_check_consistency():
+    spec = importlib.util.spec_from_file_location("check_consistency", Path(__file__).with_name("check-consistency.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+extract_pr_urls = _load_check_consistency().extract_pr_urls
+
+PR_URL_PARTS_RE = re.compile(r"https://github\.com/(?P<repo>[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)/pull/(?P<num>\d+)")
+
+
+@dataclass(frozen=True)
+class PrInfo:
+    status: str
+    additions: int
+    deletions: int
+
+
+PrKey = tuple[str, int]
+
+
+def pr_key_label(key: PrKey) -> str:
+    return f"{key[0]}#{key[1]}"
+
+
+def discover_prs(*texts: str) -> list[PrKey]:
+    """Return every unique (owner/repo, number) referenced in ``texts``, sorted."""
+    keys: set[PrKey] = set()
+    for text in texts:
+        for url in extract_pr_urls(text):
+            m = PR_URL_PARTS_RE.match(url)
+            keys.add((m.group("repo"), int(m.group("num"))))
+    return sorted(keys)
+
+
+# ---------------------------------------------------------------------------
+# GraphQL fetch
+# ---------------------------------------------------------------------------
+
+def build_query(keys: list[PrKey]) -> tuple[str, dict[str, list[tuple[str, PrKey]]]]:
+    """
+    Build one aliased GraphQL query for ``keys``. Returns the query and a map
+    of repository alias -> [(pull request alias, key)] for decoding.
+    """
+    by_repo: dict[str, list[PrKey]] = {}
+    for key in keys:
+        by_repo.setdefault(key[0], []).append(key)
+
+    aliases: dict[str, list[tuple[str, PrKey]]] = {}
+    parts = []
+    for i, (repo, repo_keys) in enumerate(sorted(by_repo.items())):
+        owner, name = repo.split("/", 1)
+        repo_alias = f"r{i}"
+        fields = []
+        for key in repo_keys:
+            pr_alias = f"pr{key[1]}"
+            aliases.setdefault(repo_alias, []).append((pr_alias, key))
+            fields.append(f"{pr_alias}: pullRequest(number: {key[1]}) {{ state merged additions deletions }}")
+        parts.append(f"{repo_alias}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {' '.join(fields)} }}")
+    return "query { " + " ".join(parts) + " }", aliases
+
+
+def pr_status(node: dict) -> str:
+    if node.get("merged"):
+        return "Merged"
+    if node.get("state") == "CLOSED":
+        return "Closed"
+    return "Open"
+
+
+class GraphQLClient:
+    """Minimal GitHub GraphQL client."""
+
+    def __init__(self, token: str, url: str = GRAPHQL_URL) -> None:
+        self.token = token
+        self.url = url
+        self.requests_sent = 0
+
+    def query(self, query: str) -> dict:
+        headers = {
+            "User-Agent": USER_AGENT,
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.token}",
+        }
+        body = json.dumps({"query": query}).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers=headers, method="POST")
+        self.requests_sent += 1
+        try:
+            with urllib.request.urlopen(request, timeout=30) as resp:
+                payload = json.loads(resp.read().decode("utf-8"))
+        except urllib.error.HTTPError as exc:
+            raise RuntimeError(f"GraphQL request failed: HTTP {exc.code} {exc.reason}") from exc
+
+        if payload.get("errors"):
+            messages = "; ".join(e.get("message", str(e)) for e in payload["errors"])
+            raise RuntimeError(f"GraphQL errors: {messages}")
+
+        return payload.get("data") or {}
+
+
+def fetch_pr_info(client: GraphQLClient, keys: list[PrKey], batch_size: int = PR_BATCH_SIZE) -> dict[PrKey, PrInfo]:
+    info: dict[PrKey, PrInfo] = {}
+    for start in range(0, len(keys), batch_size):
+        query, aliases = build_query(keys[start:start + batch_size])
+        data = client.query(query)
+        for repo_alias, entries in aliases.items():
+            repo_data = data.get(repo_alias) or {}
+            for pr_alias, key in entries:
+                node = repo_data.get(pr_alias)
+                if not node:
+                    raise RuntimeError(f"No data returned for PR {pr_key_label(key)}")
+                info[key] = PrInfo(pr_status(node), int(node["additions"]), int(node["deletions"]))
+    return info
+
+
+# ---------------------------------------------------------------------------
+# Rewriters
+# ---------------------------------------------------------------------------
+
+README_BULLET_RE = re.compile(
+    r"^(?P<prefix>- \*\*.+?\*\* - \[PR #(?P<label_num>\d+)\]\(https://github\.com/"
+    r"(?P<repo>[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)/pull/(?P<url_num>\d+)\))"
+    r"(?P<status_part>(?: _\(Status: (?:Open|Closed|Merged)\)_)?)(?P<suffix>: .*)$",
+    re.MULTILINE,
+)
+TABLE_ROW_RE = re.compile(
+    r"^\| \*\*(?P<repo>[A-Za-z0-9_.\-]+/[A-Za-z0-9_.\-]+)\*\* \| \[#(?P<num>\d+)\]"
+    r"\(https://github\.com/[A-Za-z0-9_.\-]+/[A-Za-z0-9_.\-]+/pull/\d+\) \| (?P<summary>.+?) \|$"
+)
+INDEX_ANCHOR_RE = re.compile(r'<a href="https://github\.com/(?P<repo>[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)/pull/(?P<num>\d+)"')
+INDEX_STATE_RE = re.compile(r"(\| State:\s*)(Open|Closed|Merged)(</p>)")
+DIFF_STAT_RE = re.compile(r"\+[\d,]+/-[\d,]+")
+TABLE_HEADER = "| Repo | PR | Summary |"
+TABLE_SEPARATOR = "|------|----|---------|"
+CARD_SCAN_LINES = 16
+
+
+def _lookup(info: dict[PrKey, PrInfo], repo: str, num: str, where: str) -> PrInfo:
+    key = (repo, int(num))
+    if key not in info:
+        raise RuntimeError(f"No fetched info for {where} PR: {pr_key_label(key)}")
+    return info[key]
+
+
+def rewrite_readme_bullets(text: str, info: dict[PrKey, PrInfo]) -> str:
+    """Update the _(Status: X)_ label on README PR bullets."""
+    def replace(m: re.Match) -> str:
+        if m.group("label_num") != m.group("url_num"):
+            raise RuntimeError(f"PR number mismatch in README bullet: '{m.group(0)}'")
+        status = _lookup(info, m.group("repo"), m.group("url_num"), "README").status
+        return f"{m.group('prefix')} _(Status: {status})_{m.group('suffix')}"
+
+    return README_BULLET_RE.sub(replace, text)
+
+
+def rewrite_readme_tables(text: str, info: dict[PrKey, PrInfo]) -> str:
+    """Move README table rows between ### Merged and ### Open by live status."""
+    lines = re.split(r"\r?\n", text)
+    merged_idx = open_idx = -1
+    for i, line in enumerate(lines):
+        if line == "### Merged":
+            merged_idx = i
+        if line == "### Open":
+            open_idx = i
+    if merged_idx < 0 or open_idx <= merged_idx:
+        return text
+
+    merged_rows = [line for line in lines[merged_idx + 1:open_idx] if TABLE_ROW_RE.match(line)]
+    open_rows: list[str] = []
+    open_end = len(lines)
+    for i in range(open_idx + 1, len(lines)):
+        line = lines[i]
+        # A blank line after at least one data row signals the end of the table
+        if not line.strip() and open_rows:
+            open_end = i
+            break
+        if TABLE_ROW_RE.match(line):
+            open_rows.append(line)
+
+    new_merged: list[str] = []
+    new_open: list[str] = []
+    for row in merged_rows + open_rows:
+        m = TABLE_ROW_RE.match(row)
+        key = (m.group("repo"), int(m.group("num")))
+        if key not in info:
+            # Key not in fetched data — preserve in its current section
+            (new_merged if row in merged_rows else new_open).append(row)
+            continue
+        status = info[key].status
+        if status == "Merged":
+            new_merged.append(row)
+        elif status == "Open":
+            new_open.append(row)
+        # Closed-not-merged rows are dropped
+
+    if new_merged == merged_rows and new_open == open_rows:
+        return text
+
+    rebuilt = (
+        lines[:merged_idx + 1] + ["", TABLE_HEADER, TABLE_SEPARATOR] + new_merged
+        + [lines[open_idx], "", TABLE_HEADER, TABLE_SEPARATOR] + new_open
+        + lines[open_end:]
+    )
+    return "\n".join(rebuilt)
+
+
+def rewrite_readme(text: str, info: dict[PrKey, PrInfo]) -> str:
+    return rewrite_readme_tables(rewrite_readme_bullets(text, info), info)
+
+
+def rewrite_index(text: str, info: dict[PrKey, PrInfo]) -> str:
+    """Update State: X and +N/-N on the stack line of every PR card."""
+    lines = text.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        m = INDEX_ANCHOR_RE.search(line)
+        if not m:
+            continue
+        pr = _lookup(info, m.group("repo"), m.group("num"), "index.html")
+
+        for j in range(i + 1, min(len(lines), i + CARD_SCAN_LINES)):
+            candidate = lines[j]
+            if "</a>" in candidate:
+                break
+            if '<p class="stack">' not in candidate or "| State:" not in candidate:
+                continue
+            candidate = INDEX_STATE_RE.sub(lambda s: f"{s.group(1)}{pr.status}{s.group(3)}", candidate)
+            # Update +N/-N diff stat if one is already present in this card
+            candidate = DIFF_STAT_RE.sub(f"+{pr.additions:,}/-{pr.deletions:,}", candidate)
+            lines[j] = candidate
+            break
+        else:
+            raise RuntimeError(f"Could not find stack/state line for PR card near index.html line {i + 1}.")
+    return "".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sync PR statuses and diff stats into README.md and index.html.")
+    parser.add_argument("--repo-root", type=Path, default=ROOT, help="Repository root (default: this repo).")
+    parser.add_argument("--no-write", action="store_true", help="Fetch and report without writing files.")
+    args = parser.parse_args(argv)
+
+    readme_path = args.repo_root / "README.md"
+    index_path = args.repo_root / "index.html"
+    for path in (readme_path, index_path):
+        if not path.exists():
+            print(f"ERROR: {path} not found", file=sys.stderr)
+            return 1
+
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if not token:
+        print("ERROR: GITHUB_TOKEN or GH_TOKEN is required for the GraphQL API", file=sys.stderr)
+        return 1
+
+    readme = readme_path.read_bytes().decode("utf-8")
+    index = index_path.read_bytes().decode("utf-8")
+
+    keys = discover_prs(readme, index)
+    if not keys:
+        print("ERROR: No pull request links found in README/index.", file=sys.stderr)
+        return 1
+
+    client = GraphQLClient(token)
+    info = fetch_pr_info(client, keys)
+    for key in keys:
+        pr = info[key]
+        print(f"  Fetched {pr_key_label(key)} -> {pr.status}  +{pr.additions}/-{pr.deletions}")
+    print(f"  {len(keys)} PR(s) in {client.requests_sent} GraphQL request(s)")
+
+    readme_updated = rewrite_readme(readme, info)
+    index_updated = rewrite_index(index, info)
+    updated = []
+    if readme_updated != readme:
+        updated.append("README.md")
+        if not args.no_write:
+            readme_path.write_bytes(readme_updated.encode("utf-8"))
+    if index_updated != index:
+        updated.append("index.html")
+        if not args.no_write:
+            index_path.write_bytes(index_updated.encode("utf-8"))
+
+    print("")
+    print(f"{'Repo':<32} {'PR':>6}  {'Status':<7} {'Additions':>9} {'Deletions':>9}")
+    for key in keys:
+        pr = info[key]
+        print(f"{key[0]:<32} {key[1]:>6}  {pr.status:<7} {pr.additions:>9} {pr.deletions:>9}")
+    print("")
+
+    if updated:
+        print(f"{'Would update' if args.no_write else 'Updated'}: {', '.join(updated)}")
+    else:
+        print("No changes needed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
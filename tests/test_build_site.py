@@ -0,0 +1,42 @@
+"""
+Tests for the HTML minifier in scripts/build_site.py.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import build_site  # noqa: E402
+
+
+class MinifyHtmlTests(unittest.TestCase):
+    def test_whitespace_next_to_block_tags_is_dropped(self):
+        page = "<div>\n  <p>\n    Hello   world\n  </p>\n</div>\n"
+        self.assertEqual(build_site.minify_html(page), "<div><p>Hello world</p></div>")
+
+    def test_whitespace_next_to_inline_tags_is_collapsed_not_dropped(self):
+        page = "<p>Read  <a href=\"#\">the\n docs</a>  now</p>"
+        self.assertEqual(build_site.minify_html(page), '<p>Read <a href="#">the docs</a> now</p>')
+
+    def test_text_around_a_dropped_comment_is_merged(self):
+        page = "<p>one <!-- note --> two</p>"
+        self.assertEqual(build_site.minify_html(page), "<p>one two</p>")
+
+    def test_conditional_comments_are_kept(self):
+        page = "<head>\n<!--[if IE]><p>old</p><![endif]-->\n</head>"
+        self.assertIn("<!--[if IE]>", build_site.minify_html(page))
+
+    def test_pre_body_is_untouched(self):
+        page = "<div>\n<pre>  a\n    b</pre>\n</div>"
+        self.assertEqual(build_site.minify_html(page), "<div><pre>  a\n    b</pre></div>")
+
+    def test_leading_and_trailing_text(self):
+        self.assertEqual(build_site.minify_html("  hi  <br>  there  "), "hi<br>there")
+
+
+if __name__ == "__main__":
+    unittest.main()
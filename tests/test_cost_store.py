@@ -0,0 +1,186 @@
+"""
+Tests for scripts/aws/cost_store.py using recorded get-cost-and-usage pages.
+
+tests/fixtures/cost_explorer/ holds Cost Explorer responses for
+2026-02-23 .. 2026-02-25: two pages where 02-24 is split across the page
+boundary and 02-25 is still estimated, plus a later final response for
+02-25. fetch_missing runs against a stand-in ``aws`` executable on PATH
+that serves those pages.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "aws"))
+
+import cost_store  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "cost_explorer"
+EC2 = "Amazon Elastic Compute Cloud - Compute"
+ECS = "Amazon Elastic Container Service"
+S3 = "Amazon Simple Storage Service"
+CLOUDWATCH = "AmazonCloudWatch"
+
+# Stands in for `aws ce get-cost-and-usage`: serves the fixture recorded for
+# (--time-period, --next-page-token) and logs every call.
+FAKE_AWS = """\
+#!{python}
+import json, os, sys
+args = sys.argv[1:]
+period = args[args.index("--time-period") + 1]
+token = args[args.index("--next-page-token") + 1] if "--next-page-token" in args else ""
+with open(os.environ["FAKE_AWS_LOG"], "a") as fh:
+    fh.write(f"{{period}}|{{token}}\\n")
+manifest = json.load(open(os.environ["FAKE_AWS_MANIFEST"]))
+name = manifest.get(f"{{period}}|{{token}}")
+if name is None:
+    sys.exit(f"An error occurred (ValidationException): no recording for {{period}} {{token}}")
+sys.stdout.write(open(os.path.join(os.environ["FAKE_AWS_FIXTURES"], name)).read())
+"""
+
+RECORDINGS = {
+    "Start=2026-02-23,End=2026-02-26|": "feb23-25-page1.json",
+    "Start=2026-02-23,End=2026-02-26|page-2": "feb23-25-page2.json",
+    "Start=2026-02-25,End=2026-02-26|": "feb25-final.json",
+}
+
+
+def load(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def day_total(conn: sqlite3.Connection, day: str) -> float:
+    return cost_store.usd(cost_store.total(conn, date.fromisoformat(day), date.fromisoformat(day)))
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.conn = cost_store.connect(Path(":memory:"))
+
+    def tearDown(self):
+        self.conn.close()
+
+    def ingest(self, *names: str) -> list[str]:
+        return cost_store.ingest_response(self.conn, cost_store.merge_pages([load(n) for n in names]))
+
+
+class MergePagesTests(StoreTestCase):
+    def test_day_split_across_pages_is_gathered(self):
+        merged = cost_store.merge_pages([load("feb23-25-page1.json"), load("feb23-25-page2.json")])
+        days = {p["TimePeriod"]["Start"]: p for p in merged["ResultsByTime"]}
+        self.assertEqual(list(days), ["2026-02-23", "2026-02-24", "2026-02-25"])
+        self.assertEqual([g["Keys"][0] for g in days["2026-02-24"]["Groups"]], [EC2, ECS, S3])
+        self.assertFalse(days["2026-02-24"]["Estimated"])
+        self.assertTrue(days["2026-02-25"]["Estimated"])
+
+    def test_ingesting_merged_pages_keeps_both_halves_of_a_day(self):
+        self.assertEqual(self.ingest("feb23-25-page1.json", "feb23-25-page2.json"),
+                         ["2026-02-23", "2026-02-24", "2026-02-25"])
+        self.assertEqual(day_total(self.conn, "2026-02-23"), 2.10)
+        self.assertEqual(day_total(self.conn, "2026-02-24"), 2.20)
+
+    def test_amounts_round_to_micros_and_empty_tags_are_untagged(self):
+        self.ingest("feb23-25-page1.json")
+        rows = self.conn.execute(
+            "SELECT service, project, amount_micros FROM costs WHERE day = '2026-02-23' ORDER BY service").fetchall()
+        # AWS Lambda's 0.0000001 rounds to 0 micros and is not stored
+        self.assertEqual(rows, [(EC2, "retail-forecast", 1_250_000), (ECS, "retail-forecast", 800_000),
+                                (S3, "untagged", 50_000)])
+
+
+@unittest.skipUnless(os.name == "posix", "stand-in aws CLI is a shebang script")
+class FetchMissingTests(StoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        bin_dir = Path(self.tmp.name)
+        aws = bin_dir / "aws"
+        aws.write_text(FAKE_AWS.format(python=sys.executable), encoding="utf-8")
+        aws.chmod(0o755)
+        manifest = bin_dir / "manifest.json"
+        manifest.write_text(json.dumps(RECORDINGS), encoding="utf-8")
+        self.log = bin_dir / "calls.log"
+        self.log.write_text("", encoding="utf-8")
+        env = {
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "FAKE_AWS_MANIFEST": str(manifest),
+            "FAKE_AWS_FIXTURES": str(FIXTURES),
+            "FAKE_AWS_LOG": str(self.log),
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def fetch(self) -> tuple[list[str], list[str]]:
+        self.log.write_text("", encoding="utf-8")
+        with mock.patch("builtins.print"):
+            days = cost_store.fetch_missing(self.conn, date(2026, 2, 23), date(2026, 2, 25), "us-east-1")
+        return days, self.log.read_text(encoding="utf-8").split()
+
+    def test_estimated_day_is_refetched_until_final(self):
+        days, calls = self.fetch()
+        self.assertEqual(days, ["2026-02-23", "2026-02-24", "2026-02-25"])
+        self.assertEqual(calls, ["Start=2026-02-23,End=2026-02-26|", "Start=2026-02-23,End=2026-02-26|page-2"])
+        self.assertEqual(day_total(self.conn, "2026-02-25"), 1.95)
+
+        # Only the estimated day is queried again, and the final numbers replace it
+        days, calls = self.fetch()
+        self.assertEqual(days, ["2026-02-25"])
+        self.assertEqual(calls, ["Start=2026-02-25,End=2026-02-26|"])
+        self.assertEqual(day_total(self.conn, "2026-02-25"), 2.48)
+
+        days, calls = self.fetch()
+        self.assertEqual((days, calls), ([], []))
+
+    def test_cli_failure_is_reported(self):
+        with self.assertRaisesRegex(RuntimeError, "ValidationException"):
+            cost_store.fetch_range(date(2026, 3, 1), date(2026, 3, 1), "us-east-1")
+
+
+class ReportTests(StoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.ingest("feb23-25-page1.json", "feb23-25-page2.json")
+        self.ingest("feb25-final.json")
+
+    def test_day_over_day_orders_by_largest_change(self):
+        deltas = cost_store.day_over_day(self.conn, date(2026, 2, 25))
+        self.assertEqual([(d.service, d.previous, d.current) for d in deltas], [
+            (CLOUDWATCH, 0, 120_000),
+            (EC2, 1_300_000, 1_400_000),
+            (ECS, 850_000, 900_000),
+            (S3, 50_000, 60_000),
+        ])
+
+    def test_day_over_day_totals_match_each_day(self):
+        deltas = cost_store.day_over_day(self.conn, date(2026, 2, 24))
+        self.assertEqual(sum(d.previous for d in deltas), 2_100_000)
+        self.assertEqual(sum(d.current for d in deltas), 2_200_000)
+
+    def test_summary_lines(self):
+        lines = cost_store.summary_lines(self.conn, date(2026, 2, 25), limit=2)
+        self.assertEqual(lines[2], "Month-to-date unblended cost (2026-02-01 .. 2026-02-25): **$6.78 USD**.")
+        self.assertEqual(lines[6:8], [f"| {EC2} | 3.95 |", f"| {ECS} | 2.55 |"])
+        self.assertIn("| retail-forecast | 6.62 |", lines)
+        self.assertIn("| untagged | 0.16 |", lines)
+        self.assertIn("Day over day (2026-02-24 -> 2026-02-25): $2.20 -> $2.48 (+0.28).", lines)
+        self.assertEqual(lines[-2:], [f"| {CLOUDWATCH} | 0.00 | 0.12 | +0.12 |", f"| {EC2} | 1.30 | 1.40 | +0.10 |"])
+
+    def test_summary_as_of_before_any_data(self):
+        lines = cost_store.summary_lines(self.conn, date(2026, 1, 31), limit=5)
+        self.assertIn("**$0.00 USD**", lines[2])
+        self.assertFalse(any(line.startswith("Day over day") for line in lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
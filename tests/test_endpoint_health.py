@@ -0,0 +1,40 @@
+"""
+Tests for take_sample() in scripts/endpoint_health.py.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import gc
+import socket
+import sys
+import unittest
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import endpoint_health  # noqa: E402
+
+
+def closed_port() -> int:
+    """A local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TakeSampleTests(unittest.TestCase):
+    def test_failed_connect_reports_error_and_closes_socket(self):
+        url = f"http://127.0.0.1:{closed_port()}/"
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            sample = endpoint_health.take_sample(url, timeout=2.0)
+            gc.collect()
+
+        self.assertEqual(sample.status, 0)
+        self.assertIn("ConnectionRefusedError", sample.error)
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for resumes/generate_resumes.py: every variant must render to the
+same bytes twice, and builds into resumes/ refresh the PDF cache-busters.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import contextlib
+import importlib.util
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "resumes"))
+
+import generate_resumes  # noqa: E402
+
+HAS_REPORTLAB = importlib.util.find_spec("reportlab") is not None
+
+
+@unittest.skipUnless(HAS_REPORTLAB, "reportlab is not installed")
+class ReproducibilityTests(unittest.TestCase):
+    def test_every_variant_renders_identically_twice(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            mismatched = generate_resumes.check_reproducible(generate_resumes.ALL_VARIANTS)
+        self.assertEqual(mismatched, [])
+
+    def test_serial_and_pooled_batches_match(self):
+        variants = generate_resumes.ALL_VARIANTS
+        with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as pooled_dir:
+            serial = generate_resumes.render_batch(variants, serial_dir, jobs=1)
+            pooled = generate_resumes.render_batch(variants, pooled_dir, jobs=2)
+            for (filename, path_a, _, error_a), (_, path_b, _, error_b) in zip(serial, pooled):
+                with self.subTest(filename=filename):
+                    self.assertIsNone(error_a)
+                    self.assertIsNone(error_b)
+                    self.assertEqual(generate_resumes.file_sha256(path_a), generate_resumes.file_sha256(path_b))
+
+
+class CacheBusterTests(unittest.TestCase):
+    def test_build_into_resumes_refreshes_published_links(self):
+        with mock.patch.object(generate_resumes.cache_bust, "main") as rewrite:
+            generate_resumes.refresh_cache_busters(generate_resumes.cache_bust.RESUMES_DIR)
+        rewrite.assert_called_once_with([])
+
+    def test_build_elsewhere_leaves_documents_alone(self):
+        with mock.patch.object(generate_resumes.cache_bust, "main") as rewrite, \
+                tempfile.TemporaryDirectory() as out_dir:
+            generate_resumes.refresh_cache_busters(Path(out_dir))
+        rewrite.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,296 @@
+"""
+Tests for scripts/aws/inventory.py.
+
+Classification is checked against the rules in inventory_export.ps1
+(Resolve-Owner, Resolve-Project, Resolve-ResourceDisposition). Collection and
+the --fail-on-* exit codes run against moto's in-process AWS stand-in; those
+tests are skipped when boto3 or moto is not installed (pip install boto3 moto).
+
+Run with: python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "aws"))
+
+import inventory  # noqa: E402
+
+try:
+    import boto3
+    from botocore.stub import Stubber
+    from moto import mock_aws
+except ImportError:
+    boto3 = Stubber = mock_aws = None
+
+REGION = "us-east-1"
+
+# (name, tags, project, owner, disposition) as inventory_export.ps1's Add-Row
+# would classify them. PowerShell's tag map is a case-insensitive hashtable,
+# and -match is case-insensitive.
+PARITY_CASES = [
+    ("retail-forecast-api", {}, "retail-forecast-dashboard", "portfolio-default", "keep"),
+    ("svc", {"Project": "Retail-Forecast"}, "retail-forecast-dashboard", "portfolio-default", "keep"),
+    ("svc", {"project": "feature-flag-api", "owner": "jm"}, "feature-flag-platform", "jm", "delete"),
+    ("svc", {"PROJECT": "wf-orch"}, "workflow-orchestrator", "portfolio-default", "delete"),
+    ("svc", {"pRoJeCt": "streaming-etl"}, "streaming-etl-pipeline", "portfolio-default", "delete"),
+    ("svc", {"Project": "side-quest", "OWNER": "ops"}, "side-quest", "ops", "delete"),
+    ("WORKFLOW-runner", {}, "workflow-orchestrator", "portfolio-default", "delete"),
+    ("retail-forecast-db", {"Project": "   "}, "retail-forecast-dashboard", "portfolio-default", "keep"),
+    ("misc", {"Owner": "jm"}, "unknown", "jm", "investigate"),
+    ("misc", {"Owner": " "}, "unknown", "unknown", "investigate"),
+    ("misc", {"oWnEr": "jm"}, "unknown", "jm", "investigate"),
+    ("", {}, "unknown", "unknown", "investigate"),
+    (None, {}, "unknown", "unknown", "investigate"),
+]
+
+
+class ClassificationParityTests(unittest.TestCase):
+    def test_rows_match_powershell_rules(self):
+        for name, tags, project, owner, disposition in PARITY_CASES:
+            with self.subTest(name=name, tags=tags):
+                row = inventory.make_row(REGION, {}, "id", "ecs", "ACTIVE", name=name, tags=tags)
+                self.assertEqual((row.project, row.owner, row.disposition), (project, owner, disposition))
+
+    def test_last_case_variant_of_a_tag_wins(self):
+        # A PowerShell hashtable stores "Owner" and "owner" under one key
+        self.assertEqual(inventory.resolve_owner({"Owner": "a", "owner": "b"}), "b")
+        self.assertEqual(inventory.resolve_owner({"owner": "b", "Owner": " "}), "unknown")
+
+    def test_disposition_ignores_state(self):
+        for state in ("running", "stopped", "deleting", ""):
+            self.assertEqual(inventory.resolve_disposition("feature-flag-platform", state), "delete")
+            self.assertEqual(inventory.resolve_disposition("retail-forecast-dashboard", state), "keep")
+
+    def test_tags_to_map_accepts_both_casings_and_skips_nulls(self):
+        tags = [{"Key": "Owner", "Value": "jm"}, {"key": "Project", "value": "x"}, {"Key": "Empty", "Value": None}]
+        self.assertEqual(inventory.tags_to_map(tags), {"Owner": "jm", "Project": "x"})
+
+    def test_gates(self):
+        rows = [inventory.make_row(REGION, {}, *args) for args in (
+            ("i-1", "ec2", "running", "retail-forecast-box"),
+            ("i-2", "ec2", "stopped", "feature-flag-box"),
+            ("i-3", "ec2", "terminated", "feature-flag-old"),
+            ("i-4", "ec2", "running", "mystery"),
+        )]
+        self.assertEqual([r.resource_id for r in inventory.unowned(rows)], ["i-4"])
+        self.assertEqual([r.resource_id for r in inventory.active_non_retail(rows)], ["i-2", "i-4"])
+
+
+class FakeCollector:
+    """Just enough of Collector for classify_changes: region, failed and the Cost Explorer call."""
+
+    def __init__(self, estimates: dict[str, float]) -> None:
+        self.region = REGION
+        self.failed: set[str] = set()
+        self.estimates = estimates
+
+    def call(self, service, operation, context, **kwargs):
+        groups = [{"Keys": [name], "Metrics": {"UnblendedCost": {"Amount": str(amount)}}}
+                  for name, amount in self.estimates.items()]
+        return {"ResultsByTime": [{"Groups": groups}]}
+
+
+ECR = "Amazon Elastic Container Registry (ECR)"
+
+
+def ecr_raw(tags, state="present"):
+    return dict(resource_id="feature-flag-api", resource_type="ecr", state=state, name="feature-flag-api",
+                tags=tags, arn="arn:aws:ecr:us-east-1:123456789012:repository/feature-flag-api", notes="")
+
+
+class ClassifyChangesTests(unittest.TestCase):
+    TAGS = {"Owner": "jm", "Project": "feature-flag"}
+
+    def baseline(self):
+        _, _, snapshot = inventory.classify_changes(FakeCollector({ECR: 1.0}), [ecr_raw(dict(self.TAGS))], None)
+        return snapshot
+
+    def test_unchanged_rows_get_this_runs_estimate(self):
+        rows, diff, snapshot = inventory.classify_changes(FakeCollector({ECR: 2.5}), [ecr_raw(dict(self.TAGS))],
+                                                          self.baseline())
+        self.assertEqual(rows[0].monthly_cost_estimate, 2.5)
+        self.assertEqual((diff.unchanged, diff.changed, diff.added), (1, [], []))
+        self.assertNotIn("monthly_cost_estimate", next(iter(snapshot.values()))["row"])
+
+    def test_estimate_is_not_a_change_detail(self):
+        rows, diff, _ = inventory.classify_changes(FakeCollector({ECR: 9.0}), [ecr_raw(dict(self.TAGS), "gone")],
+                                                   self.baseline())
+        self.assertEqual(diff.changed[0].details(), ["state: present -> gone"])
+        self.assertEqual(rows[0].monthly_cost_estimate, 9.0)
+
+    def test_failed_tag_lookup_keeps_stored_tags(self):
+        previous = self.baseline()
+        rows, diff, snapshot = inventory.classify_changes(FakeCollector({ECR: 1.0}), [ecr_raw(None)], previous)
+        self.assertEqual((rows[0].project, rows[0].owner), ("feature-flag-platform", "jm"))
+        self.assertEqual((diff.carried, diff.unchanged, diff.changed, diff.added), (1, 0, [], []))
+        self.assertEqual(snapshot, previous)
+
+    def test_failed_tag_lookup_still_reports_other_changes(self):
+        rows, diff, _ = inventory.classify_changes(FakeCollector({ECR: 1.0}), [ecr_raw(None, "gone")], self.baseline())
+        self.assertEqual(rows[0].owner, "jm")
+        self.assertEqual(diff.changed[0].details(), ["state: present -> gone"])
+
+    def test_new_resource_with_failed_tag_lookup_is_classified_without_tags(self):
+        rows, diff, _ = inventory.classify_changes(FakeCollector({}), [ecr_raw(None)], {})
+        self.assertEqual((rows[0].project, rows[0].owner), ("feature-flag-platform", "portfolio-default"))
+        self.assertEqual(len(diff.added), 1)
+
+    def test_failed_listing_carries_resources_over(self):
+        collector = FakeCollector({})
+        collector.failed.add("ecr")
+        rows, diff, snapshot = inventory.classify_changes(collector, [], self.baseline())
+        self.assertEqual((len(rows), diff.carried, diff.removed), (1, 1, []))
+        self.assertEqual(len(snapshot), 1)
+
+
+@unittest.skipIf(mock_aws is None, "boto3 and moto are required")
+class MotoTestCase(unittest.TestCase):
+    def setUp(self):
+        env = {"AWS_ACCESS_KEY_ID": "testing", "AWS_SECRET_ACCESS_KEY": "testing",
+               "AWS_DEFAULT_REGION": REGION, "AWS_ENDPOINT_URL": ""}
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop("AWS_ENDPOINT_URL")
+        self.aws = mock_aws()
+        self.aws.start()
+        self.addCleanup(self.aws.stop)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.out_dir = Path(self.tmp.name)
+
+    def client(self, service):
+        return boto3.client(service, region_name=REGION)
+
+    def run_main(self, *args) -> int:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return inventory.main(["--region", REGION, "--out-dir", str(self.out_dir), *args])
+
+    def latest_rows(self) -> list[dict]:
+        return json.loads((self.out_dir / "latest-inventory.json").read_text(encoding="utf-8"))
+
+    def seed_ecs(self, cluster, services, tags=None):
+        ecs = self.client("ecs")
+        ecs.register_task_definition(family="t", containerDefinitions=[{"name": "c", "image": "x", "memory": 128}])
+        ecs.create_cluster(clusterName=cluster)
+        for i in range(services):
+            ecs.create_service(cluster=cluster, serviceName=f"{cluster}-svc{i}", taskDefinition="t", desiredCount=1,
+                               **({"tags": tags} if tags else {}))
+
+    def seed_instance(self, name, tags=()):
+        self.client("ec2").run_instances(
+            ImageId="ami-12345678", MinCount=1, MaxCount=1, InstanceType="t3.micro",
+            TagSpecifications=[{"ResourceType": "instance", "Tags": [{"Key": "Name", "Value": name}, *tags]}])
+
+
+class CollectionTests(MotoTestCase):
+    def test_pagination_and_describe_batches(self):
+        # More services than one describe-services batch, more log groups than one page
+        self.seed_ecs("retail-forecast", 23, tags=[{"key": "Owner", "value": "jm"}])
+        logs = self.client("logs")
+        for i in range(57):
+            logs.create_log_group(logGroupName=f"/ecs/retail-forecast-{i:02d}")
+        logs.create_log_group(logGroupName="/aws/unrelated")
+
+        collector = inventory.Collector(REGION)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                raw = inventory.collect_raw(collector)
+        finally:
+            collector.close()
+
+        by_type = {}
+        for item in raw:
+            by_type.setdefault(item["resource_type"], []).append(item)
+        self.assertEqual(len(by_type["ecs"]), 23)
+        self.assertEqual(len({item["resource_id"] for item in by_type["ecs"]}), 23)
+        self.assertTrue(all(item["tags"] == {"Owner": "jm"} for item in by_type["ecs"]))
+        # moto returns describe-log-groups 50 per page
+        self.assertEqual(len(by_type["logs"]), 57)
+        self.assertEqual(collector.warnings, [])
+
+    def test_paginate_follows_next_token(self):
+        arn = "arn:aws:ecs:us-east-1:123456789012:service/c/s{}"
+        collector = inventory.Collector(REGION)
+        try:
+            with Stubber(collector.clients["ecs"]) as stub:
+                stub.add_response("list_services", {"serviceArns": [arn.format(1), arn.format(2)], "nextToken": "t1"},
+                                  {"cluster": "c"})
+                stub.add_response("list_services", {"serviceArns": [arn.format(3)]}, {"cluster": "c", "nextToken": "t1"})
+                items = collector.paginate("ecs", "list_services", "serviceArns", "ECS service listing", cluster="c")
+                stub.assert_no_pending_responses()
+        finally:
+            collector.close()
+        self.assertEqual(items, [arn.format(1), arn.format(2), arn.format(3)])
+        self.assertEqual(collector.calls, 2)
+
+    def test_rows_are_classified_like_powershell(self):
+        self.seed_ecs("retail-forecast", 1)
+        self.seed_instance("streaming-etl-box", [{"Key": "owner", "Value": "data"}])
+        self.client("ecr").create_repository(repositoryName="feature-flag-api", tags=[{"Key": "Owner", "Value": "jm"}])
+
+        self.assertEqual(self.run_main(), 0)
+        rows = {row["resource_type"]: row for row in self.latest_rows()}
+        self.assertEqual({t: (r["project"], r["owner"], r["disposition"]) for t, r in rows.items()}, {
+            "ecs": ("retail-forecast-dashboard", "portfolio-default", "keep"),
+            "ec2": ("streaming-etl-pipeline", "data", "delete"),
+            "ecr": ("feature-flag-platform", "jm", "delete"),
+        })
+        self.assertEqual(rows["ecs"]["service"], "Amazon Elastic Container Service")
+
+    def test_instance_name_tag_ignores_case(self):
+        self.client("ec2").run_instances(
+            ImageId="ami-12345678", MinCount=1, MaxCount=1, InstanceType="t3.micro",
+            TagSpecifications=[{"ResourceType": "instance", "Tags": [{"Key": "name", "Value": "retail-forecast-box"}]}])
+        collector = inventory.Collector(REGION)
+        try:
+            rows = inventory.collect_ec2(collector)
+        finally:
+            collector.close()
+        self.assertEqual(rows[0]["name"], "retail-forecast-box")
+        self.assertEqual(inventory.resolve_project(rows[0]["name"], rows[0]["tags"]), "retail-forecast-dashboard")
+
+    def test_failed_tag_calls_yield_unknown_tags(self):
+        collector = inventory.Collector(REGION)
+        repo = {"repositoryName": "feature-flag-api", "repositoryUri": "uri",
+                "repositoryArn": "arn:aws:ecr:us-east-1:123456789012:repository/feature-flag-api"}
+        try:
+            with Stubber(collector.clients["ecr"]) as stub, contextlib.redirect_stderr(io.StringIO()):
+                stub.add_response("describe_repositories", {"repositories": [repo]}, {})
+                stub.add_client_error("list_tags_for_resource", "ThrottlingException", http_status_code=400)
+                raw = inventory.collect_ecr(collector)
+        finally:
+            collector.close()
+        self.assertIsNone(raw[0]["tags"])
+        self.assertIn("ecr", collector.failed)
+
+
+class GateTests(MotoTestCase):
+    def test_clean_account_passes_both_gates(self):
+        self.seed_instance("retail-forecast-box", [{"Key": "Owner", "Value": "jm"}])
+        self.assertEqual(self.run_main("--fail-on-unowned", "--fail-on-active-non-retail"), 0)
+
+    def test_unowned_resource_exits_2(self):
+        self.seed_instance("mystery-box")
+        self.assertEqual(self.run_main("--fail-on-unowned"), 2)
+        self.assertEqual(self.run_main(), 0)
+
+    def test_active_non_retail_resource_exits_3(self):
+        self.seed_instance("feature-flag-box", [{"Key": "Owner", "Value": "jm"}])
+        self.assertEqual(self.run_main("--fail-on-unowned", "--fail-on-active-non-retail"), 3)
+
+    def test_unowned_gate_is_checked_first(self):
+        self.seed_instance("mystery-box")
+        self.assertEqual(self.run_main("--fail-on-unowned", "--fail-on-active-non-retail"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Tests for scripts/link_check.py against a local http.server stand-in.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import link_check  # noqa: E402
+
+SLOW_SECONDS = 2.0
+HOLD_SECONDS = 0.3
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Endpoints that mimic the awkward servers the checker meets in the wild."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.handle_any()
+
+    def do_GET(self):
+        self.handle_any()
+
+    def handle_any(self):
+        server = self.server
+        with server.lock:
+            server.seen.append((self.command, self.path))
+            hits = server.hits[self.path] = server.hits.get(self.path, 0) + 1
+
+        if self.path == "/ok":
+            self.reply(200)
+        elif self.path.startswith("/hold/"):
+            started = time.monotonic()
+            time.sleep(HOLD_SECONDS)
+            with server.lock:
+                server.intervals.append((started, time.monotonic()))
+            self.reply(200)
+        elif self.path == "/slow":
+            time.sleep(SLOW_SECONDS)
+            self.reply(200)
+        elif self.path == "/head-405":
+            self.reply(405 if self.command == "HEAD" else 200)
+        elif self.path == "/429-once":
+            self.reply(429 if hits == 1 else 200, {"Retry-After": "0"})
+        elif self.path == "/429-always":
+            self.reply(429, {"Retry-After": "0"})
+        elif self.path == "/429-long":
+            self.reply(429, {"Retry-After": "20"})
+        elif self.path == "/redirect":
+            self.reply(301, {"Location": "/hop"})
+        elif self.path == "/hop":
+            self.reply(302, {"Location": "/ok"})
+        else:
+            self.reply(404)
+
+    def reply(self, status, headers=None):
+        body = b"" if self.command == "HEAD" else b"ok"
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class LinkCheckTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = start_server()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        # A second port is a second host as far as the per-host limit is concerned
+        cls.other_server = start_server()
+        cls.other_base = f"http://127.0.0.1:{cls.other_server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in (cls.server, cls.other_server):
+            server.shutdown()
+            server.server_close()
+
+    def setUp(self):
+        for server in (self.server, self.other_server):
+            server.seen = []
+            server.hits = {}
+            server.intervals = []
+
+    def check(self, path, **kwargs):
+        options = {"timeout": 0.5, "backoff": 0.01, **kwargs}
+        checker = link_check.LinkChecker(**options)
+        result = asyncio.run(checker.check_all([self.base + path]))[0]
+        return result, checker
+
+    def test_ok(self):
+        result, checker = self.check("/ok")
+        self.assertEqual(result.code, "200")
+        self.assertEqual(checker.requests_sent, 1)
+
+    def test_timeout_is_not_retried_or_sent_again_as_get(self):
+        started = time.monotonic()
+        result, checker = self.check("/slow")
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(result.code, "000")
+        self.assertIn("TimeoutError", result.error)
+        self.assertEqual(result.attempts, 1)
+        self.assertEqual(checker.requests_sent, 1)
+        self.assertEqual(self.server.seen, [("HEAD", "/slow")])
+        self.assertLess(elapsed, SLOW_SECONDS)
+
+    def test_url_budget_caps_socket_timeout(self):
+        started = time.monotonic()
+        result, _ = self.check("/slow", timeout=10.0, url_budget=0.3)
+        self.assertEqual(result.code, "000")
+        self.assertLess(time.monotonic() - started, SLOW_SECONDS)
+
+    def test_head_405_falls_back_to_get(self):
+        result, _ = self.check("/head-405")
+        self.assertEqual(result.code, "200")
+        self.assertEqual(self.server.seen, [("HEAD", "/head-405"), ("GET", "/head-405")])
+
+    def test_429_is_retried(self):
+        result, _ = self.check("/429-once")
+        self.assertEqual(result.code, "200")
+        self.assertEqual(result.attempts, 2)
+
+    def test_429_gives_up_after_max_retries(self):
+        result, _ = self.check("/429-always", max_retries=2)
+        self.assertEqual(result.code, "429")
+        self.assertEqual(result.attempts, 3)
+        self.assertFalse(result.ok)
+
+    def test_retry_after_beyond_budget_stops_retrying(self):
+        started = time.monotonic()
+        result, _ = self.check("/429-long", url_budget=1.0)
+        self.assertEqual(result.code, "429")
+        self.assertEqual(result.attempts, 1)
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_redirects_are_followed_on_one_connection(self):
+        result, checker = self.check("/redirect")
+        self.assertEqual(result.code, "200")
+        self.assertEqual([path for _, path in self.server.seen], ["/redirect", "/hop", "/ok"])
+        self.assertEqual(checker.pool.opened, 1)
+
+    def test_busy_host_does_not_hold_global_slots(self):
+        # Six URLs on the busy host are queued ahead of two on the quiet one.
+        # Waiting for a host slot must not hold a global slot, so the quiet
+        # host starts while the busy host's first requests are still open.
+        urls = [f"{self.base}/hold/{i}" for i in range(6)] + [f"{self.other_base}/hold/{i}" for i in range(2)]
+        checker = link_check.LinkChecker(global_limit=4, per_host_limit=2, timeout=5.0)
+        results = asyncio.run(checker.check_all(urls))
+
+        self.assertEqual([result.code for result in results], ["200"] * len(urls))
+        busy_first_end = min(end for _, end in self.server.intervals)
+        quiet_first_start = min(start for start, _ in self.other_server.intervals)
+        self.assertLess(quiet_first_start, busy_first_end)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Tests for the PDF link walker and its cache in scripts/pdf_links.py.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "resumes"))
+
+import generate_resumes  # noqa: E402
+import pdf_links  # noqa: E402
+
+RESUME = "Jared_Mahotiere_Backend_Resume.pdf"
+
+
+def pdf_object(number: int, head: bytes, body: bytes | None = None) -> bytes:
+    obj = b"%d 0 obj\n" % number + head
+    if body is not None:
+        obj += b"\nstream\n" + body + b"\nendstream"
+    return obj + b"\nendobj\n"
+
+
+class ExtractLinksTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def write_pdf(self, *objects: bytes) -> Path:
+        path = self.tmp / "test.pdf"
+        path.write_bytes(b"%PDF-1.4\n" + b"".join(objects) + b"%%EOF\n")
+        return path
+
+    def test_committed_resume_matches_its_variant(self):
+        variant = next(v for v in generate_resumes.ALL_VARIANTS if v["filename"] == RESUME)
+        links = pdf_links.extract_links(ROOT / "resumes" / RESUME)
+        self.assertTrue(links)
+        self.assertEqual(sorted(links), sorted(generate_resumes.variant_links(variant)))
+
+    def test_stream_bodies_are_skipped_by_length(self):
+        # The body looks like objects and links; /Length must carry the walker past it
+        body = b"endobj 9 0 obj /URI (https://example.com/in-stream) endobj"
+        path = self.write_pdf(
+            pdf_object(1, b"<< /Length %d >>" % len(body), body),
+            pdf_object(2, b"<< /A << /S /URI /URI (https://example.com/real) >> >>"),
+        )
+        self.assertEqual(pdf_links.extract_links(path), ["https://example.com/real"])
+
+    def test_indirect_length_falls_back_to_endstream(self):
+        path = self.write_pdf(
+            pdf_object(1, b"<< /Length 5 0 R >>", b"binary"),
+            pdf_object(2, b"<< /URI (https://example.com/after) >>"),
+        )
+        self.assertEqual(pdf_links.extract_links(path), ["https://example.com/after"])
+
+    def test_compressed_object_streams_are_inflated(self):
+        packed = zlib.compress(b"<< /A << /S /URI /URI (https://example.com/packed) >> >>")
+        path = self.write_pdf(
+            pdf_object(1, b"<< /Type /ObjStm /N 1 /First 0 /Filter /FlateDecode /Length %d >>" % len(packed),
+                       packed),
+            pdf_object(2, b"<< /URI <68747470733a2f2f6578616d706c652e636f6d2f686578> >>"),
+        )
+        self.assertEqual(pdf_links.extract_links(path),
+                         ["https://example.com/packed", "https://example.com/hex"])
+
+    def test_duplicate_links_are_reported_once(self):
+        path = self.write_pdf(
+            pdf_object(1, b"<< /URI (https://example.com/a) >>"),
+            pdf_object(2, b"<< /URI (https://example.com/a) >>"),
+        )
+        self.assertEqual(pdf_links.extract_links(path), ["https://example.com/a"])
+
+    def test_empty_file_has_no_links(self):
+        path = self.tmp / "empty.pdf"
+        path.write_bytes(b"")
+        self.assertEqual(pdf_links.extract_links(path), [])
+
+
+class DecodePdfStringTests(unittest.TestCase):
+    def test_literal_escapes(self):
+        cases = {
+            rb"(plain)": "plain",
+            rb"(a\(b\)c\\d)": "a(b)c\\d",
+            rb"(tab\tnew\nline)": "tab\tnew\nline",
+            rb"(\101\102C)": "ABC",
+            rb"(\0537)": "+7",  # octal escapes stop after three digits
+            b"(split\\\nline)": "splitline",
+            rb"(unknown\q)": "unknownq",
+        }
+        for token, expected in cases.items():
+            with self.subTest(token=token):
+                self.assertEqual(pdf_links.decode_pdf_string(token), expected)
+
+    def test_hex_strings(self):
+        cases = {
+            b"<414243>": "ABC",
+            b"<41 42\n43>": "ABC",
+            b"<4142434>": "ABC@",  # odd digit count: the last is padded with 0
+            b"<>": "",
+        }
+        for token, expected in cases.items():
+            with self.subTest(token=token):
+                self.assertEqual(pdf_links.decode_pdf_string(token), expected)
+
+
+class CacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.pdf = self.tmp / RESUME
+        shutil.copy2(ROOT / "resumes" / RESUME, self.pdf)
+        self.cache_path = self.tmp / "cache.json"
+
+    def test_unchanged_pdf_is_served_from_cache(self):
+        first = pdf_links.scan([self.pdf], self.cache_path)
+        self.assertEqual(first.parsed, 1)
+        self.assertTrue(self.cache_path.exists())
+
+        second = pdf_links.scan([self.pdf], self.cache_path)
+        self.assertEqual(second.parsed, 0)
+        self.assertEqual(second.links, first.links)
+
+    def test_size_and_mtime_match_skips_hashing(self):
+        pdf_links.scan([self.pdf], self.cache_path)
+        with mock.patch.object(pdf_links, "file_sha256") as sha256:
+            result = pdf_links.scan([self.pdf], self.cache_path)
+        sha256.assert_not_called()
+        self.assertEqual(result.parsed, 0)
+
+    def test_touched_pdf_with_same_content_is_not_reparsed(self):
+        first = pdf_links.scan([self.pdf], self.cache_path)
+        stat = self.pdf.stat()
+        os.utime(self.pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = pdf_links.scan([self.pdf], self.cache_path)
+        self.assertEqual(second.parsed, 0)
+        self.assertEqual(second.links, first.links)
+
+    def test_no_cache_path_always_parses(self):
+        pdf_links.scan([self.pdf], None)
+        self.assertEqual(pdf_links.scan([self.pdf], None).parsed, 1)
+        self.assertFalse(self.cache_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Tests for the verified-date and graduation rules in scripts/rewrite_docs.py.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import argparse
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import rewrite_docs  # noqa: E402
+
+README = """\
+- **Retail Forecast Dashboard**: Live (verified Mar 2, 2026)
+- **Fleet Tracker**: Live (verified Mar 2, 2026)
+"""
+
+INDEX = """\
+        <a href="http://retail.example" class="project-card">
+          <h3>Retail Forecast Dashboard</h3>
+          <p class="stack">Status: Live | Verified: Mar 2, 2026</p>
+        </a>
+        <a href="http://fleet.example" class="project-card">
+          <h3>Fleet Tracker</h3>
+          <p class="stack">Status: Live | Verified: Mar 2, 2026</p>
+        </a>
+"""
+
+
+class VerifiedDateTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "README.md").write_text(README, encoding="utf-8")
+        (self.root / "index.html").write_text(INDEX, encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def apply(self, projects):
+        ctx = rewrite_docs.Context(self.root, verified_date="Oct 17, 2026", verified_projects=projects)
+        fired = rewrite_docs.apply_rules(["verified-date"], ctx)
+        readme = (self.root / "README.md").read_text(encoding="utf-8")
+        index = (self.root / "index.html").read_text(encoding="utf-8")
+        return fired, readme, index
+
+    def test_only_healthy_projects_are_stamped(self):
+        fired, readme, index = self.apply(["Retail Forecast Dashboard"])
+        self.assertEqual(fired, {"README.md": ["verified-date"], "index.html": ["verified-date"]})
+        self.assertIn("**Retail Forecast Dashboard**: Live (verified Oct 17, 2026)", readme)
+        self.assertIn("**Fleet Tracker**: Live (verified Mar 2, 2026)", readme)
+        self.assertEqual(index.count("Verified: Oct 17, 2026"), 1)
+        retail_card, fleet_card = index.split("</a>")[:2]
+        self.assertIn("Verified: Oct 17, 2026", retail_card)
+        self.assertIn("Verified: Mar 2, 2026", fleet_card)
+
+    def test_no_healthy_projects_changes_nothing(self):
+        fired, readme, index = self.apply([])
+        self.assertEqual(fired, {})
+        self.assertEqual((readme, index), (README, INDEX))
+
+    def test_without_a_project_list_every_live_project_is_stamped(self):
+        _, readme, index = self.apply(None)
+        self.assertNotIn("Mar 2, 2026", readme + index)
+
+    def test_project_list_must_be_json_strings(self):
+        self.assertEqual(rewrite_docs.parse_project_list('["A", "B"]'), ["A", "B"])
+        for bad in ("A", '{"A": 1}', "[1]"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                rewrite_docs.parse_project_list(bad)
+
+
+class GraduationTests(unittest.TestCase):
+    TEXT = "Purdue EET, graduating May 2026. Available for full-time roles starting May 2026."
+
+    def rewrite(self, today):
+        ctx = rewrite_docs.Context(Path("."), today=today)
+        return rewrite_docs.graduation_rule("index.html", self.TEXT, ctx)
+
+    def test_no_op_before_graduation(self):
+        self.assertEqual(self.rewrite(date(2026, 5, 9)), self.TEXT)
+
+    def test_applied_from_graduation_day_and_idempotent(self):
+        once = self.rewrite(rewrite_docs.GRADUATION_DATE)
+        self.assertEqual(once, "Purdue EET, graduated May 2026. Available for full-time roles.")
+        ctx = rewrite_docs.Context(Path("."), today=date(2026, 10, 17))
+        self.assertEqual(rewrite_docs.graduation_rule("index.html", once, ctx), once)
+
+
+if __name__ == "__main__":
+    unittest.main()
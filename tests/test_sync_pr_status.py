@@ -0,0 +1,173 @@
+"""
+Tests for scripts/sync_pr_status.py against a local stand-in GraphQL server.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import re
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import sync_pr_status  # noqa: E402
+
+# (owner/repo, number) -> pullRequest node the stand-in returns
+PULL_REQUESTS = {
+    ("acme/widgets", 7): {"state": "MERGED", "merged": True, "additions": 1484, "deletions": 676},
+    ("acme/widgets", 9): {"state": "CLOSED", "merged": False, "additions": 12, "deletions": 3},
+    ("acme/gadgets", 42): {"state": "OPEN", "merged": False, "additions": 5, "deletions": 0},
+}
+
+REPOSITORY_RE = re.compile(r'(?P<alias>r\d+): repository\(owner: "(?P<owner>[^"]+)", name: "(?P<name>[^"]+)"\)')
+PULL_REQUEST_RE = re.compile(r"(?P<alias>pr\d+): pullRequest\(number: (?P<num>\d+)\)")
+
+
+class GraphQLHandler(BaseHTTPRequestHandler):
+    """Answers the aliased repository/pullRequest queries that build_query emits."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["query"]
+        self.server.queries.append((query, self.headers.get("Authorization")))
+
+        data = {}
+        repos = list(REPOSITORY_RE.finditer(query))
+        for i, repo in enumerate(repos):
+            end = repos[i + 1].start() if i + 1 < len(repos) else len(query)
+            name = f"{repo.group('owner')}/{repo.group('name')}"
+            data[repo.group("alias")] = {
+                pr.group("alias"): PULL_REQUESTS.get((name, int(pr.group("num"))))
+                for pr in PULL_REQUEST_RE.finditer(query, repo.end(), end)
+            }
+
+        body = json.dumps({"data": data}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class GraphQLClientTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), GraphQLHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/graphql"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.queries = []
+        self.client = sync_pr_status.GraphQLClient("test-token", url=self.url)
+
+    def test_one_request_per_batch(self):
+        keys = sorted(PULL_REQUESTS)
+        info = sync_pr_status.fetch_pr_info(self.client, keys, batch_size=2)
+
+        self.assertEqual(self.client.requests_sent, 2)
+        self.assertEqual(len(self.server.queries), 2)
+        self.assertEqual(info[("acme/widgets", 7)], sync_pr_status.PrInfo("Merged", 1484, 676))
+        self.assertEqual(info[("acme/widgets", 9)], sync_pr_status.PrInfo("Closed", 12, 3))
+        self.assertEqual(info[("acme/gadgets", 42)], sync_pr_status.PrInfo("Open", 5, 0))
+        self.assertEqual(self.server.queries[0][1], "Bearer test-token")
+
+    def test_aliases_group_prs_by_repository(self):
+        query, aliases = sync_pr_status.build_query(sorted(PULL_REQUESTS))
+        self.assertEqual(len(REPOSITORY_RE.findall(query)), 2)
+        self.assertEqual(aliases["r0"], [("pr42", ("acme/gadgets", 42))])
+        self.assertEqual(aliases["r1"], [("pr7", ("acme/widgets", 7)), ("pr9", ("acme/widgets", 9))])
+
+        sync_pr_status.fetch_pr_info(self.client, sorted(PULL_REQUESTS))
+        self.assertEqual(self.client.requests_sent, 1)
+
+    def test_missing_pr_is_an_error(self):
+        with self.assertRaisesRegex(RuntimeError, "acme/widgets#404"):
+            sync_pr_status.fetch_pr_info(self.client, [("acme/widgets", 404)])
+
+
+INFO = {
+    ("acme/widgets", 7): sync_pr_status.PrInfo("Merged", 1484, 676),
+    ("acme/widgets", 9): sync_pr_status.PrInfo("Closed", 12, 3),
+    ("acme/gadgets", 42): sync_pr_status.PrInfo("Merged", 5, 0),
+}
+
+README = """\
+## Contributions
+
+- **Widgets** - [PR #7](https://github.com/acme/widgets/pull/7) _(Status: Open)_: Faster widgets.
+- **Gadgets** - [PR #42](https://github.com/acme/gadgets/pull/42): Gadget fix.
+
+### Merged
+
+| Repo | PR | Summary |
+|------|----|---------|
+| **acme/widgets** | [#7](https://github.com/acme/widgets/pull/7) | Faster widgets |
+### Open
+
+| Repo | PR | Summary |
+|------|----|---------|
+| **acme/gadgets** | [#42](https://github.com/acme/gadgets/pull/42) | Gadget fix |
+| **acme/widgets** | [#9](https://github.com/acme/widgets/pull/9) | Abandoned idea |
+
+## Next section
+"""
+
+INDEX = """\
+        <a href="https://github.com/acme/widgets/pull/7" class="project-card">
+          <h3>Widgets (PR #7)</h3>
+          <p class="stack">Go | Widgets | +1/-1 | State: Open</p>
+        </a>
+        <a href="https://github.com/acme/gadgets/pull/42" class="project-card">
+          <h3>Gadgets (PR #42)</h3>
+          <p class="stack">C | Gadgets | State: Open</p>
+        </a>
+"""
+
+
+class RewriterTests(unittest.TestCase):
+    def test_readme_bullets_get_live_status(self):
+        text = sync_pr_status.rewrite_readme_bullets(README, INFO)
+        self.assertIn("[PR #7](https://github.com/acme/widgets/pull/7) _(Status: Merged)_: Faster widgets.", text)
+        self.assertIn("[PR #42](https://github.com/acme/gadgets/pull/42) _(Status: Merged)_: Gadget fix.", text)
+
+    def test_readme_bullet_number_mismatch_is_an_error(self):
+        broken = README.replace("[PR #7]", "[PR #8]")
+        with self.assertRaisesRegex(RuntimeError, "mismatch"):
+            sync_pr_status.rewrite_readme_bullets(broken, INFO)
+
+    def test_readme_tables_move_merged_and_drop_closed(self):
+        text = sync_pr_status.rewrite_readme_tables(README, INFO)
+        merged, rest = text.split("### Merged", 1)[1].split("### Open", 1)
+        open_table, tail = rest.split("## Next section", 1)
+        self.assertIn("acme/gadgets/pull/42", merged)
+        self.assertIn("acme/widgets/pull/7", merged)
+        self.assertNotIn("acme/widgets/pull/9", text)
+        self.assertNotIn("pull/", open_table)
+        self.assertEqual(tail, "\n")
+
+    def test_readme_tables_unchanged_when_statuses_match(self):
+        settled = {**INFO, ("acme/gadgets", 42): sync_pr_status.PrInfo("Open", 5, 0),
+                   ("acme/widgets", 9): sync_pr_status.PrInfo("Open", 12, 3)}
+        self.assertIs(sync_pr_status.rewrite_readme_tables(README, settled), README)
+
+    def test_index_updates_state_and_existing_diff_stat(self):
+        text = sync_pr_status.rewrite_index(INDEX, INFO)
+        self.assertIn('<p class="stack">Go | Widgets | +1,484/-676 | State: Merged</p>', text)
+        # Cards without a diff stat keep their layout; only the state changes
+        self.assertIn('<p class="stack">C | Gadgets | State: Merged</p>', text)
+
+
+if __name__ == "__main__":
+    unittest.main()